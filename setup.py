@@ -12,6 +12,12 @@ except ImportError:
 install_requires = ['stuf>=0.8.6']
 if sys.version_info[0] == 2 and sys.version_info[1] < 7:
     install_requires.extend(['ordereddict', 'unittest2'])
+packages = [
+    'twoq', 'twoq.mixins', 'twoq.active', 'twoq.lazy', 'twoq.benchmarks',
+]
+# asyncio queues need async generators
+if sys.version_info[:2] >= (3, 6):
+    packages.append('twoq.aio')
 
 setup(
     name='twoq',
@@ -22,7 +28,7 @@ setup(
     url='https://bitbucket.org/lcrees/twoq/',
     author_email='lcrees@gmail.com',
     license='MIT',
-    packages=['twoq', 'twoq.mixins', 'twoq.active'],
+    packages=packages,
     test_suite='twoq.tests',
     zip_safe=False,
     keywords='queue generator utility iterator',
@@ -1,24 +1,39 @@
 # -*- coding: utf-8 -*-
 '''twoq active contexts'''
 
-__all__ = ('AutoContext', 'SyncContext', 'ManContext')
+__all__ = ('AutoContext', 'SyncContext', 'ManContext', 'SharedContext')
 
 
 class Context(object):
 
     '''base context manager'''
 
-    def __init__(self, queue):
+    __slots__ = ('_queue', 'iterable', '_outextend', '_outappend')
+
+    def __init__(self, queue=None):
         '''
         init
 
-        @param queue: queue
+        @param queue: queue (default: None, set each time the queue syncs)
         '''
         super(Context, self).__init__()
-        self._outextend = queue._outextend
-        self._outappend = queue._outappend
-        self._outclear = queue._outclear
-        self._incoming = queue.incoming
+        self._queue = queue
+        self.iterable = None
+
+    def __enter__(self):
+        queue = self._queue
+        # work on incoming things in place
+        self.iterable = queue.incoming
+        # rebind outgoing queue instead of clearing it
+        outgoing = queue._outqueue()
+        queue._outbind(outgoing)
+        self._outextend = outgoing.extend
+        self._outappend = outgoing.append
+        return self
+
+    def __exit__(self, t, v, e):
+        # release incoming things and queue so the queue can be reused
+        self.iterable = self._queue = None
 
     def __call__(self, args):
         self._outextend(args)
@@ -34,86 +49,63 @@ class ManContext(Context):
 
     '''manual sync context manager'''
 
-    def __init__(self, queue):
-        '''
-        init
+    __slots__ = ()
 
-        @param queue: queue
-        '''
-        super(ManContext, self).__init__(queue)
-        self._sxtend = queue._sxtend
-        self._sappend = queue._sappend
-        self._sclear = queue._sclear
-        self._scratch = queue._scratch
 
-    def __enter__(self):
-        # clear scratch queue
-        self._sclear()
-        # clear outgoing queue
-        self._outclear()
-        # extend scratch queue with incoming things
-        self._sxtend(self._incoming)
-        return self
+class AutoContext(Context):
 
-    def __exit__(self, t, v, e):
-        # clear scratch queue
-        self._sclear()
+    '''auto sync context manager'''
 
-    @property
-    def iterable(self):
-        return self._scratch
+    __slots__ = ()
 
+    def __exit__(self, t, v, e):
+        queue = self._queue
+        super(AutoContext, self).__exit__(t, v, e)
+        # outgoing queue becomes incoming queue without copying things
+        queue._inbind(queue.outgoing)
 
-class AutoContext(ManContext):
 
-    '''auto sync context manager'''
+class SyncContext(AutoContext):
 
-    def __init__(self, queue):
-        '''
-        init
+    '''sync context manager'''
 
-        @param queue: queue
-        '''
-        super(AutoContext, self).__init__(queue)
-        self._inclear = queue._inclear
-        self._inextend = queue._inextend
-        self._outgoing = queue.outgoing
+    __slots__ = ()
 
-    def __exit__(self, t, v, e):
-        # clear scratch queue
-        self._sclear()
-        # clear incoming items
-        self._inclear()
-        # extend incoming items with outgoing items
-        self._inextend(self._outgoing)
 
+class SharedContext(object):
 
-class SyncContext(Context):
+    '''context manager holding a shared queue's lock around another context'''
 
-    '''sync context manager'''
+    __slots__ = ('_queue', '_context')
 
-    def __init__(self, queue):
+    def __init__(self, queue, context):
         '''
         init
 
-        @param queue: queue
+        @param queue: shared queue
+        @param context: context manager run while holding the lock
         '''
-        super(SyncContext, self).__init__(queue)
-        self._inclear = queue._inclear
-        self._inextend = queue._inextend
-        self._outgoing = queue.outgoing
+        super(SharedContext, self).__init__()
+        self._queue = queue
+        self._context = context
 
     def __enter__(self):
-        # clear outgoing queue
-        self._outclear()
-        return self
+        queue = self._queue
+        queue._lock.acquire()
+        try:
+            context = self._context
+            context._queue = queue
+            return context.__enter__()
+        except:
+            queue._lock.release()
+            raise
 
     def __exit__(self, t, v, e):
-        # clear incoming items
-        self._inclear()
-        # extend incoming items with outgoing items
-        self._inextend(self._outgoing)
-
-    @property
-    def iterable(self):
-        return self._incoming
+        queue = self._queue
+        try:
+            self._context.__exit__(t, v, e)
+        finally:
+            # a step can both add and remove things so wake every waiter
+            queue._ready.notify_all()
+            queue._room.notify_all()
+            queue._lock.release()
@@ -5,7 +5,8 @@ from inspect import ismodule
 
 from twoq.support import port
 from twoq.mixins.mapping import (
-    DelayMixin, CopyMixin, MappingMixin, RepeatMixin, MapMixin)
+    DelayMixin, CopyMixin, MappingMixin, RepeatMixin, MapMixin, ParallelMixin,
+    ThrottleMixin)
 
 from twoq.active.mixins import AutoQMixin, ManQMixin, SyncQMixin
 
@@ -114,6 +115,48 @@ class smapq(SyncQMixin, MapMixin):
 
     '''autosynchronized map queue'''
 
+###############################################################################
+## active parallel map queues #################################################
+###############################################################################
+
+
+class aparallelq(AutoQMixin, ParallelMixin):
+
+    '''auto-balanced parallel map queue'''
+
+parallelq = aparallelq
+
+
+class mparallelq(ManQMixin, ParallelMixin):
+
+    '''manually balanced parallel map queue'''
+
+
+class sparallelq(SyncQMixin, ParallelMixin):
+
+    '''autosynchronized parallel map queue'''
+
+###############################################################################
+## active throttled delayed map queues ########################################
+###############################################################################
+
+
+class athrottleq(AutoQMixin, ThrottleMixin):
+
+    '''auto-balanced throttled delayed map queue'''
+
+throttleq = athrottleq
+
+
+class mthrottleq(ManQMixin, ThrottleMixin):
+
+    '''manually balanced throttled delayed map queue'''
+
+
+class sthrottleq(SyncQMixin, ThrottleMixin):
+
+    '''autosynchronized throttled delayed map queue'''
+
 __all__ = sorted(name for name, obj in port.items(locals()) if not any([
     name.startswith('_'), ismodule(obj),
 ]))
@@ -1,22 +1,36 @@
 # -*- coding: utf-8 -*-
 '''active twoq mixins'''
 
+from time import time
+from itertools import islice
 from collections import deque
-from bisect import bisect_right
+from threading import Condition, RLock, local
 
 from stuf.utils import iterexcept
 
+from twoq.support import queue
 from twoq.mixins.queuing import QueueingMixin
 
-from twoq.active.contexts import AutoContext, ManContext, SyncContext
+from twoq.active.contexts import (
+    AutoContext, ManContext, SyncContext, SharedContext)
 
-__all__ = ('AutoQMixin', 'ManQMixin', 'SyncQMixin')
+__all__ = (
+    'AutoQMixin', 'ManQMixin', 'SyncQMixin', 'AutoSlotQMixin',
+    'ManSlotQMixin', 'SyncSlotQMixin', 'SharedQMixin',
+)
 
 
 class baseq(QueueingMixin):
 
     '''base active queue'''
 
+    __slots__ = ()
+
+    # factory for incoming and outgoing queues
+    _storage = deque
+    # factory for outgoing queues or `None` to use `_storage`
+    _outstorage = None
+
     def __init__(self, *args):
         '''
         init
@@ -24,39 +38,51 @@ class baseq(QueueingMixin):
         @param incoming: incoming queue
         @param outgoing: outgoing queue
         '''
-        incoming = deque()
+        incoming = self._storage()
         # extend if just one argument
         if len(args) == 1:
             incoming.append(args[0])
         else:
             incoming.extend(args)
-        super(baseq, self).__init__(incoming, deque())
-        #######################################################################
-        ## incoming things ####################################################
-        #######################################################################
-        # incoming things right append
-        self._inappend = self.incoming.append
-        # incoming things left append
-        self._inappendleft = self.incoming.appendleft
-        # incoming things clear
-        self._inclear = self.incoming.clear
-        # incoming things right extend
-        self._inextend = self.incoming.extend
-        # incoming things left extend
-        self._inextendleft = self.incoming.extendleft
-        #######################################################################
-        ## outgoing things ####################################################
-        #######################################################################
-        # outgoing things right append
-        self._outappend = self.outgoing.append
-        # outgoing things right extend
-        self._outextend = self.outgoing.extend
-        # outgoing things clear
-        self._outclear = self.outgoing.clear
-        # outgoing things right pop
-        self.pop = self.outgoing.pop
-        # outgoing things left pop
-        self.popleft = self.outgoing.popleft
+        super(baseq, self).__init__(incoming, self._outqueue())
+        self._context = self._manager()
+
+    ###########################################################################
+    ## queue binding ##########################################################
+    ###########################################################################
+
+    def _inbind(self, incoming):
+        '''
+        bind incoming queue
+
+        @param incoming: incoming queue
+        '''
+        self.incoming = incoming
+
+    def _outbind(self, outgoing):
+        '''
+        bind outgoing queue
+
+        @param outgoing: outgoing queue
+        '''
+        self.outgoing = outgoing
+
+    @property
+    def _sync(self):
+        # reenter one context per queue instead of building one per step
+        context = self._context
+        context._queue = self
+        return context
+
+    def _outqueue(self):
+        '''new empty queue for outgoing things'''
+        storage = self._outstorage
+        return (self._storage if storage is None else storage)()
+
+    def _unshare(self):
+        '''copy incoming things if they share a queue with outgoing things'''
+        if self.incoming is self.outgoing:
+            self._inbind(self._storage(self.incoming))
 
     ###########################################################################
     ## queue information ######################################################
@@ -85,26 +111,50 @@ class baseq(QueueingMixin):
 
     _obalanced = balanced
 
-    def index(self, thing, _bisect_right=bisect_right):
+    def index(self, thing, _enumerate=enumerate):
         '''
-        insert thing into incoming things
+        index of thing in incoming things
 
         @param thing: some thing
         '''
-        return _bisect_right(self.incoming, thing) - 1
+        incoming = self.incoming
+        try:
+            return incoming.index(thing)
+        except AttributeError:
+            # deques lack index before python 3.5
+            for position, other in _enumerate(incoming):
+                if other == thing:
+                    return position
+            raise ValueError('%r is not in queue' % (thing,))
 
     _oindex = index
 
     def end(self, _l=list, _ln=len):
         '''return outgoing things and clear'''
-        results = self.pop() if _ln(self.outgoing) == 1 else _l(self.outgoing)
+        outgoing = self.outgoing
+        results = outgoing[0] if _ln(outgoing) == 1 else _l(outgoing)
         self.clear()
         return results
 
     _ofinal = end
 
+    def pop(self):
+        '''outgoing things right pop'''
+        self._unshare()
+        return self.outgoing.pop()
+
+    _opop = pop
+
+    def popleft(self):
+        '''outgoing things left pop'''
+        self._unshare()
+        return self.outgoing.popleft()
+
+    _opopleft = popleft
+
     def results(self, _iterexcept=iterexcept):
         '''iterate over reversed outgoing things, clearing as it goes'''
+        self._unshare()
         for thing in _iterexcept(self.outgoing.popleft, IndexError):
             yield thing
 
@@ -112,8 +162,10 @@ class baseq(QueueingMixin):
 
     def value(self, _l=list, _ln=len):
         '''return outgoing things and clear'''
-        results = self.pop() if _ln(self.outgoing) == 1 else _l(self.outgoing)
-        self._outclear()
+        outgoing = self.outgoing
+        results = outgoing[0] if _ln(outgoing) == 1 else _l(outgoing)
+        # rebind instead of clearing so shared incoming things survive
+        self._outbind(self._outqueue())
         return results
 
     _ovalue = value
@@ -121,7 +173,7 @@ class baseq(QueueingMixin):
     def first(self):
         '''first thing among incoming things'''
         with self._sync as sync:
-            sync.append(sync.iterable.popleft())
+            sync.append(sync.iterable[0])
         return self
 
     _ofirst = first
@@ -129,7 +181,7 @@ class baseq(QueueingMixin):
     def last(self):
         '''last thing among incoming things'''
         with self._sync as sync:
-            sync.append(sync.iterable.pop())
+            sync.append(sync.iterable[-1])
         return self
 
     _olast = last
@@ -139,24 +191,19 @@ class baseq(QueueingMixin):
     ###########################################################################
 
     def __delitem__(self, index):
-        incoming = self.incoming
-        incoming.rotate(-index)
-        incoming.popleft()
-        incoming.rotate(index)
+        self._unshare()
+        del self.incoming[index]
 
     _oidelitem = __delitem__
 
-    def remove(self, thing, _bisect_right=bisect_right):
+    def remove(self, thing):
         '''
         remove thing from incoming things
 
         @param thing: some thing
         '''
-        incoming = self.incoming
-        position = _bisect_right(incoming, thing) - 1
-        incoming.rotate(-position)
-        incoming.popleft()
-        incoming.rotate(position)
+        self._unshare()
+        self.incoming.remove(thing)
         return self
 
     _oiremove = remove
@@ -164,22 +211,23 @@ class baseq(QueueingMixin):
     def clear(self):
         '''clear all queues'''
         self._call = None
-        self._outclear()
-        self._inclear()
+        self._batch = self._typecode = None
+        self.outgoing.clear()
+        self.incoming.clear()
         return self
 
     _oclear = clear
 
     def inclear(self):
         '''incoming things clear'''
-        self._inclear()
+        self._inbind(self._storage())
         return self
 
     _oiclear = inclear
 
     def outclear(self):
         '''incoming things clear'''
-        self._inclear()
+        self._inbind(self._storage())
         return self
 
     _ooutclear = outclear
@@ -190,14 +238,16 @@ class baseq(QueueingMixin):
 
     def append(self, thing):
         '''incoming things right append'''
-        self._inappend(thing)
+        self._unshare()
+        self.incoming.append(thing)
         return self
 
     _oappend = append
 
     def appendleft(self, thing):
         '''incoming things left append'''
-        self._inappendleft(thing)
+        self._unshare()
+        self.incoming.appendleft(thing)
         return self
 
     _oappendleft = appendleft
@@ -209,24 +259,31 @@ class baseq(QueueingMixin):
         @param index: index position
         @param thing: some thing
         '''
+        self._unshare()
         incoming = self.incoming
-        incoming.rotate(-index)
-        incoming.appendleft(value)
-        incoming.rotate(index)
+        try:
+            incoming.insert(index, value)
+        except AttributeError:
+            # deques lack insert before python 3.5
+            incoming.rotate(-index)
+            incoming.appendleft(value)
+            incoming.rotate(index)
         return self
 
     _oinsert = insert
 
     def extend(self, things):
         '''incoming things right extend'''
-        self._inextend(things)
+        self._unshare()
+        self.incoming.extend(things)
         return self
 
     _oextend = extend
 
     def extendleft(self, things):
         '''incoming things left extend'''
-        self._inextendleft(things)
+        self._unshare()
+        self.incoming.extendleft(things)
         return self
 
     _oextendleft = extendleft
@@ -238,14 +295,15 @@ class baseq(QueueingMixin):
     def reup(self, _list=list):
         '''put incoming things in incoming things as one incoming thing'''
         with self._sync as _sync:
-            _sync.append(_list(self.incoming))
+            _sync.append(_list(_sync.iterable))
         return self
 
     _oreup = reup
 
     def shift(self):
         '''shift outgoing things to incoming things'''
-        self._inextend(self.outgoing)
+        self._unshare()
+        self.incoming.extend(self.outgoing)
         return self
 
     _oshift = shift
@@ -254,18 +312,17 @@ class baseq(QueueingMixin):
         '''
         shift outgoing things to incoming things, clearing incoming things
         '''
-        # clear incoming items
-        self._inclear()
-        # extend incoming items with outgoing items
-        self._inextend(self.outgoing)
+        # share outgoing queue with incoming things instead of copying it
+        self._inbind(self.outgoing)
         return self
 
     _osync = sync
 
     def outshift(self):
         '''shift incoming things to outgoing things'''
-        # extend incoming items with outgoing items
-        self._outextend(self.incoming)
+        self._unshare()
+        # extend outgoing items with incoming items
+        self.outgoing.extend(self.incoming)
         return self
 
     _outshift = outshift
@@ -274,55 +331,414 @@ class baseq(QueueingMixin):
         '''
         shift incoming things to outgoing things, clearing outgoing things
         '''
-        # clear incoming items
-        self._outclear()
-        # extend incoming items with outgoing items
-        self._outextend(self.incoming)
+        # share incoming queue with outgoing things instead of copying it
+        self._outbind(self.incoming)
         return self
 
     _outsync = outsync
 
 
-class scratchq(baseq):
-
-    def __init__(self, *args):
-        super(scratchq, self).__init__(*args)
-        #######################################################################
-        ## scratch queue ######################################################
-        #######################################################################
-        self._scratch = deque()
-        # outgoing things right append
-        self._sappend = self._scratch.append
-        # outgoing things right extend
-        self._sxtend = self._scratch.extend
-        # scratch clear
-        self._sclear = self._scratch.clear
-        # scratch pop left
-        self._spopleft = self._scratch.popleft
-
-
-class AutoQMixin(scratchq):
+class AutoQMixin(baseq, local):
 
     '''auto balancing manipulation queue mixin'''
 
-    @property
-    def _sync(self):
-        return AutoContext(self)
+    # factory for the context manager each step reenters
+    _manager = AutoContext
 
 
-class ManQMixin(scratchq):
+class ManQMixin(baseq, local):
 
     '''manually balanced manipulation queue mixin'''
 
-    @property
-    def _sync(self):
-        return ManContext(self)
+    # factory for the context manager each step reenters
+    _manager = ManContext
 
 
-class SyncQMixin(baseq):
+class SyncQMixin(baseq, local):
 
     '''synchronized manipulation queue'''
 
+    # factory for the context manager each step reenters
+    _manager = SyncContext
+
+###############################################################################
+## slotted queue mixins #######################################################
+###############################################################################
+
+
+class slotq(baseq):
+
+    '''
+    base queue keeping its state in slots instead of thread-local storage,
+    so not thread-safe either (use sharedq across threads)
+    '''
+
+    __slots__ = (
+        '_call', '_args', '_kw', '_batch', '_typecode', 'incoming',
+        'outgoing', '_context',
+    )
+
+
+class AutoSlotQMixin(slotq):
+
+    '''auto balancing slotted manipulation queue mixin'''
+
+    __slots__ = ()
+
+    # factory for the context manager each step reenters
+    _manager = AutoContext
+
+
+class ManSlotQMixin(slotq):
+
+    '''manually balanced slotted manipulation queue mixin'''
+
+    __slots__ = ()
+
+    # factory for the context manager each step reenters
+    _manager = ManContext
+
+
+class SyncSlotQMixin(slotq):
+
+    '''synchronized slotted manipulation queue mixin'''
+
+    __slots__ = ()
+
+    # factory for the context manager each step reenters
+    _manager = SyncContext
+
+###############################################################################
+## shared queue mixins ########################################################
+###############################################################################
+
+
+class SharedQMixin(AutoSlotQMixin):
+
+    '''
+    auto balancing queue shared between threads as one lock-protected buffer
+    that blocks when taking from it empty or adding to it full
+    '''
+
+    __slots__ = ('_lock', '_ready', '_room', '_capacity', '_shared')
+
+    def __init__(self, *args):
+        '''
+        init
+
+        @param incoming: incoming queue
+        @param outgoing: outgoing queue
+        '''
+        self._lock = RLock()
+        # waits for things to take
+        self._ready = Condition(self._lock)
+        # waits for room to add things
+        self._room = Condition(self._lock)
+        # most things added before adding blocks
+        self._capacity = None
+        super(SharedQMixin, self).__init__(*args)
+        # both sides are one buffer
+        self._inbind(self.incoming)
+        self._shared = SharedContext(self, self._context)
+
+    ###########################################################################
+    ## queue binding ##########################################################
+    ###########################################################################
+
+    def _inbind(self, incoming):
+        '''
+        bind buffer
+
+        @param incoming: incoming queue
+        '''
+        self.incoming = self.outgoing = incoming
+
+    _outbind = _inbind
+
     @property
     def _sync(self):
-        return SyncContext(self)
+        # run each step while holding the lock
+        return self._shared
+
+    def _unshare(self):
+        '''sharing one buffer between both sides is the point'''
+
+    def _hasroom(self):
+        capacity = self._capacity
+        return capacity is None or len(self.incoming) < capacity
+
+    def _hasthings(self):
+        return bool(self.outgoing)
+
+    def _wait(self, condition, ready, block, timeout, error, _time=time):
+        '''
+        wait on condition until ready while holding the lock
+
+        @param condition: condition variable
+        @param ready: callable returning `True` when done waiting
+        @param block: wait instead of failing at once
+        @param timeout: seconds to wait before failing (default: None, wait
+            forever)
+        @param error: exception raised when done waiting before ready
+        '''
+        if ready():
+            return
+        if not block:
+            raise error
+        if timeout is None:
+            while not ready():
+                condition.wait()
+            return
+        deadline = _time() + timeout
+        while not ready():
+            remaining = deadline - _time()
+            if remaining <= 0:
+                raise error
+            condition.wait(remaining)
+
+    def capacity(self, n=None):
+        '''
+        most things held before adding things blocks
+
+        @param n: number of things (default: None, unbounded)
+        '''
+        with self._lock:
+            self._capacity = n
+            self._room.notify_all()
+        return self
+
+    _ocapacity = capacity
+
+    ###########################################################################
+    ## queue information ######################################################
+    ###########################################################################
+
+    def __contains__(self, value):
+        with self._lock:
+            return value in self.incoming
+
+    _oicontains = __contains__
+
+    def index(self, thing):
+        '''
+        index of thing in incoming things
+
+        @param thing: some thing
+        '''
+        with self._lock:
+            return super(SharedQMixin, self).index(thing)
+
+    _oindex = index
+
+    def end(self):
+        '''return outgoing things and clear'''
+        with self._lock:
+            results = super(SharedQMixin, self).end()
+            self._room.notify_all()
+        return results
+
+    _ofinal = end
+
+    def pop(self, block=True, timeout=None, _Empty=queue.Empty):
+        '''
+        outgoing things right pop
+
+        @param block: wait for a thing if there are none (default: True)
+        @param timeout: seconds to wait before raising `Empty` (default:
+            None, wait forever)
+        '''
+        with self._lock:
+            self._wait(self._ready, self._hasthings, block, timeout, _Empty)
+            thing = self.outgoing.pop()
+            self._room.notify()
+        return thing
+
+    _opop = pop
+
+    def popleft(self, block=True, timeout=None, _Empty=queue.Empty):
+        '''
+        outgoing things left pop
+
+        @param block: wait for a thing if there are none (default: True)
+        @param timeout: seconds to wait before raising `Empty` (default:
+            None, wait forever)
+        '''
+        with self._lock:
+            self._wait(self._ready, self._hasthings, block, timeout, _Empty)
+            thing = self.outgoing.popleft()
+            self._room.notify()
+        return thing
+
+    _opopleft = popleft
+
+    def results(self, _Empty=queue.Empty):
+        '''iterate over outgoing things, clearing as it goes'''
+        while True:
+            try:
+                yield self.popleft(False)
+            except _Empty:
+                return
+
+    _oresults = results
+
+    def value(self):
+        '''return outgoing things and clear'''
+        with self._lock:
+            results = super(SharedQMixin, self).value()
+            self._room.notify_all()
+        return results
+
+    _ovalue = value
+
+    ###########################################################################
+    ## clear queues ###########################################################
+    ###########################################################################
+
+    def __delitem__(self, index):
+        with self._lock:
+            del self.incoming[index]
+            self._room.notify()
+
+    _oidelitem = __delitem__
+
+    def remove(self, thing):
+        '''
+        remove thing from incoming things
+
+        @param thing: some thing
+        '''
+        with self._lock:
+            self.incoming.remove(thing)
+            self._room.notify()
+        return self
+
+    _oiremove = remove
+
+    def clear(self):
+        '''clear all queues'''
+        with self._lock:
+            super(SharedQMixin, self).clear()
+            self._room.notify_all()
+        return self
+
+    _oclear = clear
+
+    def inclear(self):
+        '''incoming things clear'''
+        with self._lock:
+            super(SharedQMixin, self).inclear()
+            self._room.notify_all()
+        return self
+
+    _oiclear = inclear
+
+    outclear = _ooutclear = inclear
+
+    ###########################################################################
+    ## manipulate queues ######################################################
+    ###########################################################################
+
+    def append(self, thing, block=True, timeout=None, _Full=queue.Full):
+        '''
+        incoming things right append
+
+        @param thing: some thing
+        @param block: wait for room if the queue is full (default: True)
+        @param timeout: seconds to wait before raising `Full` (default:
+            None, wait forever)
+        '''
+        with self._lock:
+            self._wait(self._room, self._hasroom, block, timeout, _Full)
+            self.incoming.append(thing)
+            self._ready.notify()
+        return self
+
+    _oappend = append
+
+    def appendleft(self, thing, block=True, timeout=None, _Full=queue.Full):
+        '''
+        incoming things left append
+
+        @param thing: some thing
+        @param block: wait for room if the queue is full (default: True)
+        @param timeout: seconds to wait before raising `Full` (default:
+            None, wait forever)
+        '''
+        with self._lock:
+            self._wait(self._room, self._hasroom, block, timeout, _Full)
+            self.incoming.appendleft(thing)
+            self._ready.notify()
+        return self
+
+    _oappendleft = appendleft
+
+    def insert(self, index, value, block=True, timeout=None, _Full=queue.Full):
+        '''
+        insert thing into incoming things
+
+        @param index: index position
+        @param thing: some thing
+        @param block: wait for room if the queue is full (default: True)
+        @param timeout: seconds to wait before raising `Full` (default:
+            None, wait forever)
+        '''
+        with self._lock:
+            self._wait(self._room, self._hasroom, block, timeout, _Full)
+            super(SharedQMixin, self).insert(index, value)
+            self._ready.notify()
+        return self
+
+    _oinsert = insert
+
+    def _fill(self, things, side, block, timeout, _Full=queue.Full):
+        '''
+        add things to one end of incoming things as room frees up
+
+        @param things: some things
+        @param side: `extend` or `extendleft`
+        @param block: wait for room if the queue is full
+        @param timeout: seconds to wait each time the queue is full before
+            raising `Full`
+        '''
+        with self._lock:
+            capacity = self._capacity
+            if capacity is None:
+                getattr(self.incoming, side)(things)
+                self._ready.notify_all()
+                return self
+            things = iter(things)
+            for thing in things:
+                self._wait(self._room, self._hasroom, block, timeout, _Full)
+                incoming = self.incoming
+                extend = getattr(incoming, side)
+                # fill whatever room is left in one go
+                extend([thing])
+                extend(islice(things, max(capacity - len(incoming), 0)))
+                self._ready.notify_all()
+        return self
+
+    def extend(self, things, block=True, timeout=None):
+        '''
+        incoming things right extend
+
+        @param things: some things
+        @param block: wait for room if the queue is full (default: True)
+        @param timeout: seconds to wait each time the queue is full before
+            raising `Full` (default: None, wait forever)
+        '''
+        return self._fill(things, 'extend', block, timeout)
+
+    _oextend = extend
+
+    def extendleft(self, things, block=True, timeout=None):
+        '''
+        incoming things left extend
+
+        @param things: some things
+        @param block: wait for room if the queue is full (default: True)
+        @param timeout: seconds to wait each time the queue is full before
+            raising `Full` (default: None, wait forever)
+        '''
+        return self._fill(things, 'extendleft', block, timeout)
+
+    _oextendleft = extendleft
@@ -6,9 +6,15 @@ from twoq.mixins.reducing import ReduceMixin
 from twoq.mixins.ordering import OrderMixin
 from twoq.mixins.filtering import FilterMixin
 
-from twoq.active.mixins import AutoQMixin, ManQMixin, SyncQMixin
+from twoq.active.storage import BlockList
+from twoq.active.mixins import (
+    AutoQMixin, ManQMixin, SyncQMixin, AutoSlotQMixin, ManSlotQMixin,
+    SyncSlotQMixin, SharedQMixin)
 
-__all__ = ('autoq', 'manq', 'syncq', 'twoq')
+__all__ = (
+    'autoq', 'manq', 'syncq', 'twoq', 'aindexq', 'mindexq', 'sindexq',
+    'indexq', 'aslotq', 'mslotq', 'sslotq', 'slotq', 'sharedq',
+)
 
 
 class autoq(AutoQMixin, FilterMixin, MapMixin, ReduceMixin, OrderMixin):
@@ -27,3 +33,70 @@ class syncq(SyncQMixin, FilterMixin, MapMixin, ReduceMixin, OrderMixin):
 
 
 twoq = autoq
+
+
+class aindexq(autoq):
+
+    '''auto-balancing manipulation queue with block list storage'''
+
+    _storage = BlockList
+
+indexq = aindexq
+
+
+class mindexq(manq):
+
+    '''manually balanced manipulation queue with block list storage'''
+
+    _storage = BlockList
+
+
+class sindexq(syncq):
+
+    '''autosyncing manipulation queue with block list storage'''
+
+    _storage = BlockList
+
+
+class aslotq(
+    AutoSlotQMixin, FilterMixin, MapMixin, ReduceMixin, OrderMixin,
+):
+
+    '''
+    auto-balancing manipulation queue keeping its state in slots, not
+    thread-local and not thread-safe (use sharedq across threads)
+    '''
+
+    __slots__ = ()
+
+slotq = aslotq
+
+
+class mslotq(ManSlotQMixin, FilterMixin, MapMixin, ReduceMixin, OrderMixin):
+
+    '''
+    manually balanced manipulation queue keeping its state in slots, not
+    thread-local and not thread-safe (use sharedq across threads)
+    '''
+
+    __slots__ = ()
+
+
+class sslotq(SyncSlotQMixin, FilterMixin, MapMixin, ReduceMixin, OrderMixin):
+
+    '''
+    autosyncing manipulation queue keeping its state in slots, not
+    thread-local and not thread-safe (use sharedq across threads)
+    '''
+
+    __slots__ = ()
+
+
+class sharedq(SharedQMixin, FilterMixin, MapMixin, ReduceMixin, OrderMixin):
+
+    '''
+    auto-balancing manipulation queue shared between threads as a blocking,
+    optionally bounded buffer
+    '''
+
+    __slots__ = ()
@@ -0,0 +1,703 @@
+# -*- coding: utf-8 -*-
+'''twoq active storage'''
+
+import operator as op
+from array import array
+from collections import Mapping, deque
+from itertools import chain, islice, repeat
+
+from twoq.support import items, xrange, zip, port
+
+__all__ = ('BlockList', 'NumberArray', 'RecordTable')
+# stands in for fields a row lacks
+MISSING = object()
+
+
+class BlockList(object):
+
+    '''
+    deque-like sequence kept as a list of bounded blocks with a Fenwick tree
+    of block lengths so positional lookups, inserts and deletes take
+    O(log n) steps and only move the things in one block
+    '''
+
+    # things per block
+    load = 512
+
+    def __init__(self, iterable=()):
+        '''
+        init
+
+        @param iterable: an iterable (default: ())
+        '''
+        super(BlockList, self).__init__()
+        self._blocks = []
+        self._len = 0
+        # Fenwick tree of block lengths, rebuilt when blocks come or go
+        self._tree = None
+        self.extend(iterable)
+
+    def __contains__(self, thing):
+        return any(thing in things for things in self._blocks)
+
+    def __iter__(self):
+        return chain.from_iterable(self._blocks)
+
+    def __len__(self):
+        return self._len
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, list(self))
+
+    def __reversed__(self):
+        return chain.from_iterable(
+            reversed(things) for things in reversed(self._blocks)
+        )
+
+    ###########################################################################
+    ## positional access ######################################################
+    ###########################################################################
+
+    def _locate(self, index):
+        '''
+        block number and position in that block of thing at `index`
+
+        @param index: index position
+        '''
+        length = self._len
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('BlockList index out of range')
+        tree = self._tree
+        if tree is None:
+            tree = self._build()
+        size = len(tree) - 1
+        # descend the tree for the last block starting at or before index
+        block = 0
+        step = 1 << (size.bit_length() - 1)
+        while step:
+            ahead = block + step
+            if ahead <= size and tree[ahead] <= index:
+                index -= tree[ahead]
+                block = ahead
+            step >>= 1
+        return block, index
+
+    def _build(self):
+        '''build Fenwick tree of block lengths'''
+        tree = [0]
+        tree.extend(len(things) for things in self._blocks)
+        size = len(tree) - 1
+        for i in xrange(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+        return tree
+
+    def _resize(self, block, delta):
+        '''
+        record change in length of one block
+
+        @param block: block number
+        @param delta: change in length
+        '''
+        self._len += delta
+        tree = self._tree
+        if tree is not None:
+            size = len(tree) - 1
+            block += 1
+            while block <= size:
+                tree[block] += delta
+                block += block & -block
+
+    def _delete(self, block, position):
+        '''
+        delete thing at `position` in `block`
+
+        @param block: block number
+        @param position: position in block
+        '''
+        things = self._blocks[block]
+        del things[position]
+        if things:
+            self._resize(block, -1)
+        else:
+            del self._blocks[block]
+            self._len -= 1
+            self._tree = None
+
+    def __getitem__(self, index):
+        block, position = self._locate(index)
+        return self._blocks[block][position]
+
+    def __setitem__(self, index, thing):
+        block, position = self._locate(index)
+        self._blocks[block][position] = thing
+
+    def __delitem__(self, index):
+        self._delete(*self._locate(index))
+
+    def insert(self, index, thing):
+        '''
+        insert thing at `index`
+
+        @param index: index position
+        @param thing: some thing
+        '''
+        if index < 0:
+            index = max(index + self._len, 0)
+        if index >= self._len:
+            self.append(thing)
+            return
+        block, position = self._locate(index)
+        things = self._blocks[block]
+        things.insert(position, thing)
+        # split blocks that grow past twice the load
+        if len(things) > 2 * self.load:
+            half = len(things) // 2
+            self._blocks[block:block + 1] = [things[:half], things[half:]]
+            self._len += 1
+            self._tree = None
+        else:
+            self._resize(block, 1)
+
+    def index(self, thing):
+        '''
+        index of first occurrence of thing
+
+        @param thing: some thing
+        '''
+        position = 0
+        for things in self._blocks:
+            try:
+                return position + things.index(thing)
+            except ValueError:
+                position += len(things)
+        raise ValueError('%r is not in BlockList' % (thing,))
+
+    def count(self, thing):
+        '''
+        number of occurrences of thing
+
+        @param thing: some thing
+        '''
+        return sum(things.count(thing) for things in self._blocks)
+
+    def remove(self, thing):
+        '''
+        remove first occurrence of thing
+
+        @param thing: some thing
+        '''
+        for block, things in enumerate(self._blocks):
+            try:
+                position = things.index(thing)
+            except ValueError:
+                continue
+            self._delete(block, position)
+            return
+        raise ValueError('%r is not in BlockList' % (thing,))
+
+    ###########################################################################
+    ## deque methods ##########################################################
+    ###########################################################################
+
+    def append(self, thing):
+        '''right append'''
+        blocks = self._blocks
+        if blocks and len(blocks[-1]) < self.load:
+            blocks[-1].append(thing)
+            self._resize(len(blocks) - 1, 1)
+        else:
+            blocks.append([thing])
+            self._len += 1
+            self._tree = None
+
+    def appendleft(self, thing):
+        '''left append'''
+        blocks = self._blocks
+        if blocks and len(blocks[0]) < self.load:
+            blocks[0].insert(0, thing)
+            self._resize(0, 1)
+        else:
+            blocks.insert(0, [thing])
+            self._len += 1
+            self._tree = None
+
+    def extend(self, things, _islice=islice):
+        '''right extend'''
+        if things is self:
+            things = list(things)
+        things = iter(things)
+        blocks = self._blocks
+        load = self.load
+        added = 0
+        if blocks:
+            last = blocks[-1]
+            length = len(last)
+            last.extend(_islice(things, max(load - length, 0)))
+            added = len(last) - length
+        for block in iter(lambda: list(_islice(things, load)), []):
+            blocks.append(block)
+            added += len(block)
+        self._len += added
+        self._tree = None
+
+    def extendleft(self, things, _xrange=xrange):
+        '''left extend, reversing things like a deque'''
+        things = list(things)
+        things.reverse()
+        load = self.load
+        self._blocks[0:0] = [
+            things[i:i + load] for i in _xrange(0, len(things), load)
+        ]
+        self._len += len(things)
+        self._tree = None
+
+    def clear(self):
+        '''remove all things'''
+        self._blocks = []
+        self._len = 0
+        self._tree = None
+
+    def pop(self):
+        '''right pop'''
+        blocks = self._blocks
+        if not blocks:
+            raise IndexError('pop from an empty BlockList')
+        things = blocks[-1]
+        thing = things.pop()
+        if things:
+            self._resize(len(blocks) - 1, -1)
+        else:
+            blocks.pop()
+            self._len -= 1
+            self._tree = None
+        return thing
+
+    def popleft(self):
+        '''left pop'''
+        blocks = self._blocks
+        if not blocks:
+            raise IndexError('pop from an empty BlockList')
+        things = blocks[0]
+        thing = things.pop(0)
+        if things:
+            self._resize(0, -1)
+        else:
+            del blocks[0]
+            self._len -= 1
+            self._tree = None
+        return thing
+
+    def reverse(self):
+        '''reverse things in place'''
+        blocks = self._blocks
+        blocks.reverse()
+        for things in blocks:
+            things.reverse()
+        self._tree = None
+
+
+class NumberArray(array):
+
+    '''deque-like contiguous buffer of machine numbers'''
+
+    def __new__(cls, iterable=(), typecode=None, _integers=port.INTEGER):
+        if typecode is None:
+            typecode = getattr(iterable, 'typecode', None)
+        if typecode is None:
+            # keep integers as integers unless floats are mixed in
+            iterable = list(iterable)
+            typecode = 'l' if all(
+                isinstance(thing, _integers) for thing in iterable
+            ) else 'd'
+        return array.__new__(cls, typecode, iterable)
+
+    def __init__(self, iterable=(), typecode=None):
+        '''
+        init
+
+        @param iterable: an iterable (default: ())
+        @param typecode: array typecode (default: None, 'l' if every thing is
+            an integer or else 'd')
+        '''
+        # array fills itself in __new__
+        super(NumberArray, self).__init__()
+
+    def appendleft(self, thing):
+        '''left append'''
+        self.insert(0, thing)
+
+    def extendleft(self, things):
+        '''left extend, reversing things like a deque'''
+        things = array(self.typecode, things)
+        things.reverse()
+        self[0:0] = things
+
+    def clear(self):
+        '''remove all things'''
+        del self[:]
+
+    def popleft(self):
+        '''left pop'''
+        if not self:
+            raise IndexError('pop from an empty NumberArray')
+        return self.pop(0)
+
+
+class RecordTable(object):
+
+    '''
+    deque-like sequence of mapping rows kept as one column of values per field,
+    turning into a plain deque of things once a thing that is not a mapping
+    arrives
+
+    Rows are not kept: reading a row rebuilds it as a new dict so rows read
+    back are equal to but not the same objects as rows added and changing
+    them does not change the table. Columns hold references to the values of
+    rows so a table only costs memory of its own once added rows are freed.
+    '''
+
+    def __init__(self, iterable=()):
+        '''
+        init
+
+        @param iterable: an iterable (default: ())
+        '''
+        super(RecordTable, self).__init__()
+        # columns by field or `None` once things are kept as they are
+        self._columns = {}
+        # number of rows
+        self._length = 0
+        # things once they are not all mappings
+        self._things = None
+        self.extend(iterable)
+
+    def __contains__(self, thing):
+        return any(row == thing for row in self)
+
+    def __iter__(self):
+        if self._things is not None:
+            return iter(self._things)
+        return self._rows(zip)
+
+    def __len__(self):
+        if self._things is not None:
+            return len(self._things)
+        return self._length
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, list(self))
+
+    def __reversed__(self):
+        if self._things is not None:
+            return reversed(self._things)
+        return self._rows(lambda *columns: zip(*map(reversed, columns)))
+
+    ###########################################################################
+    ## rows and columns #######################################################
+    ###########################################################################
+
+    @property
+    def columnar(self):
+        '''if rows are kept as columns'''
+        return self._columns is not None
+
+    def _rows(self, zipper, _missing=MISSING):
+        '''
+        rows rebuilt as dicts from columns
+
+        @param zipper: callable zipping columns into tuples of row values
+        '''
+        fields = list(self._columns)
+        if not fields:
+            return iter([{}] * self._length)
+        columns = [self._columns[f] for f in fields]
+        if not any(_missing in column for column in columns):
+            # every row has every field
+            return (dict(zip(fields, values)) for values in zipper(*columns))
+        return (
+            dict((f, v) for f, v in zip(fields, values) if v is not _missing)
+            for values in zipper(*columns)
+        )
+
+    def _row(self, index, _missing=MISSING):
+        '''
+        row at index rebuilt as a dict from columns
+
+        @param index: index position
+        '''
+        values = [(f, c[index]) for f, c in items(self._columns)]
+        return dict((f, v) for f, v in values if v is not _missing)
+
+    def _degrade(self, thing, _Mapping=Mapping):
+        '''
+        keep things as they are once a thing is not a mapping
+
+        @param thing: some thing
+        '''
+        if self._things is None and not isinstance(thing, _Mapping):
+            self._things = deque(self)
+            self._columns = None
+        return self._things
+
+    def _widen(self, fields, _repeat=repeat):
+        '''
+        add an empty column for each field without one
+
+        @param fields: iterable of field names
+        '''
+        columns, length = self._columns, self._length
+        for field in fields:
+            if field not in columns:
+                columns[field] = deque(_repeat(MISSING, length))
+        return columns
+
+    def _pop(self, side):
+        '''
+        pop row from one end of columns
+
+        @param side: `pop` or `popleft`
+        '''
+        if self._things is not None:
+            return getattr(self._things, side)()
+        if not self._length:
+            raise IndexError('pop from an empty RecordTable')
+        values = [(f, getattr(c, side)()) for f, c in items(self._columns)]
+        self._length -= 1
+        return dict((f, v) for f, v in values if v is not MISSING)
+
+    def keys(self, names, _missing=MISSING):
+        '''
+        value of field, or tuple of values of fields, for each row
+
+        @param names: sequence of field names
+        '''
+        if not self._length:
+            return []
+        columns = [self._columns[name] for name in names]
+        for name, column in zip(names, columns):
+            if _missing in column:
+                raise KeyError(name)
+        return list(columns[0]) if len(columns) == 1 else list(zip(*columns))
+
+    def select(self, names, _missing=MISSING):
+        '''
+        value of field, or tuple of values of fields, for each row that has
+        every field
+
+        @param names: sequence of field names
+        '''
+        columns = self._columns
+        if not all(name in columns for name in names):
+            return []
+        columns = [columns[name] for name in names]
+        if not any(_missing in column for column in columns):
+            if len(columns) == 1:
+                return list(columns[0])
+            return list(zip(*columns))
+        if len(columns) == 1:
+            return [v for v in columns[0] if v is not _missing]
+        return [
+            values for values in zip(*columns)
+            if not any(v is _missing for v in values)
+        ]
+
+    def take(self, indices, _map=map, _list=list):
+        '''
+        table of rows at indices
+
+        @param indices: sequence of index positions
+        '''
+        table = type(self)()
+        table._columns = dict(
+            (f, deque(_map(_list(c).__getitem__, indices)))
+            for f, c in items(self._columns)
+        )
+        table._length = len(indices)
+        return table
+
+    ###########################################################################
+    ## positional access ######################################################
+    ###########################################################################
+
+    def _index(self, index):
+        '''
+        non-negative index position
+
+        @param index: index position
+        '''
+        length = self._length
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('RecordTable index out of range')
+        return index
+
+    def __getitem__(self, index):
+        if self._things is not None:
+            return self._things[index]
+        return self._row(self._index(index))
+
+    def __delitem__(self, index):
+        if self._things is not None:
+            del self._things[index]
+            return
+        index = self._index(index)
+        for column in self._columns.values():
+            del column[index]
+        self._length -= 1
+
+    def insert(self, index, thing):
+        '''
+        insert thing at `index`
+
+        @param index: index position
+        @param thing: some thing
+        '''
+        self.rotate(-index)
+        self.appendleft(thing)
+        self.rotate(index)
+
+    def index(self, thing):
+        '''
+        index of first occurrence of thing
+
+        @param thing: some thing
+        '''
+        for position, row in enumerate(self):
+            if row == thing:
+                return position
+        raise ValueError('%r is not in RecordTable' % (thing,))
+
+    def count(self, thing):
+        '''
+        number of occurrences of thing
+
+        @param thing: some thing
+        '''
+        return sum(1 for row in self if row == thing)
+
+    def remove(self, thing):
+        '''
+        remove first occurrence of thing
+
+        @param thing: some thing
+        '''
+        del self[self.index(thing)]
+
+    ###########################################################################
+    ## deque methods ##########################################################
+    ###########################################################################
+
+    def append(self, thing, _missing=MISSING):
+        '''right append'''
+        things = self._degrade(thing)
+        if things is not None:
+            things.append(thing)
+            return
+        for field, column in items(self._widen(thing)):
+            column.append(thing.get(field, _missing))
+        self._length += 1
+
+    def appendleft(self, thing, _missing=MISSING):
+        '''left append'''
+        things = self._degrade(thing)
+        if things is not None:
+            things.appendleft(thing)
+            return
+        for field, column in items(self._widen(thing)):
+            column.appendleft(thing.get(field, _missing))
+        self._length += 1
+
+    def extend(self, things, _Mapping=Mapping):
+        '''right extend'''
+        if things is self:
+            things = list(things)
+        if (
+            isinstance(things, RecordTable) and things.columnar and
+            self.columnar
+        ):
+            # join columns instead of rebuilding rows
+            columns, length = self._columns, self._length
+            for field, column in items(things._columns):
+                if field not in columns:
+                    columns[field] = deque(repeat(MISSING, length))
+                columns[field].extend(column)
+            for field, column in items(columns):
+                if field not in things._columns:
+                    column.extend(repeat(MISSING, things._length))
+            self._length += things._length
+            return
+        if self._things is None:
+            things = things if isinstance(things, list) else list(things)
+            if all(issubclass(t, _Mapping) for t in set(map(type, things))):
+                # fill each column in one pass over rows
+                self._fill(things)
+                return
+        append = self.append
+        for thing in things:
+            append(thing)
+
+    def _fill(self, rows, _missing=MISSING, _getter=op.itemgetter):
+        '''
+        right extend columns with mapping rows
+
+        @param rows: list of mappings
+        '''
+        if not rows:
+            return
+        fields = set().union(*rows)
+        # fields of the first row in their order, then any others sorted
+        self._widen([f for f in rows[0] if f in fields] + sorted(
+            fields.difference(rows[0]), key=repr,
+        ))
+        for field, column in items(self._columns):
+            try:
+                column.extend(list(map(_getter(field), rows)))
+            except KeyError:
+                column.extend([row.get(field, _missing) for row in rows])
+        self._length += len(rows)
+
+    def extendleft(self, things):
+        '''left extend, reversing things like a deque'''
+        appendleft = self.appendleft
+        for thing in list(things):
+            appendleft(thing)
+
+    def clear(self):
+        '''remove all things'''
+        self._columns = {}
+        self._length = 0
+        self._things = None
+
+    def pop(self):
+        '''right pop'''
+        return self._pop('pop')
+
+    def popleft(self):
+        '''left pop'''
+        return self._pop('popleft')
+
+    def reverse(self):
+        '''reverse things in place'''
+        if self._things is not None:
+            self._things.reverse()
+            return
+        for column in self._columns.values():
+            column.reverse()
+
+    def rotate(self, n=1):
+        '''
+        rotate things `n` steps to the right
+
+        @param n: number of steps (default: 1)
+        '''
+        if self._things is not None:
+            self._things.rotate(n)
+            return
+        for column in self._columns.values():
+            column.rotate(n)
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+'''asyncio twoq mixins'''
+
+import asyncio
+from inspect import isawaitable
+from threading import local
+from functools import partial
+from collections import deque
+from itertools import chain, compress
+from operator import methodcaller as mc
+
+from twoq.mixins.mapping import batched
+from twoq.mixins.queuing import QueueingMixin
+
+__all__ = ('AsyncMixin', 'AutoQMixin', 'ManQMixin')
+chain_iter = chain.from_iterable
+
+###############################################################################
+## asyncio subroutines ########################################################
+###############################################################################
+
+
+async def resolve(thing):
+    '''
+    await thing if it is awaitable
+
+    @param thing: some thing
+    '''
+    return (await thing) if isawaitable(thing) else thing
+
+
+async def bounded(call, iterable, limit):
+    '''
+    invoke call on each thing in iterable with at most `limit` calls running
+    at once, keeping incoming order
+
+    @param call: a callable returning a result or an awaitable
+    @param iterable: an iterable
+    @param limit: number of concurrent calls
+    '''
+    things = list(iterable)
+    results = [None] * len(things)
+    # every worker pulls from the same iterator so only `limit` run at once
+    pending = iter(enumerate(things))
+
+    async def worker():
+        for index, thing in pending:
+            results[index] = await resolve(call(thing))
+
+    await asyncio.gather(*[worker() for _ in range(min(limit, len(things)))])
+    return results
+
+
+async def delay(wait, call, *args, **kw):
+    '''
+    invoke call after a delay
+
+    @param wait: time in seconds to delay
+    @param call: a callable returning a result or an awaitable
+    '''
+    await asyncio.sleep(wait)
+    return await resolve(call(*args, **kw))
+
+
+async def invoke(thing, caller=None):
+    '''
+    invoke method on object but return object instead of call result if the
+    call returns None
+
+    @param thing: some thing
+    @param caller: a callable (default: None)
+    '''
+    results = await resolve(caller(thing))
+    return thing if results is None else results
+
+
+async def delay_invoke(thing, wait=0, caller=None):
+    '''
+    invoke method on object after a delay but return object instead of call
+    result if the call returns None
+
+    @param thing: some thing
+    @param wait: time in seconds to delay (default: 0)
+    @param caller: a callable (default: None)
+    '''
+    await asyncio.sleep(wait)
+    return await invoke(thing, caller)
+
+###############################################################################
+## asyncio queue mixins #######################################################
+###############################################################################
+
+
+class baseq(QueueingMixin, local):
+
+    '''base asyncio queue'''
+
+    def __init__(self, *args):
+        '''
+        init
+
+        @param incoming: incoming queue
+        @param outgoing: outgoing queue
+        '''
+        incoming = deque()
+        # extend if just one argument
+        if len(args) == 1:
+            incoming.append(args[0])
+        else:
+            incoming.extend(args)
+        super(baseq, self).__init__(incoming, deque())
+        # pending steps
+        self._steps = []
+        # number of concurrent calls per step
+        self._limit = 100
+
+    ###########################################################################
+    ## queue information ######################################################
+    ###########################################################################
+
+    def __contains__(self, value):
+        return value in self.incoming
+
+    def __len__(self):
+        return len(self.incoming)
+
+    count = __len__
+
+    def outcount(self):
+        '''count of outgoing items'''
+        return len(self.outgoing)
+
+    @property
+    def balanced(self):
+        '''if queues are balanced'''
+        return len(self.outgoing) == len(self.incoming)
+
+    async def run(self):
+        '''run pending steps'''
+        steps, self._steps = self._steps, []
+        for step in steps:
+            self._balance(await step(list(self.incoming)))
+        return self
+
+    async def results(self):
+        '''iterate over outgoing things, clearing as it goes'''
+        await self.run()
+        outgoing = self.outgoing
+        while outgoing:
+            yield outgoing.popleft()
+
+    async def value(self):
+        '''return outgoing things and clear'''
+        await self.run()
+        outgoing = self.outgoing
+        results = outgoing[0] if len(outgoing) == 1 else list(outgoing)
+        self.outgoing = deque()
+        return results
+
+    ###########################################################################
+    ## queue management #######################################################
+    ###########################################################################
+
+    def limit(self, n):
+        '''
+        number of calls run at once by each step
+
+        @param n: number of calls
+        '''
+        self._limit = n
+        return self
+
+    def _step(self, step, *args, **kw):
+        '''
+        add step
+
+        @param step: coroutine function taking incoming things and returning
+            outgoing things
+        '''
+        self._steps.append(partial(step, *args, **kw))
+        return self
+
+    ###########################################################################
+    ## clear queues ###########################################################
+    ###########################################################################
+
+    def clear(self):
+        '''clear all queues and pending steps'''
+        self._call = None
+        self._batch = self._typecode = None
+        self._steps = []
+        self.outgoing.clear()
+        self.incoming.clear()
+        return self
+
+    def inclear(self):
+        '''incoming things clear'''
+        self.incoming.clear()
+        return self
+
+    def outclear(self):
+        '''outgoing things clear'''
+        self.outgoing.clear()
+        return self
+
+    ###########################################################################
+    ## manipulate queues ######################################################
+    ###########################################################################
+
+    def append(self, thing):
+        '''incoming things right append'''
+        self.incoming.append(thing)
+        return self
+
+    def appendleft(self, thing):
+        '''incoming things left append'''
+        self.incoming.appendleft(thing)
+        return self
+
+    def extend(self, things):
+        '''incoming things right extend'''
+        self.incoming.extend(things)
+        return self
+
+    def extendleft(self, things):
+        '''incoming things left extend'''
+        self.incoming.extendleft(things)
+        return self
+
+
+class AutoQMixin(baseq):
+
+    '''auto balancing asyncio queue mixin'''
+
+    def _balance(self, things):
+        # outgoing things become the next step's incoming things
+        self.outgoing = deque(things)
+        self.incoming = deque(things)
+
+
+class ManQMixin(baseq):
+
+    '''manually balanced asyncio queue mixin'''
+
+    def _balance(self, things):
+        self.outgoing = deque(things)
+
+    def sync(self):
+        '''
+        shift outgoing things to incoming things, clearing incoming things,
+        after pending steps
+        '''
+        return self._step(self._resync)
+
+    async def _resync(self, things):
+        self.incoming = deque(self.outgoing)
+        return list(self.outgoing)
+
+
+class AsyncMixin(object):
+
+    '''asyncio mapping and filtering mixin'''
+
+    async def _each(self, things, call, limit):
+        return await bounded(lambda x: call(*x[0], **x[1]), things, limit)
+
+    def each(self):
+        '''invoke call with passed arguments, keywords in incoming things'''
+        return self._step(self._each, call=self._call, limit=self._limit)
+
+    async def _filter(
+        self, things, call, limit, truth=True, size=None, typecode=None,
+    ):
+        if size:
+            # one call per batch returning one truth per thing in it
+            chunks = list(batched(things, size, typecode))
+            truths = chain_iter(await bounded(call, chunks, limit))
+            things = chain_iter(chunks)
+        else:
+            truths = await bounded(call, things, limit)
+        return list(compress(things, (bool(t) is truth for t in truths)))
+
+    def filter(self):
+        '''incoming things for which call is `True`'''
+        return self._step(
+            self._filter, call=self._call, limit=self._limit,
+            size=self._batch, typecode=self._typecode,
+        )
+
+    def reject(self):
+        '''incoming things for which call is `False`'''
+        return self._step(
+            self._filter, call=self._call, limit=self._limit, truth=False,
+            size=self._batch, typecode=self._typecode,
+        )
+
+    async def _map(self, things, call, limit, size=None, typecode=None):
+        if size:
+            # one call per batch returning one result per thing in it
+            return list(chain_iter(await bounded(
+                call, batched(things, size, typecode), limit,
+            )))
+        return await bounded(call, things, limit)
+
+    def invoke(self, name, _mc=mc, _invoke=invoke):
+        '''
+        invoke call on each incoming thing with passed arguments, keywords
+        but return incoming thing instead if call returns None
+
+        @param name: name of method
+        '''
+        _caller = _mc(name, *self._args, **self._kw)
+        return self._step(
+            self._map,
+            call=partial(_invoke, caller=_caller),
+            limit=self._limit,
+        )
+
+    def map(self):
+        '''invoke call on each incoming thing or each batch of them'''
+        return self._step(
+            self._map, call=self._call, limit=self._limit, size=self._batch,
+            typecode=self._typecode,
+        )
+
+    ###########################################################################
+    ## delayed steps ##########################################################
+    ###########################################################################
+
+    def delay_each(self, wait, _delay=delay):
+        '''
+        invoke call with passed arguments, keywords in incoming things after a
+        delay
+
+        @param wait: time in seconds
+        '''
+        call = self._call
+        return self._step(
+            self._map,
+            call=lambda x: _delay(wait, call, *x[0], **x[1]),
+            limit=self._limit,
+        )
+
+    def delay_invoke(self, name, wait, _mc=mc, _delay_invoke=delay_invoke):
+        '''
+        invoke call on each incoming thing with passed arguments, keywords
+        after a delay but return incoming thing instead if call returns None
+
+        @param name: name of method
+        @param wait: time in seconds
+        '''
+        _caller = _mc(name, *self._args, **self._kw)
+        return self._step(
+            self._map,
+            call=partial(_delay_invoke, wait=wait, caller=_caller),
+            limit=self._limit,
+        )
+
+    def delay_map(self, wait, _delay=delay):
+        '''
+        invoke call on each incoming thing after a delay
+
+        @param wait: time in seconds
+        '''
+        return self._step(
+            self._map,
+            call=partial(_delay, wait, self._call),
+            limit=self._limit,
+        )
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+'''twoq asyncio queues'''
+
+from twoq.aio.mixins import AsyncMixin, AutoQMixin, ManQMixin
+
+__all__ = ('autoq', 'manq', 'twoq')
+
+
+class autoq(AutoQMixin, AsyncMixin):
+
+    '''auto-balancing asyncio queue'''
+
+
+class manq(ManQMixin, AsyncMixin):
+
+    '''manually balanced asyncio queue'''
+
+
+twoq = autoq
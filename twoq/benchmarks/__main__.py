@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+'''run twoq benchmarks'''
+
+import sys
+
+from twoq.benchmarks.runner import main
+
+sys.exit(main())
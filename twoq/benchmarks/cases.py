@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+'''twoq benchmark cases'''
+
+import random as rm
+import operator as op
+
+from twoq import records
+from twoq.support import port, xrange
+from twoq.lazy import queuing as lazy
+from twoq.active import queuing as active
+
+__all__ = ('CASES', 'QUEUES')
+
+###############################################################################
+## benchmark queues ###########################################################
+###############################################################################
+
+QUEUES = (
+    ('active.autoq', active.autoq),
+    ('active.manq', active.manq),
+    ('active.syncq', active.syncq),
+    ('active.indexq', active.indexq),
+    ('active.slotq', active.slotq),
+    ('lazy.autoq', lazy.autoq),
+    ('lazy.manq', lazy.manq),
+    ('lazy.planq', lazy.planq),
+    ('records.recordq', records.recordq),
+)
+
+###############################################################################
+## benchmark things ###########################################################
+###############################################################################
+
+
+class thing(object):
+
+    '''benchmark object with a couple of attributes'''
+
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+
+def numbers(n):
+    '''
+    `n` shuffled integers
+
+    @param n: number of things
+    '''
+    things = list(xrange(n))
+    rm.Random(n).shuffle(things)
+    return things
+
+
+def floats(n):
+    '''
+    `n` shuffled floats
+
+    @param n: number of things
+    '''
+    return [i / 3.0 for i in numbers(n)]
+
+
+def pairs(n):
+    '''
+    `n` pairs of integers
+
+    @param n: number of things
+    '''
+    return [(i, i + 1) for i in xrange(n)]
+
+
+def calls(n):
+    '''
+    `n` positional argument, keyword argument pairs
+
+    @param n: number of things
+    '''
+    return [((i, i + 1), {'a': 2}) for i in xrange(n)]
+
+
+def mappings(n):
+    '''
+    `n` small dictionaries
+
+    @param n: number of things
+    '''
+    return [{'name': port.u(str(i)), 'age': i} for i in xrange(n)]
+
+
+def objects(n):
+    '''
+    `n` small objects
+
+    @param n: number of things
+    '''
+    return [thing(port.u(str(i)), i) for i in xrange(n)]
+
+
+def nested(n):
+    '''
+    `n` nested lists
+
+    @param n: number of things
+    '''
+    return [[i, [i + 1, [i + 2]]] for i in xrange(n)]
+
+
+def sequences(n):
+    '''
+    `n` short lists
+
+    @param n: number of things
+    '''
+    return [[i + 2, i, i + 1] for i in xrange(n)]
+
+
+def columns(n, _columns=4):
+    '''
+    a few sorted lists holding `n` integers between them
+
+    @param n: number of things
+    '''
+    size = max(n // _columns, 1)
+    return [list(xrange(i, i + size)) for i in xrange(_columns)]
+
+
+def _double(x):
+    return x * 2
+
+
+def _even(x):
+    return x % 2 == 0
+
+
+def _doubles(x):
+    return [i * 2 for i in x]
+
+
+def _each(*args, **kw):
+    return args[0] * kw['a']
+
+
+def _pair(x, y):
+    return x * y
+
+
+def _items(*args):
+    return args
+
+
+def _public(x):
+    return not x[0].startswith('_')
+
+###############################################################################
+## benchmark cases ############################################################
+###############################################################################
+
+# (method name, thing factory, chain)
+CASES = (
+    # queuing
+    ('first', numbers, lambda q: q.first()),
+    ('last', numbers, lambda q: q.last()),
+    ('reup', numbers, lambda q: q.reup()),
+    # filtering
+    ('compact', numbers, lambda q: q.compact()),
+    ('filter', numbers, lambda q: q.tap(_even).filter()),
+    ('find', numbers, lambda q: q.tap(_even).find()),
+    ('partition', numbers, lambda q: q.tap(_even).partition()),
+    ('reject', numbers, lambda q: q.tap(_even).reject()),
+    ('without', numbers, lambda q: q.without(1, 2, 3)),
+    # collecting
+    ('deepmembers', objects, lambda q: q.tap(_public).deepmembers()),
+    ('members', objects, lambda q: q.tap(_public).members()),
+    ('pick', objects, lambda q: q.pick('name', 'age')),
+    ('pluck', mappings, lambda q: q.pluck('name', 'age')),
+    ('pluck_one', mappings, lambda q: q.pluck('age')),
+    # sets
+    ('difference', columns, lambda q: q.difference()),
+    ('intersection', columns, lambda q: q.intersection()),
+    ('union', columns, lambda q: q.union()),
+    ('unique', numbers, lambda q: q.unique()),
+    # slicing
+    ('initial', numbers, lambda q: q.initial()),
+    ('nth', numbers, lambda q: q.nth(3)),
+    ('rest', numbers, lambda q: q.rest()),
+    ('snatch', numbers, lambda q: q.snatch(3)),
+    ('take', numbers, lambda q: q.take(3)),
+    # delaying
+    ('delay_each', calls, lambda q: q.tap(_each).delay_each(0)),
+    ('delay_invoke', sequences, lambda q: q.delay_invoke('sort', 0)),
+    ('delay_map', numbers, lambda q: q.tap(_double).delay_map(0)),
+    # copying
+    ('copy', sequences, lambda q: q.copy()),
+    ('deepcopy', nested, lambda q: q.deepcopy()),
+    # mapping
+    ('each', calls, lambda q: q.tap(_each).each()),
+    ('invoke', sequences, lambda q: q.invoke('sort')),
+    ('items', mappings, lambda q: q.tap(_items).items()),
+    ('map', numbers, lambda q: q.tap(_double).map()),
+    ('map_batch', numbers, lambda q: q.tap(_doubles).batch(256).map()),
+    ('starmap', pairs, lambda q: q.tap(_pair).starmap()),
+    # repeating
+    ('range', numbers, lambda q: q.range(len(q))),
+    ('repeat', numbers, lambda q: q.repeat(3)),
+    ('times', pairs, lambda q: q.tap(_items).times(3)),
+    # ordering
+    ('group', numbers, lambda q: q.tap(_even).group()),
+    ('grouper', numbers, lambda q: q.grouper(3)),
+    ('nlargest', numbers, lambda q: q.nlargest(10)),
+    ('nsmallest', numbers, lambda q: q.nsmallest(10)),
+    ('reverse', numbers, lambda q: q.reverse()),
+    ('sort', numbers, lambda q: q.sort()),
+    # randomizing
+    ('choice', numbers, lambda q: q.choice()),
+    ('sample', numbers, lambda q: q.sample(1)),
+    ('shuffle', numbers, lambda q: q.shuffle()),
+    # math
+    ('average', numbers, lambda q: q.average()),
+    ('frequency', numbers, lambda q: q.frequency()),
+    ('fsum', floats, lambda q: q.fsum()),
+    ('max', numbers, lambda q: q.max()),
+    ('median', numbers, lambda q: q.median()),
+    ('min', numbers, lambda q: q.min()),
+    ('minmax', numbers, lambda q: q.minmax()),
+    ('mode', numbers, lambda q: q.mode()),
+    ('statrange', numbers, lambda q: q.statrange()),
+    ('sum', numbers, lambda q: q.sum()),
+    ('uncommon', numbers, lambda q: q.uncommon()),
+    # reducing
+    ('merge', columns, lambda q: q.merge()),
+    ('pairwise', numbers, lambda q: q.pairwise()),
+    ('reduce', numbers, lambda q: q.tap(op.add).reduce()),
+    ('reduce_right', columns, lambda q: q.tap(op.add).reduce_right()),
+    ('roundrobin', columns, lambda q: q.roundrobin()),
+    ('smash', nested, lambda q: q.smash()),
+    ('zip', columns, lambda q: q.zip()),
+    # truth
+    ('all', numbers, lambda q: q.tap(bool).all()),
+    ('any', numbers, lambda q: q.tap(bool).any()),
+    ('contains', numbers, lambda q: q.contains(-1)),
+    ('quantify', numbers, lambda q: q.tap(bool).quantify()),
+)
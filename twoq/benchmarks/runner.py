@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+'''twoq benchmark runner'''
+
+import gc
+import sys
+import json
+from timeit import default_timer
+from optparse import OptionParser
+import multiprocessing
+
+from twoq.support import port
+from twoq.benchmarks.cases import CASES, QUEUES
+
+try:
+    import resource
+except ImportError:
+    resource = None
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+try:
+    # chains are lambdas, so they only reach a child process by forking
+    forking = multiprocessing.get_context('fork')
+except AttributeError:
+    # python 2 always forks where resource is importable
+    forking = multiprocessing
+except ValueError:
+    forking = None
+
+__all__ = ('compare', 'load', 'main', 'measure', 'run', 'save')
+
+SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+
+###############################################################################
+## measuring ##################################################################
+###############################################################################
+
+
+def _maxrss():
+    '''peak resident set size of this process in kilobytes'''
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # darwin reports bytes, everything else kilobytes
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+def _grow(qclass, chain, things, writer):
+    queue = qclass().extend(things)
+    start = _maxrss()
+    chain(queue).value()
+    writer.send(_maxrss() - start)
+    writer.close()
+
+
+def peak_rss(qclass, chain, things):
+    '''
+    kilobytes peak resident set size grows by while running `chain` once in
+    a forked process, so earlier cases do not mask it (or `None` where
+    processes cannot be forked)
+
+    @param qclass: queue class
+    @param chain: callable that applies a chain to a queue
+    @param things: incoming things
+    '''
+    if resource is None or forking is None:
+        return None
+    reader, writer = forking.Pipe(False)
+    process = forking.Process(
+        target=_grow, args=(qclass, chain, things, writer),
+    )
+    process.start()
+    writer.close()
+    try:
+        return reader.recv()
+    except EOFError:
+        return None
+    finally:
+        reader.close()
+        process.join()
+
+
+def peak_bytes(qclass, chain, things):
+    '''
+    peak bytes traced by tracemalloc while running `chain` once (or `None`)
+
+    @param qclass: queue class
+    @param chain: callable that applies a chain to a queue
+    @param things: incoming things
+    '''
+    if tracemalloc is None:
+        return None
+    queue = qclass().extend(things)
+    tracemalloc.start()
+    try:
+        chain(queue).value()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def timed(qclass, chain, things, _timer=default_timer):
+    '''
+    seconds spent running `chain` once, including gathering outgoing things
+
+    @param qclass: queue class
+    @param chain: callable that applies a chain to a queue
+    @param things: incoming things
+    '''
+    queue = qclass().extend(things)
+    start = _timer()
+    chain(queue).value()
+    return _timer() - start
+
+
+def measure(qclass, chain, things, repeat=3, alloc=True):
+    '''
+    measure one chain on one queue
+
+    @param qclass: queue class
+    @param chain: callable that applies a chain to a queue
+    @param things: incoming things
+    @param repeat: number of timed runs, the best is kept (default: 3)
+    @param alloc: measure memory in extra runs (default: True)
+    '''
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        seconds = min(timed(qclass, chain, things) for _ in range(repeat))
+    finally:
+        if enabled:
+            gc.enable()
+    return dict(
+        items_per_sec=len(things) / seconds if seconds else None,
+        seconds=seconds,
+        peak_bytes=peak_bytes(qclass, chain, things) if alloc else None,
+        peak_rss=peak_rss(qclass, chain, things) if alloc else None,
+    )
+
+
+def key(queue, method, size):
+    '''
+    baseline key for one measurement
+
+    @param queue: queue name
+    @param method: method name
+    @param size: number of incoming things
+    '''
+    return '%s:%s:%d' % (queue, method, size)
+
+
+def run(sizes=SIZES, queues=None, methods=None, repeat=3, alloc=True, log=None):
+    '''
+    run benchmark cases
+
+    @param sizes: numbers of incoming things (default: 1e3 to 1e7)
+    @param queues: names of queues to run (default: None, all queues)
+    @param methods: names of methods to run (default: None, all methods)
+    @param repeat: number of timed runs per case (default: 3)
+    @param alloc: measure memory (default: True)
+    @param log: callable passed each key and measurement (default: None)
+    '''
+    results = {}
+    for size in sizes:
+        for method, factory, chain in CASES:
+            if methods and method not in methods:
+                continue
+            things = factory(size)
+            for name, qclass in QUEUES:
+                if queues and name not in queues:
+                    continue
+                result = measure(qclass, chain, things, repeat, alloc)
+                results[key(name, method, size)] = result
+                if log is not None:
+                    log(key(name, method, size), result)
+    return results
+
+###############################################################################
+## baselines ##################################################################
+###############################################################################
+
+
+def save(results, path):
+    '''
+    save results as a JSON baseline
+
+    @param results: benchmark results
+    @param path: baseline path
+    '''
+    with open(path, 'w') as baseline:
+        json.dump(
+            dict(python=sys.version.split()[0], results=results),
+            baseline,
+            indent=2,
+            sort_keys=True,
+        )
+
+
+def load(path):
+    '''
+    load results from a JSON baseline
+
+    @param path: baseline path
+    '''
+    with open(path) as baseline:
+        return json.load(baseline)['results']
+
+
+def compare(baseline, results, tolerance=0.2):
+    '''
+    regressions in `results` against `baseline`
+
+    A measurement regresses when its throughput falls, or its peak traced
+    bytes grow, by more than `tolerance`.
+
+    @param baseline: baseline results
+    @param results: current results
+    @param tolerance: allowed relative change (default: 0.2)
+    '''
+    regressions = []
+    for name in sorted(results):
+        if name not in baseline:
+            continue
+        old, new = baseline[name], results[name]
+        if old['items_per_sec'] and new['items_per_sec'] and (
+            new['items_per_sec'] < old['items_per_sec'] * (1 - tolerance)
+        ):
+            regressions.append(
+                (name, 'items_per_sec', old['items_per_sec'],
+                new['items_per_sec']),
+            )
+        if old.get('peak_bytes') and new.get('peak_bytes') and (
+            new['peak_bytes'] > old['peak_bytes'] * (1 + tolerance)
+        ):
+            regressions.append(
+                (name, 'peak_bytes', old['peak_bytes'], new['peak_bytes']),
+            )
+    return regressions
+
+###############################################################################
+## command line ###############################################################
+###############################################################################
+
+
+def _report(name, result):
+    port.printf(
+        '%-40s %14s items/sec %12s peak bytes %10s KB rss growth' % (
+            name,
+            '%.0f' % result['items_per_sec']
+            if result['items_per_sec'] else '-',
+            result['peak_bytes'] if result['peak_bytes'] is not None else '-',
+            result['peak_rss'] if result['peak_rss'] is not None else '-',
+        )
+    )
+
+
+def _split(option, _, value, parser):
+    setattr(parser.values, option.dest, value.split(','))
+
+
+def main(argv=None):
+    '''
+    run benchmarks from the command line
+
+    @param argv: command line arguments (default: None, `sys.argv`)
+    '''
+    parser = OptionParser(usage='python -m twoq.benchmarks [options]')
+    parser.add_option(
+        '-s', '--sizes', type='string', action='callback', callback=_split,
+        help='comma separated numbers of incoming things',
+    )
+    parser.add_option(
+        '-q', '--queues', type='string', action='callback', callback=_split,
+        help='comma separated queue names (%s)' % ', '.join(
+            name for name, _ in QUEUES
+        ),
+    )
+    parser.add_option(
+        '-m', '--methods', type='string', action='callback', callback=_split,
+        help='comma separated method names',
+    )
+    parser.add_option(
+        '-r', '--repeat', type='int', default=3,
+        help='timed runs per case, the best is kept',
+    )
+    parser.add_option(
+        '--no-alloc', action='store_false', dest='alloc', default=True,
+        help='skip measuring memory',
+    )
+    parser.add_option('--save', help='save results as a JSON baseline')
+    parser.add_option('--compare', help='compare results to a JSON baseline')
+    parser.add_option(
+        '--tolerance', type='float', default=0.2,
+        help='allowed relative change before a result regresses',
+    )
+    options, _ = parser.parse_args(argv)
+    sizes = [int(float(i)) for i in options.sizes] if options.sizes else SIZES
+    results = run(
+        sizes, options.queues, options.methods, options.repeat, options.alloc,
+        _report,
+    )
+    if options.save:
+        save(results, options.save)
+    if options.compare:
+        regressions = compare(load(options.compare), results, options.tolerance)
+        for name, metric, old, new in regressions:
+            port.printf('REGRESSION %s %s: %s -> %s' % (name, metric, old, new))
+        return 1 if regressions else 0
+    return 0
@@ -10,11 +10,11 @@ class Context(object):
 
     '''base context manager'''
 
-    def __init__(self, queue):
+    def __init__(self, queue=None):
         '''
         init
 
-        @param queue: queue
+        @param queue: queue (default: None, set each time the queue syncs)
         '''
         super(Context, self).__init__()
         self._queue = queue
@@ -43,6 +43,8 @@ class ManContext(Context):
     def __exit__(self, t, v, e):
         # clear scratch _queue
         self._queue._scratch = None
+        # release queue so the queue can be reused
+        self._queue = None
 
     @property
     def iterable(self):
@@ -54,7 +56,11 @@ class AutoContext(ManContext):
     '''auto sync context manager'''
 
     def __exit__(self, t, v, e):
+        queue = self._queue
         # clear scratch _queue
-        self._queue._scratch = None
-        # extend incoming items with outgoing items
-        self._queue.incoming, self._queue.outgoing = tee(self._queue.outgoing)
+        queue._scratch = None
+        # extend incoming items with outgoing items unless the step failed
+        if t is None:
+            queue.incoming, queue.outgoing = tee(queue.outgoing)
+        # release queue so the queue can be reused
+        self._queue = None
@@ -5,7 +5,8 @@ from inspect import ismodule
 
 from twoq.support import port
 from twoq.mixins.mapping import (
-    DelayMixin, CopyMixin, MappingMixin, RepeatMixin, MapMixin)
+    DelayMixin, CopyMixin, MappingMixin, RepeatMixin, MapMixin, ParallelMixin,
+    ThrottleMixin)
 
 from twoq.lazy.mixins import AutoQMixin, ManQMixin
 
@@ -89,6 +90,38 @@ class mmapq(ManQMixin, MapMixin):
 
     '''manually balanced map queue'''
 
+###############################################################################
+## lazy parallel map queues ###################################################
+###############################################################################
+
+
+class aparallelq(AutoQMixin, ParallelMixin):
+
+    '''auto-balanced parallel map queue'''
+
+parallelq = aparallelq
+
+
+class mparallelq(ManQMixin, ParallelMixin):
+
+    '''manually balanced parallel map queue'''
+
+###############################################################################
+## lazy throttled delayed map queues ##########################################
+###############################################################################
+
+
+class athrottleq(AutoQMixin, ThrottleMixin):
+
+    '''auto-balanced throttled delayed map queue'''
+
+throttleq = athrottleq
+
+
+class mthrottleq(ManQMixin, ThrottleMixin):
+
+    '''manually balanced throttled delayed map queue'''
+
 __all__ = sorted(name for name, obj in port.items(locals()) if not any([
     name.startswith('_'), ismodule(obj),
 ]))
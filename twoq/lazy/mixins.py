@@ -1,19 +1,33 @@
 # -*- coding: utf-8 -*-
 '''lazy twoq mixins'''
 
+import copy as cp
+import operator as op
+import itertools as it
 from itertools import tee
+from threading import local
+from functools import partial
 from collections import deque
+from operator import methodcaller as mc
 
 from stuf.utils import exhaust
 
-from twoq.mixins.queuing import QueueingMixin
+from twoq import support as ct
+from twoq.support import port
+from twoq.mixins.queuing import QueueingMixin, mapwrite
+from twoq.mixins.mapping import batchmap, invoke
+from twoq.mixins.filtering import batchfilter, pick, pluck, unique
 
 from twoq.lazy.contexts import AutoContext, ManContext
 
-__all__ = ['AutoQMixin', 'ManQMixin']
+__all__ = ['AutoQMixin', 'ManQMixin', 'PlanQMixin']
+# iterators that know exactly how many things they have left
+EXACT = frozenset(
+    type(iter(things)) for things in ([], (), deque(), ct.xrange(0))
+)
 
 
-class baseq(QueueingMixin):
+class baseq(QueueingMixin, local):
 
     '''base lazy queue'''
 
@@ -24,37 +38,122 @@ class baseq(QueueingMixin):
         else:
             incoming = iter(args)
         self._scratch = None
+        # materialized things by queue side
+        self._cache = {}
+        self._context = self._manager()
         super(baseq, self).__init__(incoming, iter([]))
 
+    def _getincoming(self):
+        return self._incoming
+
+    def _setincoming(self, incoming):
+        # forget things materialized from the incoming things it replaces
+        self._cache.pop('incoming', None)
+        self._incoming = incoming
+
+    incoming = property(_getincoming, _setincoming)
+
+    def _getoutgoing(self):
+        return self._outgoing
+
+    def _setoutgoing(self, outgoing):
+        # forget things materialized from the outgoing things it replaces
+        self._cache.pop('outgoing', None)
+        self._outgoing = outgoing
+
+    outgoing = property(_getoutgoing, _setoutgoing)
+
+    @classmethod
+    def _fromiter(cls, things):
+        '''
+        queue streaming things as incoming things
+
+        @param things: an iterable
+        '''
+        queue = cls()
+        queue.incoming = iter(things)
+        return queue
+
+    def tofile(self, path, newline=None, prefix=None, _mapwrite=mapwrite):
+        '''
+        write bytes-like outgoing things to a memory-mapped file
+
+        @param path: file path
+        @param newline: line ending written after each thing (default: None)
+        @param prefix: struct format of length written before each thing
+            (default: None)
+        '''
+        things = list(self.outgoing)
+        _mapwrite(path, things, newline, prefix)
+        # writing consumed outgoing things so put back what was written
+        self.outgoing = iter(things)
+        return self
+
+    _otofile = tofile
+
+    @property
+    def _sync(self):
+        # reenter one context per queue instead of building one per step
+        context = self._context
+        context._queue = self
+        return context
+
     ###########################################################################
     ## queue information ######################################################
     ###########################################################################
 
-    def __contains__(self, value):
-        self.incoming, incoming = tee(self.incoming)
-        return value in list(incoming)
+    def _materialize(self, side, _list=list, _iter=iter):
+        '''
+        remaining things on one side of the queue as a list and the position
+        of the next thing in it, walking the side at most once
+
+        @param side: `incoming` or `outgoing`
+        '''
+        iterable = getattr(self, side)
+        cached = self._cache.get(side)
+        if cached is not None and cached[0] is iterable:
+            things = cached[1]
+            return things, len(things) - iterable.__length_hint__()
+        things = _list(iterable)
+        # rebind side to an iterator over the list so it can be counted
+        iterable = _iter(things)
+        setattr(self, side, iterable)
+        self._cache[side] = iterable, things
+        return things, 0
+
+    def _count(self, side, _exact=EXACT):
+        '''
+        number of things remaining on one side of the queue
+
+        @param side: `incoming` or `outgoing`
+        '''
+        iterable = getattr(self, side)
+        if type(iterable) in _exact:
+            return iterable.__length_hint__()
+        things, start = self._materialize(side)
+        return len(things) - start
+
+    def __contains__(self, value, _islice=it.islice):
+        things, start = self._materialize('incoming')
+        return value in (_islice(things, start, None) if start else things)
 
     _oicontains = __contains__
 
     def __len__(self):
-        self.incoming, incoming = tee(self.incoming)
-        return len(list(incoming))
+        return self._count('incoming')
 
     count = _oicount = __len__
 
     def outcount(self):
         '''count of outgoing items'''
-        self.outgoing, outgoing = tee(self.outgoing)
-        return len(list(outgoing))
+        return self._count('outgoing')
 
     _ooutcount = outcount
 
     @property
     def balanced(self):
         '''if queues are balanced'''
-        self.incoming, incoming = tee(self.incoming)
-        self.outgoing, outgoing = tee(self.outgoing)
-        return len(list(outgoing)) == len(list(incoming))
+        return self._count('outgoing') == self._count('incoming')
 
     _obalanced = balanced
 
@@ -64,8 +163,8 @@ class baseq(QueueingMixin):
 
         @param thing: some thing
         '''
-        self.incoming, incoming = tee(self.incoming)
-        return list(incoming).index(thing)
+        things, start = self._materialize('incoming')
+        return things.index(thing, start) - start
 
     _oindex = index
 
@@ -104,8 +203,7 @@ class baseq(QueueingMixin):
     def last(self):
         '''last thing among incoming things'''
         with self._sync as sync:
-            i1, _ = tee(sync.iterable)
-            sync.append(deque(i1, maxlen=1).pop())
+            sync.append(deque(sync.iterable, maxlen=1).pop())
         return self
 
     _olast = last
@@ -137,6 +235,7 @@ class baseq(QueueingMixin):
     def clear(self):
         '''clear all queues'''
         self._call = None
+        self._batch = self._typecode = None
         self.outclear()
         self.inclear()
         return self
@@ -145,6 +244,7 @@ class baseq(QueueingMixin):
 
     def inclear(self):
         '''incoming things clear'''
+        self._cache.pop('incoming', None)
         self.incoming = iter([])
         return self
 
@@ -152,6 +252,7 @@ class baseq(QueueingMixin):
 
     def outclear(self):
         '''incoming things clear'''
+        self._cache.pop('outgoing', None)
         self.outgoing = iter([])
         return self
 
@@ -244,19 +345,238 @@ class AutoQMixin(baseq):
 
     _oreup = reup
 
-    @property
-    def _sync(self):
-        return AutoContext(self)
+    # factory for the context manager each step reenters
+    _manager = AutoContext
 
 
 class ManQMixin(baseq):
 
     '''manually balanced manipulation queue mixin'''
 
-    @property
-    def _sync(self):
-        return ManContext(self)
+    # factory for the context manager each step reenters
+    _manager = ManContext
 
     def reup(self, _list=list):
         '''put incoming things in incoming things as one incoming thing'''
         return self
+
+
+class PlanQMixin(AutoQMixin):
+
+    '''
+    auto balancing manipulation queue mixin that records streaming steps as
+    a plan and runs them as one fused pipeline
+    '''
+
+    def __init__(self, *args):
+        # pending steps
+        self._plan = []
+        super(PlanQMixin, self).__init__(*args)
+
+    ###########################################################################
+    ## plan management ########################################################
+    ###########################################################################
+
+    def _getincoming(self):
+        # run pending steps before anything looks at incoming things
+        if self._plan:
+            self._execute()
+        return self._incoming
+
+    def _setincoming(self, incoming):
+        if self._plan:
+            self._execute()
+        baseq._setincoming(self, incoming)
+
+    incoming = property(_getincoming, _setincoming)
+
+    def _getoutgoing(self):
+        # run pending steps before anything looks at outgoing things
+        if self._plan:
+            self._execute()
+        return self._outgoing
+
+    def _setoutgoing(self, outgoing):
+        if self._plan:
+            self._execute()
+        baseq._setoutgoing(self, outgoing)
+
+    outgoing = property(_getoutgoing, _setoutgoing)
+
+    def _execute(self, _tee=tee):
+        '''fuse pending steps into one pipeline over incoming things'''
+        iterable = self._incoming
+        for _, step in self._plan:
+            iterable = step(iterable)
+        self._plan = []
+        self._cache.clear()
+        # balance once for the whole plan instead of once per step
+        self._incoming, self._outgoing = _tee(iterable)
+
+    def _step(self, name, step):
+        '''
+        add step to plan
+
+        @param name: step name
+        @param step: callable taking an iterable and returning an iterator
+        '''
+        self._plan.append((name, step))
+        return self
+
+    @property
+    def plan(self):
+        '''names of pending steps'''
+        return tuple(name for name, _ in self._plan)
+
+    def execute(self):
+        '''run pending steps'''
+        if self._plan:
+            self._execute()
+        return self
+
+    _oexecute = execute
+
+    ###########################################################################
+    ## filtering steps ########################################################
+    ###########################################################################
+
+    def compact(self, _filter=ct.filter, _truth=op.truth):
+        '''strip "untrue" things from incoming things'''
+        return self._step('compact', partial(_filter, _truth))
+
+    _ocompact = compact
+
+    def filter(self, _filter=ct.filter, _batchfilter=batchfilter):
+        '''incoming things for which call is `True`'''
+        if self._batch:
+            return self._step('filter', partial(
+                _batchfilter,
+                self._call,
+                size=self._batch,
+                typecode=self._typecode,
+            ))
+        return self._step('filter', partial(_filter, self._call))
+
+    _ofilter = filter
+
+    def reject(self, _filterfalse=ct.filterfalse, _batchfilter=batchfilter):
+        '''incoming things for which call is `False`'''
+        if self._batch:
+            return self._step('reject', partial(
+                _batchfilter,
+                self._call,
+                size=self._batch,
+                typecode=self._typecode,
+                truth=False,
+            ))
+        return self._step('reject', partial(_filterfalse, self._call))
+
+    _oreject = reject
+
+    def without(self, *things):
+        '''strip things from incoming things'''
+        return self._step(
+            'without', partial(ct.filterfalse, lambda x: x in things),
+        )
+
+    _owithout = without
+
+    def pick(self, *names):
+        '''attributes of incoming things by attribute `*names`'''
+        return self._step('pick', partial(pick, names))
+
+    _opick = pick
+
+    def pluck(self, *keys):
+        '''items of incoming things by item `*keys`'''
+        return self._step('pluck', partial(pluck, keys))
+
+    _opluck = pluck
+
+    def unique(self, _unique=unique):
+        '''list unique incoming things, preserving order'''
+        call = self._call
+        return self._step('unique', lambda x: _unique(x, call))
+
+    _ounique = unique
+
+    def rest(self, _islice=it.islice):
+        '''all incoming things except the first thing'''
+        return self._step('rest', lambda x: _islice(x, 1, None))
+
+    _orest = rest
+
+    def take(self, n, _islice=it.islice):
+        '''
+        first `n` things of incoming things
+
+        @param n: number of things
+        '''
+        return self._step('take', lambda x: _islice(x, n))
+
+    _otake = take
+
+    ###########################################################################
+    ## mapping steps ##########################################################
+    ###########################################################################
+
+    def copy(self, _map=ct.map, _copy=cp.copy):
+        '''copy each incoming thing'''
+        return self._step('copy', partial(_map, _copy))
+
+    _ocopy = copy
+
+    def deepcopy(self, _map=ct.map, _deepcopy=cp.deepcopy):
+        '''copy each incoming thing deeply'''
+        return self._step('deepcopy', partial(_map, _deepcopy))
+
+    _odeepcopy = deepcopy
+
+    def each(self, _map=it.starmap):
+        '''invoke call with passed arguments, keywords in incoming things'''
+        call = self._call
+        return self._step(
+            'each', partial(_map, lambda x, y: call(*x, **y)),
+        )
+
+    _oeach = each
+
+    def invoke(self, name, _mc=mc, _invoke=invoke, _map=ct.map):
+        '''
+        invoke call on each incoming thing with passed arguments, keywords
+        but return incoming thing instead if call returns None
+
+        @param name: name of method
+        '''
+        _caller = _mc(name, *self._args, **self._kw)
+        return self._step(
+            'invoke', partial(_map, partial(_invoke, caller=_caller)),
+        )
+
+    _oinvoke = invoke
+
+    def items(self, _s=it.starmap, _c=it.chain.from_iterable, _m=ct.map):
+        '''invoke call on each mapping to get key, value pairs'''
+        call = self._call
+        return self._step('items', lambda x: _s(call, _c(_m(port.items, x))))
+
+    _oitems = items
+
+    def map(self, _map=ct.map, _batchmap=batchmap):
+        '''invoke call on each incoming thing or chunk of incoming things'''
+        if self._batch:
+            return self._step('map', partial(
+                _batchmap,
+                self._call,
+                size=self._batch,
+                typecode=self._typecode,
+            ))
+        return self._step('map', partial(_map, self._call))
+
+    _omap = map
+
+    def starmap(self, _map=it.starmap):
+        '''invoke call on each incoming pair of things'''
+        return self._step('starmap', partial(_map, self._call))
+
+    _ostarmap = starmap
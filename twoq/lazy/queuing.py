@@ -6,9 +6,9 @@ from twoq.mixins.reducing import ReduceMixin
 from twoq.mixins.ordering import OrderMixin
 from twoq.mixins.filtering import FilterMixin
 
-from twoq.lazy.mixins import AutoQMixin, ManQMixin
+from twoq.lazy.mixins import AutoQMixin, ManQMixin, PlanQMixin
 
-__all__ = ('autoq', 'manq', 'twoq')
+__all__ = ('autoq', 'manq', 'planq', 'twoq')
 
 
 class autoq(AutoQMixin, FilterMixin, MapMixin, ReduceMixin, OrderMixin):
@@ -21,4 +21,9 @@ class manq(ManQMixin, FilterMixin, MapMixin, ReduceMixin, OrderMixin):
     '''manually balanced manipulation queue'''
 
 
+class planq(PlanQMixin, FilterMixin, MapMixin, ReduceMixin, OrderMixin):
+
+    '''auto-balancing manipulation queue with fused streaming steps'''
+
+
 twoq = autoq
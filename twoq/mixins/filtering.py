@@ -4,23 +4,50 @@
 import operator as op
 import itertools as it
 import functools as ft
-from inspect import getmro
-from threading import local
+from collections import Sized, deque
+from inspect import getmro, isclass, ismodule
 
 from stuf.utils import getcls
 
 from twoq import support as ct
+from twoq.mixins.mapping import batched
 
 __all__ = (
     'FilteringMixin', 'FilterMixin', 'CollectMixin', 'SetMixin', 'SliceMixin'
 )
 chain_iter = it.chain.from_iterable
+# stands in for class attributes each thing looks up for itself
+DESCRIBED = object()
+# default `__dir__` things share unless their class overrides it
+DIR = getattr(object, '__dir__', None)
 
 ###############################################################################
 ## filtering subroutines ######################################################
 ###############################################################################
 
 
+def batchfilter(
+    call, iterable, size, typecode=None, truth=True, _batched=batched,
+    _compress=it.compress, _map=ct.map, _not=op.not_,
+):
+    '''
+    filter chunks of things from iterable with call returning one truth per
+    thing in each chunk
+
+    @param call: a callable taking a chunk and returning its truths
+    @param iterable: an iterable
+    @param size: number of things per chunk
+    @param typecode: make chunks arrays with this typecode (default: None)
+    @param truth: keep things whose truth is this (default: True)
+    '''
+    for chunk in _batched(iterable, size, typecode):
+        truths = call(chunk)
+        if not truth:
+            truths = _map(_not, truths)
+        for thing in _compress(chunk, truths):
+            yield thing
+
+
 def find(call, iterable, _filter=ct.filter):
     '''
     find the first `True` thing in iterator
@@ -33,13 +60,51 @@ def find(call, iterable, _filter=ct.filter):
         break
 
 
-def members(iterable, _get=getattr):
+def initial(iterable, _tee=it.tee, _islice=it.islice, _map=ct.map):
     '''
-    collect members of things
+    all things in iterable except the last thing, looking one thing ahead
 
-    @param thing: an iterable
+    @param iterable: an iterable
+    '''
+    iterable, ahead = _tee(iterable)
+    # pairing with the next thing drops the last thing
+    return _map(op.itemgetter(0), ct.zip(iterable, _islice(ahead, 1, None)))
+
+
+def classmembers(cls, _dir=dir, _get=getattr, _getmro=getmro):
+    '''
+    members of a class plus the plain attributes and the names of
+    descriptors its instances share and the names of both
+
+    @param cls: a class
     '''
-    for key in dir(iterable):
+    found = list(lookup(cls, _dir(cls)))
+    bases = [_get(base, '__dict__', {}) for base in _getmro(cls)]
+    shared, described = [], []
+    for name, value in found:
+        for attrs in bases:
+            if name in attrs:
+                value = attrs[name]
+                break
+        else:
+            described.append(name)
+            continue
+        # descriptors like methods bind to each thing differently
+        if hasattr(type(value), '__get__'):
+            described.append(name)
+        else:
+            shared.append((name, value))
+    return found, shared, described, frozenset(name for name, _ in found)
+
+
+def lookup(iterable, names, _get=getattr):
+    '''
+    collect members of things by name
+
+    @param iterable: an iterable
+    @param names: member names
+    '''
+    for key in names:
         try:
             thing = _get(iterable, key)
         except AttributeError:
@@ -48,15 +113,83 @@ def members(iterable, _get=getattr):
             yield key, thing
 
 
-def mfilter(call, iterable, _members=members, _filter=ct.filter):
+def ownmembers(
+    iterable, shared, described, known, _get=getattr, _items=ct.items,
+    _lookup=lookup,
+):
+    '''
+    collect members of an instance from members its class shares with its
+    instances and its own attributes
+
+    @param iterable: an instance
+    @param shared: plain class attributes instances share
+    @param described: names of descriptors instances look up themselves
+    @param known: names of class members
+    '''
+    try:
+        found = [(name, _get(iterable, name)) for name in described]
+    except AttributeError:
+        found = list(_lookup(iterable, described))
+    own = _get(iterable, '__dict__', None)
+    if own:
+        found.extend([(k, own.get(k, v)) for k, v in shared])
+        found.extend(sorted(
+            (k, v) for k, v in _items(own) if k not in known
+        ))
+    else:
+        found.extend(shared)
+    # merge the sorted runs
+    found.sort()
+    return found
+
+
+def members(
+    iterable, classes=None, _get=getattr, _isclass=isclass,
+    _ismodule=ismodule, _classmembers=classmembers, _lookup=lookup,
+    _own=ownmembers, _dir=DIR, _getattribute=object.__getattribute__,
+):
+    '''
+    collect members of things
+
+    @param thing: an iterable
+    @param classes: members of classes by class, shared between things
+        (default: None)
+    '''
+    if _ismodule(iterable):
+        return _lookup(iterable, dir(iterable))
+    if classes is None:
+        classes = {}
+    if _isclass(iterable):
+        cls = iterable
+    else:
+        # not `type` which is the same for every old style instance
+        cls = _get(iterable, '__class__')
+        if _get(cls, '__dir__', None) is not _dir or _get(
+            cls, '__getattribute__', _getattribute,
+        ) is not _getattribute:
+            return _lookup(iterable, dir(iterable))
+    try:
+        found = classes[cls]
+    except KeyError:
+        found = classes[cls] = _classmembers(cls)
+    except TypeError:
+        # class can't be hashed
+        found = _classmembers(cls)
+    if cls is iterable:
+        return iter(found[0])
+    return _own(iterable, *found[1:])
+
+
+def mfilter(call, iterable, classes=None, _members=members, _filter=ct.filter):
     '''
     filter members of things
 
     @param call: "Truth" filter
     @param iterable: an iterable
+    @param classes: members of classes by class, shared between things
+        (default: None)
     '''
-    for i in _filter(call, _members(iterable)):
-        yield i
+    return _filter(call, _members(iterable, classes))
 
 
 def pick(names, iterable, _attrgetter=op.attrgetter):
@@ -110,15 +243,71 @@ def unique(iterable, key=None, _ff=ct.filterfalse, _set=set):
                 yield element
 
 
+def difference(iterables, _set=set, _Sized=Sized):
+    '''
+    unique things in the first iterable that are in no other iterable, in the
+    order they are first seen
+
+    @param iterables: iterable of iterables
+    '''
+    iterables = iter(iterables)
+    first = next(iterables, ())
+    if not isinstance(first, _Sized):
+        first = list(first)
+    # one set of things to keep, narrowed in place
+    kept = _set(first)
+    for thing in iterables:
+        if not kept:
+            break
+        kept.difference_update(thing)
+    for thing in first:
+        if thing in kept:
+            # drop kept things once seen so each comes out once
+            kept.remove(thing)
+            yield thing
+
+
+def intersection(iterables, _set=set, _Sized=Sized):
+    '''
+    things in every iterable, narrowed in place from the smallest iterable
+
+    @param iterables: iterable of iterables
+    '''
+    iterables = list(iterables)
+    # sized iterables smallest first then those of unknown size
+    iterables = sorted(
+        (i for i in iterables if isinstance(i, _Sized)), key=len,
+    ) + [i for i in iterables if not isinstance(i, _Sized)]
+    if not iterables:
+        return _set()
+    common = _set(iterables[0])
+    for thing in iterables[1:]:
+        if not common:
+            break
+        common.intersection_update(thing)
+    return common
+
+
+def union(iterables, _unique=unique, _chain=chain_iter):
+    '''
+    unique things in any iterable, in the order they are first seen
+
+    @param iterables: iterable of iterables
+    '''
+    return _unique(_chain(iterables))
+
+
 ###############################################################################
 ## filter mixins ##############################################################
 ###############################################################################
 
 
-class FilteringMixin(local):
+class FilteringMixin(object):
 
     '''filter mixin'''
 
+    __slots__ = ()
+
     def compact(self, _filter=ct.filter, _truth=op.truth):
         '''strip "untrue" things from incoming things'''
         with self._sync as sync:
@@ -127,10 +316,15 @@ class FilteringMixin(local):
 
     _ocompact = compact
 
-    def filter(self, _filter=ct.filter):
+    def filter(self, _filter=ct.filter, _batchfilter=batchfilter):
         '''incoming things for which call is `True`'''
         with self._sync as sync:
-            sync(_filter(self._call, sync.iterable))
+            if self._batch:
+                sync(_batchfilter(
+                    self._call, sync.iterable, self._batch, self._typecode,
+                ))
+            else:
+                sync(_filter(self._call, sync.iterable))
         return self
 
     _ofilter = filter
@@ -138,7 +332,7 @@ class FilteringMixin(local):
     def find(self, _find=find):
         '''first incoming thing for which call is `True`'''
         with self._sync as sync:
-            sync(_find(self._call, self.incoming))
+            sync(_find(self._call, sync.iterable))
         return self
 
     _ofind = find
@@ -158,10 +352,19 @@ class FilteringMixin(local):
 
     _opartition = partition
 
-    def reject(self, _filterfalse=ct.filterfalse):
+    def reject(self, _filterfalse=ct.filterfalse, _batchfilter=batchfilter):
         '''incoming things for which call is `False`'''
         with self._sync as sync:
-            sync(_filterfalse(self._call, sync.iterable))
+            if self._batch:
+                sync(_batchfilter(
+                    self._call,
+                    sync.iterable,
+                    self._batch,
+                    self._typecode,
+                    False,
+                ))
+            else:
+                sync(_filterfalse(self._call, sync.iterable))
         return self
 
     _oreject = reject
@@ -175,13 +378,16 @@ class FilteringMixin(local):
     _owithout = without
 
 
-class CollectMixin(local):
+class CollectMixin(object):
 
     '''gathering mixin'''
 
+    __slots__ = ()
+
     def deepmembers(self, mz=mfilter, ci=chain_iter, gc=getcls):
         '''collect members of incoming things and their bases'''
-        _mz = ft.partial(mz, self._call)
+        # read each class once per step
+        _mz = ft.partial(mz, self._call, classes={})
         with self._sync as sync:
             if ct.port.PY3:
                 def _memfilters(thing, mz=_mz, gc=gc):
@@ -199,7 +405,8 @@ class CollectMixin(local):
 
     def members(self, _mz=mfilter, _ci=it.chain.from_iterable):
         '''collect members of incoming things'''
-        _mz = ft.partial(_mz, self._call)
+        # read each class once per step
+        _mz = ft.partial(_mz, self._call, classes={})
         with self._sync as sync:
             sync(_ci(ct.map(_mz, sync.iterable)))
         return self
@@ -223,36 +430,32 @@ class CollectMixin(local):
     _opluck = pluck
 
 
-class SetMixin(local):
+class SetMixin(object):
 
     '''set and uniqueness mixin'''
 
-    def difference(self, _reduce=ft.reduce, _set=set):
+    __slots__ = ()
+
+    def difference(self, _difference=difference):
         '''difference between incoming things'''
         with self._sync as sync:
-            sync(_reduce(
-                lambda x, y: _set(x).difference(_set(y)), sync.iterable,
-            ))
+            sync(_difference(sync.iterable))
         return self
 
     _odifference = difference
 
-    def intersection(self, _reduce=ft.reduce, _set=set):
+    def intersection(self, _intersection=intersection):
         '''intersection between incoming things'''
         with self._sync as sync:
-            sync(_reduce(
-                lambda x, y: _set(x).intersection(_set(y)), sync.iterable,
-            ))
+            sync(_intersection(sync.iterable))
         return self
 
     _ointersection = intersection
 
-    def union(self, _reduce=ft.reduce, _set=set):
+    def union(self, _union=union):
         '''union between incoming things'''
         with self._sync as sync:
-            sync(_reduce(
-                lambda x, y: _set(x).union(_set(y)), sync.iterable,
-            ))
+            sync(_union(sync.iterable))
         return self
 
     _ounion = union
@@ -272,10 +475,12 @@ class SetMixin(local):
     _ounique = unique
 
 
-class SliceMixin(local):
+class SliceMixin(object):
 
     '''slicing mixin'''
 
+    __slots__ = ()
+
     def nth(self, n, default=None, _next=next, _islice=it.islice):
         '''
         nth incoming thing or default thing
@@ -289,11 +494,10 @@ class SliceMixin(local):
 
     _onth = nth
 
-    def initial(self, _islice=it.islice, _len=len):
+    def initial(self, _initial=initial):
         '''all incoming things except the last thing'''
         with self._sync as sync:
-            iterable1, iterable2 = it.tee(sync.iterable)
-            sync(_islice(iterable1, _len(list(iterable2)) - 1))
+            sync(_initial(sync.iterable))
         return self
 
     _oinitial = initial
@@ -306,15 +510,14 @@ class SliceMixin(local):
 
     _orest = rest
 
-    def snatch(self, n, _islice=it.islice, _len=len):
+    def snatch(self, n, _deque=deque):
         '''
         last `n` things of incoming things
 
         @param n: number of things
         '''
         with self._sync as sync:
-            iterable1, iterable2 = it.tee(sync.iterable)
-            sync(_islice(iterable1, _len(list(iterable2)) - n, None))
+            sync(_deque(sync.iterable, maxlen=n))
         return self
 
     _osnatch = snatch
@@ -335,3 +538,5 @@ class SliceMixin(local):
 class FilterMixin(FilteringMixin, CollectMixin, SetMixin, SliceMixin):
 
     '''filters mixin'''
+
+    __slots__ = ()
@@ -5,17 +5,23 @@ import time
 
 import copy as cp
 import itertools as it
-from threading import local
+from array import array
+from threading import Lock
 from functools import partial
+from collections import deque
+from multiprocessing import cpu_count
 from operator import methodcaller as mc
 
 from twoq import support as ct
 from twoq.support import port
+from twoq.mixins.reducing import chunks
 
 __all__ = (
     'DelayMixin', 'CopyMixin', 'MappingMixin', 'RepeatMixin', 'MapMixin',
+    'ParallelMixin', 'ThrottleMixin', 'TokenBucket',
 )
 chain_iter = it.chain.from_iterable
+_clock = getattr(time, 'monotonic', time.time)
 
 ###############################################################################
 ## mapping subroutines ########################################################
@@ -34,6 +40,141 @@ def invoke(thing, caller=None): #@IgnorePep8
     return thing if results is None else results
 
 
+def batched(iterable, size, typecode=None, _chunks=chunks, _array=array):
+    '''
+    chunks of `size` things from iterable as lists or arrays
+
+    @param iterable: an iterable
+    @param size: number of things per chunk
+    @param typecode: make chunks arrays with this typecode (default: None)
+    '''
+    if typecode is None:
+        return _chunks(iterable, size)
+    return ct.map(partial(_array, typecode), _chunks(iterable, size))
+
+
+def batchmap(call, iterable, size, typecode=None, _batched=batched):
+    '''
+    invoke call on chunks of things from iterable and flatten its results
+
+    @param call: a callable taking a chunk and returning an iterable
+    @param iterable: an iterable
+    @param size: number of things per chunk
+    @param typecode: make chunks arrays with this typecode (default: None)
+    '''
+    return chain_iter(ct.map(call, _batched(iterable, size, typecode)))
+
+
+def each(x, y, caller=None):
+    '''
+    invoke `caller` with passed arguments, keywords
+
+    @param x: positional arguments
+    @param y: keywork arguments
+    @param caller: a callable (default: None)
+    '''
+    return caller(*x, **y)
+
+
+def chunkmap(call, things):
+    '''
+    invoke call on each thing in a chunk of things
+
+    @param call: a callable
+    @param things: a chunk of things
+    '''
+    return [call(thing) for thing in things]
+
+
+def chunkcall(call, things, typecode=None, _array=array):
+    '''
+    invoke call once on a whole chunk of things and list its results
+
+    @param call: a callable taking a chunk and returning an iterable
+    @param things: a chunk of things
+    @param typecode: make the chunk an array with this typecode (default:
+        None)
+    '''
+    if typecode is not None:
+        things = _array(typecode, things)
+    return list(call(things))
+
+
+def chunkstarmap(call, things, _starmap=it.starmap):
+    '''
+    invoke call on each pair of things in a chunk of things
+
+    @param call: a callable
+    @param things: a chunk of things
+    '''
+    return list(_starmap(call, things))
+
+
+def gatedmap(gate, mapper, call, things):
+    '''
+    invoke mapper on a chunk of things once gate lets it through
+
+    @param gate: callable that blocks until the next chunk may be mapped
+    @param mapper: subroutine that invokes call on a chunk of things
+    @param call: a callable
+    @param things: a chunk of things
+    '''
+    gate()
+    return mapper(call, things)
+
+
+def pooled(
+    mapper, call, iterable, executor, workers=None, chunk=1, ordered=True,
+    gate=None, _islice=it.islice,
+):
+    '''
+    invoke call on chunks of things in an executor's pool of workers
+
+    @param mapper: subroutine that invokes call on a chunk of things
+    @param call: a callable
+    @param iterable: an iterable
+    @param executor: executor class
+    @param workers: number of workers (default: None, number of cpus)
+    @param chunk: number of things sent to a worker at once (default: 1)
+    @param ordered: yield results in incoming order (default: True)
+    @param gate: callable a worker blocks on before mapping each chunk
+        (default: None)
+    '''
+    workers = workers or cpu_count()
+    # bound the number of chunks in flight
+    window = workers * 2
+    iterable = iter(iterable)
+    chunks = iter(lambda: list(_islice(iterable, chunk)), [])
+    wait, first = ct.futures.wait, ct.futures.FIRST_COMPLETED
+    if gate is not None:
+        # pass the gate when a worker starts a chunk rather than on submit
+        mapper = partial(gatedmap, gate, mapper)
+    with executor(workers) as pool:
+        submit = partial(pool.submit, mapper, call)
+        if ordered:
+            pending = deque()
+            for things in chunks:
+                pending.append(submit(things))
+                if len(pending) >= window:
+                    for thing in pending.popleft().result():
+                        yield thing
+            while pending:
+                for thing in pending.popleft().result():
+                    yield thing
+        else:
+            pending = set()
+            for things in chunks:
+                pending.add(submit(things))
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when=first)
+                    for future in done:
+                        for thing in future.result():
+                            yield thing
+            for future in ct.futures.as_completed(pending):
+                for thing in future.result():
+                    yield thing
+
+
 def delay_each(x, y, wait=0, caller=None, _sleep=time.sleep):
     '''
     invoke `caller` with passed arguments, keywords after a delay
@@ -72,15 +213,65 @@ def delay_map(x, wait=None, caller=None, _sleep=time.sleep):
     return caller(x)
 
 
+class TokenBucket(object):
+
+    '''thread-safe token bucket'''
+
+    def __init__(self, rate, interval=1.0, clock=_clock, sleep=time.sleep):
+        '''
+        init
+
+        @param rate: number of tokens added per interval
+        @param interval: seconds per interval (default: 1.0)
+        @param clock: callable returning seconds (default: monotonic clock)
+        @param sleep: callable waiting a number of seconds (default:
+            time.sleep)
+        '''
+        super(TokenBucket, self).__init__()
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        if interval <= 0:
+            raise ValueError('interval must be positive')
+        self.rate = rate
+        self.interval = interval
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = Lock()
+        # hold at least one token so fractional rates can take one
+        self._capacity = max(float(rate), 1.0)
+        # start full
+        self._tokens = self._capacity
+        self._stamp = clock()
+
+    def take(self):
+        '''wait for a token and take it'''
+        rate, interval, clock = self.rate, self.interval, self._clock
+        capacity = self._capacity
+        while True:
+            with self._lock:
+                now = clock()
+                self._tokens = min(
+                    capacity,
+                    self._tokens + (now - self._stamp) * rate / interval,
+                )
+                self._stamp = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * interval / rate
+            self._sleep(wait)
+
 ###############################################################################
 ## map mixins #################################################################
 ###############################################################################
 
 
-class DelayMixin(local):
+class DelayMixin(object):
 
     '''delayed map mixin'''
 
+    __slots__ = ()
+
     def delay_each(self, wait, _map=it.starmap, _delay_each=delay_each):
         '''
         invoke call with passed arguments, keywords in incoming things after a
@@ -125,10 +316,12 @@ class DelayMixin(local):
     _odelay_map = delay_map
 
 
-class CopyMixin(local):
+class CopyMixin(object):
 
     '''duplication mixin'''
 
+    __slots__ = ()
+
     def copy(self, _map=ct.map, _copy=cp.copy):
         '''copy each incoming thing'''
         with self._sync as sync:
@@ -146,10 +339,12 @@ class CopyMixin(local):
     _odeepcopy = deepcopy
 
 
-class MappingMixin(local):
+class MappingMixin(object):
 
     '''map mixin'''
 
+    __slots__ = ()
+
     def each(self, _map=it.starmap):
         '''invoke call with passed arguments, keywords in incoming things'''
         with self._sync as sync:
@@ -181,10 +376,15 @@ class MappingMixin(local):
 
     _ostarmap = items
 
-    def map(self, _map=ct.map):
-        '''invoke call on each incoming thing'''
+    def map(self, _map=ct.map, _batchmap=batchmap):
+        '''invoke call on each incoming thing or chunk of incoming things'''
         with self._sync as sync:
-            sync(_map(self._call, sync.iterable))
+            if self._batch:
+                sync(_batchmap(
+                    self._call, sync.iterable, self._batch, self._typecode,
+                ))
+            else:
+                sync(_map(self._call, sync.iterable))
         return self
 
     _omap = map
@@ -198,10 +398,12 @@ class MappingMixin(local):
     _ostarmap = starmap
 
 
-class RepeatMixin(local):
+class RepeatMixin(object):
 
     '''repetition mixin'''
 
+    __slots__ = ()
+
     def padnone(self, _chain=it.chain, _repeat=it.repeat):
         '''
         incoming things and then `None` indefinitely
@@ -257,6 +459,189 @@ class RepeatMixin(local):
     _otimes = times
 
 
+class ParallelMixin(object):
+
+    '''process pool map mixin'''
+
+    __slots__ = ()
+
+    # number of worker processes
+    _workers = None
+    # number of things sent to a worker process at once
+    _chunk = 64
+    # keep incoming order
+    _ordered = True
+
+    def pool(self, workers=None, chunk=64, ordered=True):
+        '''
+        set up process pool for mapping
+
+        @param workers: number of worker processes (default: None, number of
+            cpus)
+        @param chunk: number of things sent to a worker process at once
+            (default: 64)
+        @param ordered: keep incoming order (default: True)
+        '''
+        self._workers = workers
+        self._chunk = chunk
+        self._ordered = ordered
+        return self
+
+    _opool = pool
+
+    def _pool(self, mapper, call, chunk=None, _pooled=pooled):
+        if ct.futures is None:
+            raise ImportError('parallel mapping needs concurrent.futures')
+        if chunk is None and self._batch:
+            raise ValueError('only map() takes batches in a process pool')
+        with self._sync as sync:
+            sync(_pooled(
+                mapper,
+                call,
+                sync.iterable,
+                ct.futures.ProcessPoolExecutor,
+                self._workers,
+                chunk or self._chunk,
+                self._ordered,
+            ))
+        return self
+
+    def each(self, _each=each, _mapper=chunkstarmap):
+        '''
+        invoke call with passed arguments, keywords in incoming things in a
+        process pool
+        '''
+        return self._pool(_mapper, partial(_each, caller=self._call))
+
+    _oeach = each
+
+    def invoke(self, name, _mc=mc, _invoke=invoke, _mapper=chunkmap):
+        '''
+        invoke call on each incoming thing with passed arguments, keywords
+        in a process pool but return incoming thing instead if call returns
+        None
+
+        @param name: name of method
+        '''
+        _caller = _mc(name, *self._args, **self._kw)
+        return self._pool(_mapper, partial(_invoke, caller=_caller))
+
+    _oinvoke = invoke
+
+    def map(self, _mapper=chunkmap, _batchmapper=chunkcall):
+        '''
+        invoke call on each incoming thing, or each batch of incoming things,
+        in a process pool
+        '''
+        if self._batch:
+            return self._pool(
+                partial(_batchmapper, typecode=self._typecode),
+                self._call,
+                self._batch,
+            )
+        return self._pool(_mapper, self._call)
+
+    _omap = map
+
+    def starmap(self, _mapper=chunkstarmap):
+        '''invoke call on each incoming pair of things in a process pool'''
+        return self._pool(_mapper, self._call)
+
+    _ostarmap = starmap
+
+
+class ThrottleMixin(object):
+
+    '''rate limited thread pool delayed map mixin'''
+
+    __slots__ = ()
+
+    # calls allowed per interval
+    _rate = None
+    # seconds per interval
+    _interval = 1.0
+    # number of worker threads
+    _threads = None
+    # token bucket factory
+    _bucket = TokenBucket
+
+    def throttle(self, rate=None, interval=1.0, workers=None):
+        '''
+        set up rate limited thread pool for delayed mapping
+
+        @param rate: calls allowed per interval (default: None, unlimited)
+        @param interval: seconds per interval (default: 1.0)
+        @param workers: number of worker threads (default: None, five per
+            cpu)
+        '''
+        self._rate = rate
+        self._interval = interval
+        self._threads = workers
+        return self
+
+    _othrottle = throttle
+
+    def _throttle(self, mapper, call, _pooled=pooled):
+        if ct.futures is None:
+            raise ImportError('throttled mapping needs concurrent.futures')
+        if self._batch:
+            raise ValueError('throttled mapping does not take batches')
+        rate = self._rate
+        gate = self._bucket(rate, self._interval).take if rate else None
+        with self._sync as sync:
+            sync(_pooled(
+                mapper,
+                call,
+                sync.iterable,
+                ct.futures.ThreadPoolExecutor,
+                self._threads or cpu_count() * 5,
+                1,
+                True,
+                gate,
+            ))
+        return self
+
+    def delay_each(self, wait, _delay_each=delay_each, _mapper=chunkstarmap):
+        '''
+        invoke call with passed arguments, keywords in incoming things after a
+        delay in a rate limited thread pool
+
+        @param wait: time in seconds
+        '''
+        _call = partial(_delay_each, wait=wait, caller=self._call)
+        return self._throttle(_mapper, _call)
+
+    _odelay_each = delay_each
+
+    def delay_invoke(self, name, wait, _mc=mc, _di=delay_invoke, _m=chunkmap):
+        '''
+        invoke call on each incoming thing with passed arguments, keywords
+        after a delay in a rate limited thread pool but return incoming thing
+        instead if call returns None
+
+        @param name: name of method
+        @param wait: time in seconds
+        '''
+        _caller = _mc(name, *self._args, **self._kw)
+        return self._throttle(_m, partial(_di, wait=wait, caller=_caller))
+
+    _odelay_invoke = delay_invoke
+
+    def delay_map(self, wait, _delay_map=delay_map, _mapper=chunkmap):
+        '''
+        invoke call on each incoming thing after a delay in a rate limited
+        thread pool
+
+        @param wait: time in seconds
+        '''
+        _call = partial(_delay_map, wait=wait, caller=self._call)
+        return self._throttle(_mapper, _call)
+
+    _odelay_map = delay_map
+
+
 class MapMixin(DelayMixin, CopyMixin, MappingMixin, RepeatMixin):
 
     '''mapping mixin'''
+
+    __slots__ = ()
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+'''twoq numeric mixins'''
+
+import math as mt
+import random as rm
+import operator as op
+
+from twoq import support as ct
+from twoq.active.storage import NumberArray
+from twoq.mixins.reducing import median as qmedian
+
+__all__ = ('NumericMixin',)
+imin, imax, isum = min, max, sum
+# largest estimated integer sum numpy adds without wrapping at 64 bits
+BOUND = 2.0 ** 62
+
+###############################################################################
+## numeric subroutines ########################################################
+###############################################################################
+
+
+def vector(things, _numpy=ct.numpy):
+    '''
+    numpy view of a buffer of numbers without copying it
+
+    @param things: array of numbers
+    '''
+    return _numpy.frombuffer(things, dtype=things.typecode)
+
+###############################################################################
+## numeric mixins #############################################################
+###############################################################################
+
+
+class NumericMixin(object):
+
+    '''
+    math and ordering mixin running vectorized over a contiguous buffer of
+    incoming numbers with numpy if it is importable or array loops if not,
+    falling back to running over things one by one if they are not all
+    numbers
+    '''
+
+    __slots__ = ()
+
+    # typecode incoming numbers are kept as or `None` to pick one from them
+    _numbers = None
+
+    def _array(self, _NumberArray=NumberArray):
+        '''
+        copy of incoming numbers in a contiguous buffer or `None` if not
+        numbers, leaving incoming things in the queue's own storage
+        '''
+        incoming = self.incoming
+        typecode = self._numbers
+        if isinstance(incoming, _NumberArray) and typecode in (
+            None, incoming.typecode,
+        ):
+            return incoming
+        try:
+            return _NumberArray(incoming, typecode)
+        except (TypeError, OverflowError):
+            return None
+
+    @staticmethod
+    def _vector(things):
+        '''
+        numpy view of incoming numbers or `None` without numpy
+
+        @param things: array of numbers
+        '''
+        if ct.numpy is None or not things:
+            return None
+        return vector(things)
+
+    def typecode(self, typecode=None):
+        '''
+        keep incoming numbers in an array of `typecode`
+
+        @param typecode: array typecode (default: None, 'l' if every incoming
+            thing is an integer or else 'd')
+        '''
+        self._numbers = typecode
+        return self
+
+    _otypecode = typecode
+
+    def average(self, _truediv=op.truediv, _sum=isum, _len=len):
+        '''average of all incoming things'''
+        things = self._array()
+        if things is None:
+            return super(NumericMixin, self).average()
+        with self._sync as sync:
+            values = self._vector(things)
+            if values is not None:
+                sync.append(values.mean().item())
+            else:
+                sync.append(_truediv(_sum(things, 0.0), _len(things)))
+        return self
+
+    _oaverage = average
+
+    def fsum(self, _fsum=mt.fsum):
+        '''add incoming things together exactly'''
+        with self._sync as sync:
+            sync.append(_fsum(sync.iterable))
+        return self
+
+    _ofsum = fsum
+
+    def max(self, _max=imax):
+        '''find maximum value in incoming things using call for key function'''
+        things = None if self._call is not None else self._array()
+        if things is None:
+            return super(NumericMixin, self).max()
+        with self._sync as sync:
+            values = self._vector(things)
+            if values is not None:
+                sync.append(values.max().item())
+            else:
+                sync.append(_max(things))
+        return self
+
+    _omax = max
+
+    def median(self, approx=False, _median=qmedian):
+        '''
+        median of incoming things
+
+        @param approx: estimate median in constant memory (default: False)
+        '''
+        things = None if approx else self._array()
+        if things is None:
+            return super(NumericMixin, self).median(approx)
+        with self._sync as sync:
+            values = self._vector(things)
+            if values is not None:
+                sync.append(ct.numpy.median(values).item())
+            else:
+                sync.append(_median(things))
+        return self
+
+    _omedian = median
+
+    def min(self, _min=imin):
+        '''find minimum value in incoming things using call for key function'''
+        things = None if self._call is not None else self._array()
+        if things is None:
+            return super(NumericMixin, self).min()
+        with self._sync as sync:
+            values = self._vector(things)
+            if values is not None:
+                sync.append(values.min().item())
+            else:
+                sync.append(_min(things))
+        return self
+
+    _omin = min
+
+    def minmax(self, _min=imin, _max=imax):
+        '''minimum and maximum values among incoming things'''
+        things = self._array()
+        if things is None:
+            return super(NumericMixin, self).minmax()
+        with self._sync as sync:
+            values = self._vector(things)
+            if values is not None:
+                sync([values.min().item(), values.max().item()])
+            else:
+                sync([_min(things), _max(things)])
+        return self
+
+    _ominmax = minmax
+
+    def statrange(self, _min=imin, _max=imax):
+        '''statistical range of incoming things'''
+        things = self._array()
+        if things is None:
+            return super(NumericMixin, self).statrange()
+        with self._sync as sync:
+            values = self._vector(things)
+            if values is not None:
+                # subtract as python numbers so integers cannot wrap
+                sync.append(values.max().item() - values.min().item())
+            else:
+                sync.append(_max(things) - _min(things))
+        return self
+
+    _ostatrange = statrange
+
+    def sum(self, start=0, _sum=isum, _abs=abs, _bound=BOUND):
+        '''
+        add incoming things together
+
+        @param start: starting number (default: 0)
+        '''
+        things = self._array()
+        if things is None:
+            return super(NumericMixin, self).sum(start)
+        with self._sync as sync:
+            values = self._vector(things)
+            if values is not None and (
+                values.dtype.kind != 'i' or
+                # add integers exactly if numpy's sum could wrap
+                _abs(values.sum(dtype='d').item()) < _bound
+            ):
+                sync.append(values.sum().item() + start)
+            else:
+                sync.append(_sum(things, start))
+        return self
+
+    _osum = sum
+
+    def reverse(self):
+        '''reverse incoming things'''
+        things = self._array()
+        if things is None:
+            return super(NumericMixin, self).reverse()
+        with self._sync as sync:
+            values = self._vector(things)
+            if values is not None:
+                sync(values[::-1].tolist())
+            else:
+                sync(reversed(things))
+        return self
+
+    _oreverse = reverse
+
+    def sample(self, n, _sample=rm.sample):
+        '''
+        random sampling drawn from `n` incoming things
+
+        @param n: number of things
+        '''
+        things = self._array()
+        if things is None:
+            return super(NumericMixin, self).sample(n)
+        with self._sync as sync:
+            values = self._vector(things)
+            if values is not None:
+                sync(ct.numpy.random.choice(values, n, replace=False).tolist())
+            else:
+                sync(_sample(list(things), n))
+        return self
+
+    _osample = sample
+
+    def sort(self, budget=None, _sorted=sorted):
+        '''
+        sort incoming things using call for key function
+
+        @param budget: sort holding at most this many things in memory,
+            spilling the rest to temporary files (default: None)
+        '''
+        things = None if (
+            self._call is not None or budget is not None
+        ) else self._array()
+        if things is None:
+            return super(NumericMixin, self).sort(budget)
+        with self._sync as sync:
+            values = self._vector(things)
+            if values is not None:
+                sync(ct.numpy.sort(values).tolist())
+            else:
+                sync(_sorted(things))
+        return self
+
+    _osort = sort
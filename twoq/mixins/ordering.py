@@ -1,19 +1,173 @@
 # -*- coding: utf-8 -*-
 '''twoq ordering mixins'''
 
+import heapq as hq
 import random as rm
+import operator as op
 import itertools as it
-from threading import local
+from tempfile import TemporaryFile
 
 from twoq import support as ct
+from twoq.mixins.reducing import chunks
 
 __all__ = ('OrderingMixin', 'OrderMixin', 'RandomMixin')
+# most spilled runs merged at once by external sorts
+FANIN = 64
 
+###############################################################################
+## ordering subroutines #######################################################
+###############################################################################
 
-class OrderingMixin(local):
+
+def spill(things, _dump=ct.cPickle.dump, _chunks=chunks):
+    '''
+    write things to a temporary file in pickled batches
+
+    @param things: an iterable
+    '''
+    handle = TemporaryFile()
+    for chunk in _chunks(things):
+        _dump(chunk, handle, -1)
+    handle.seek(0)
+    return handle
+
+
+def unspill(handle, _load=ct.cPickle.load):
+    '''
+    read things back from a temporary file, closing it when exhausted
+
+    @param handle: a spilled temporary file
+    '''
+    try:
+        while True:
+            try:
+                chunk = _load(handle)
+            except EOFError:
+                break
+            for thing in chunk:
+                yield thing
+    finally:
+        handle.close()
+
+
+def collapse(handles, _merge=hq.merge, _spill=spill, _unspill=unspill):
+    '''
+    merge spilled sorted runs into one spilled sorted run
+
+    @param handles: spilled temporary files
+    '''
+    return _spill(_merge(*[_unspill(handle) for handle in handles]))
+
+
+def external(
+    iterable, budget, key=None, fanin=FANIN, _islice=it.islice,
+    _merge=hq.merge, _spill=spill, _collapse=collapse,
+):
+    '''
+    sort iterable holding at most `budget` things in memory at once by
+    spilling sorted runs to temporary files and lazily merging them
+
+    @param iterable: an iterable
+    @param budget: number of things to hold in memory
+    @param key: key function (default: None)
+    @param fanin: most spilled runs to merge at once (default: FANIN)
+    '''
+    if budget < 1:
+        raise ValueError('budget must be at least 1')
+    if fanin < 2:
+        raise ValueError('fanin must be at least 2')
+    iterable = iter(iterable)
+    runs = iter(lambda: list(_islice(iterable, budget)), [])
+    # number each thing so keyed runs stay stable and never compare things
+    count = it.count()
+    # spilled runs by how many merges went into them, oldest runs first
+    levels = []
+    merged = None
+    try:
+        for run in runs:
+            if key is None:
+                run.sort()
+            else:
+                run = sorted(ct.zip(ct.map(key, run), count, run))
+            if not levels:
+                # peek ahead so everything within budget skips the disk
+                peek = list(_islice(iterable, 1))
+                if not peek:
+                    merged = iter(run)
+                    break
+                iterable = it.chain(peek, iterable)
+            handle, level = _spill(run), 0
+            # release the run before reading the next one
+            del run
+            # merge a level into the next one once it holds `fanin` runs
+            while True:
+                if level == len(levels):
+                    levels.append([])
+                levels[level].append(handle)
+                if len(levels[level]) < fanin:
+                    break
+                handle = _collapse(levels[level])
+                levels[level] = []
+                level += 1
+        if merged is None:
+            handles = [h for level in reversed(levels) for h in level]
+            while len(handles) > fanin:
+                handles = [
+                    _collapse(handles[i:i + fanin])
+                    for i in ct.xrange(0, len(handles), fanin)
+                ]
+            merged = _merge(*[unspill(handle) for handle in handles])
+    except Exception:
+        for level in levels:
+            for handle in level:
+                handle.close()
+        raise
+    if key is None:
+        return merged
+    return ct.map(op.itemgetter(2), merged)
+
+
+def hashgroup(iterable, key=None, reducer=None, initial=None):
+    '''
+    group things in iterable by key in one pass without sorting them first,
+    keeping groups in the order their keys are first seen
+
+    @param iterable: an iterable
+    @param key: key function (default: None)
+    @param reducer: call folding each group's things into one thing instead
+        of listing them (default: None)
+    @param initial: initial thing for each group's fold, or its first thing
+        if `None` (default: None)
+    '''
+    groups = {}
+    order = []
+    for thing in iterable:
+        k = thing if key is None else key(thing)
+        if k not in groups:
+            order.append(k)
+            if reducer is None:
+                groups[k] = [thing]
+            elif initial is None:
+                groups[k] = thing
+            else:
+                groups[k] = reducer(initial, thing)
+        elif reducer is None:
+            groups[k].append(thing)
+        else:
+            groups[k] = reducer(groups[k], thing)
+    return [[k, groups[k]] for k in order]
+
+###############################################################################
+## ordering mixins ############################################################
+###############################################################################
+
+
+class OrderingMixin(object):
 
     '''order mixin'''
 
+    __slots__ = ()
+
     def group(self, _map=ct.map, _groupby=it.groupby):
         '''group incoming things using _call for key function'''
         with self._sync as sync:
@@ -30,6 +184,22 @@ class OrderingMixin(local):
 
     _ogroup = group
 
+    def groupby(self, reducer=None, initial=None, _hashgroup=hashgroup):
+        '''
+        group incoming things using _call for key function whether or not
+        things with the same key are next to each other
+
+        @param reducer: call folding each group's things into one thing
+            instead of listing them (default: None)
+        @param initial: initial thing for each group's fold, or its first
+            thing if `None` (default: None)
+        '''
+        with self._sync as sync:
+            sync(_hashgroup(sync.iterable, self._call, reducer, initial))
+        return self
+
+    _ogroupby = groupby
+
     def grouper(self, n, fill=None, _zipl=ct.zip_longest, _iter=iter):
         '''
         split incoming things into sequences of length `n`, using fill thing to
@@ -46,6 +216,30 @@ class OrderingMixin(local):
 
     _ogrouper = grouper
 
+    def nlargest(self, n, _nlargest=hq.nlargest):
+        '''
+        `n` largest incoming things using call for key function
+
+        @param n: number of things
+        '''
+        with self._sync as sync:
+            sync(_nlargest(n, sync.iterable, key=self._call))
+        return self
+
+    _onlargest = nlargest
+
+    def nsmallest(self, n, _nsmallest=hq.nsmallest):
+        '''
+        `n` smallest incoming things using call for key function
+
+        @param n: number of things
+        '''
+        with self._sync as sync:
+            sync(_nsmallest(n, sync.iterable, key=self._call))
+        return self
+
+    _onsmallest = nsmallest
+
     def reverse(self, _reversed=reversed):
         '''reverse incoming things'''
         with self._sync as sync:
@@ -54,10 +248,19 @@ class OrderingMixin(local):
 
     _oreverse = reverse
 
-    def sort(self, _sorted=sorted):
-        '''sort incoming things using call for key function'''
+    def sort(self, budget=None, _sorted=sorted, _external=external):
+        '''
+        sort incoming things using call for key function
+
+        @param budget: sort holding at most this many things in memory,
+            spilling the rest to temporary files (default: None)
+        '''
+        if budget is not None and budget < 1:
+            raise ValueError('budget must be at least 1')
         with self._sync as sync:
-            if self._call is None:
+            if budget is not None:
+                sync(_external(sync.iterable, budget, self._call))
+            elif self._call is None:
                 sync(_sorted(sync.iterable))
             else:
                 sync(_sorted(sync.iterable, key=self._call))
@@ -66,10 +269,12 @@ class OrderingMixin(local):
     _osort = sort
 
 
-class RandomMixin(local):
+class RandomMixin(object):
 
     '''random mixin'''
 
+    __slots__ = ()
+
     def choice(self, _choice=rm.choice):
         '''random choice from incoming things'''
         with self._sync as sync:
@@ -104,3 +309,5 @@ class RandomMixin(local):
 class OrderMixin(OrderingMixin, RandomMixin):
 
     '''ordering mixin'''
+
+    __slots__ = ()
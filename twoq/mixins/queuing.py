@@ -1,15 +1,158 @@
 # -*- coding: utf-8 -*-
 '''twoq queuing mixins'''
 
-from threading import local
+import mmap
+from struct import Struct
+
+from twoq.support import xrange
 
 __all__ = ['QueueingMixin']
 
+###############################################################################
+## file subroutines ###########################################################
+###############################################################################
+
+
+def mapped(path, _mmap=mmap.mmap):
+    '''
+    read-only memory map of a file or `None` if the file is empty
+
+    @param path: file path
+    '''
+    with open(path, 'rb') as handle:
+        try:
+            return _mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files can't be mapped
+            return None
+
+
+def viewer(data):
+    '''
+    callable slicing data between two offsets without copying it
+
+    @param data: memory map
+    '''
+    try:
+        view = memoryview(data)
+    except TypeError:
+        # python 2 maps only have the old buffer interface
+        return lambda start, stop: buffer(  # @UndefinedVariable
+            data, start, stop - start,
+        )
+    return lambda start, stop: view[start:stop]
+
+
+def maplines(path, newline=b'\n'):
+    '''
+    views of each line in a file, without line endings
+
+    @param path: file path
+    @param newline: line ending (default: line feed)
+    '''
+    data = mapped(path)
+    if data is None:
+        return
+    view, find, size, step = viewer(data), data.find, len(data), len(newline)
+    start = 0
+    while start < size:
+        stop = find(newline, start)
+        if stop == -1:
+            yield view(start, size)
+            return
+        yield view(start, stop)
+        start = stop + step
+
+
+def maprecords(path, size, _xrange=xrange):
+    '''
+    views of each fixed-width record in a file
+
+    @param path: file path
+    @param size: bytes per record
+    '''
+    data = mapped(path)
+    if data is None:
+        return
+    length = len(data)
+    if length % size:
+        raise ValueError(
+            '%d bytes is not a whole number of %d byte records' % (
+                length, size,
+            )
+        )
+    view = viewer(data)
+    for start in _xrange(0, length, size):
+        yield view(start, start + size)
+
 
-class QueueingMixin(local):
+def mapframes(path, prefix='<I', _Struct=Struct):
+    '''
+    views of each frame in a file of frames preceded by their length
+
+    @param path: file path
+    @param prefix: struct format of length prefix (default: '<I')
+    '''
+    data = mapped(path)
+    if data is None:
+        return
+    header = _Struct(prefix)
+    view, unpack, width = viewer(data), header.unpack_from, header.size
+    length = len(data)
+    start = 0
+    while start < length:
+        stop = start + width
+        if stop > length:
+            raise ValueError('truncated length prefix at byte %d' % start)
+        start, stop = stop, stop + unpack(data, start)[0]
+        if stop > length:
+            raise ValueError('truncated frame at byte %d' % start)
+        yield view(start, stop)
+        start = stop
+
+
+def mapwrite(path, things, newline=None, prefix=None, _Struct=Struct):
+    '''
+    write bytes-like things to a file in one memory-mapped pass
+
+    @param path: file path
+    @param things: bytes-like things
+    @param newline: line ending written after each thing (default: None)
+    @param prefix: struct format of length written before each thing
+        (default: None)
+    '''
+    things = list(things)
+    pack = _Struct(prefix).pack if prefix is not None else None
+    extra = len(newline or b'') + (_Struct(prefix).size if pack else 0)
+    total = sum(len(thing) for thing in things) + extra * len(things)
+    with open(path, 'w+b') as handle:
+        if not total:
+            return
+        handle.truncate(total)
+        data = mmap.mmap(handle.fileno(), total)
+        try:
+            write = data.write
+            for thing in things:
+                if pack is not None:
+                    write(pack(len(thing)))
+                write(thing)
+                if newline:
+                    write(newline)
+            data.flush()
+        finally:
+            data.close()
+
+###############################################################################
+## queuing mixins #############################################################
+###############################################################################
+
+
+class QueueingMixin(object):
 
     '''queuing mixin'''
 
+    __slots__ = ()
+
     def __init__(self, incoming, outgoing):
         '''
         init
@@ -24,6 +167,10 @@ class QueueingMixin(local):
         self._args = ()
         # callable keyword arguments stub
         self._kw = {}
+        # number of things per chunk passed to callable
+        self._batch = None
+        # array typecode for chunks
+        self._typecode = None
         # incoming queue
         self.incoming = incoming
         # outgoing queue
@@ -33,6 +180,65 @@ class QueueingMixin(local):
         '''outgoing things iterator'''
         return iter(self.outgoing)
 
+    ###########################################################################
+    ## files ##################################################################
+    ###########################################################################
+
+    @classmethod
+    def _fromiter(cls, things):
+        '''
+        queue with things as incoming things
+
+        @param things: an iterable
+        '''
+        return cls().extend(things)
+
+    @classmethod
+    def fromlines(cls, path, newline=b'\n', _maplines=maplines):
+        '''
+        queue of memory views of each line in a memory-mapped file
+
+        @param path: file path
+        @param newline: line ending (default: line feed)
+        '''
+        return cls._fromiter(_maplines(path, newline))
+
+    @classmethod
+    def fromrecords(cls, path, size, _maprecords=maprecords):
+        '''
+        queue of memory views of each fixed-width record in a memory-mapped
+        file
+
+        @param path: file path
+        @param size: bytes per record
+        '''
+        return cls._fromiter(_maprecords(path, size))
+
+    @classmethod
+    def fromframes(cls, path, prefix='<I', _mapframes=mapframes):
+        '''
+        queue of memory views of each length-prefixed frame in a
+        memory-mapped file
+
+        @param path: file path
+        @param prefix: struct format of length prefix (default: '<I')
+        '''
+        return cls._fromiter(_mapframes(path, prefix))
+
+    def tofile(self, path, newline=None, prefix=None, _mapwrite=mapwrite):
+        '''
+        write bytes-like outgoing things to a memory-mapped file
+
+        @param path: file path
+        @param newline: line ending written after each thing (default: None)
+        @param prefix: struct format of length written before each thing
+            (default: None)
+        '''
+        _mapwrite(path, self.outgoing, newline, prefix)
+        return self
+
+    _otofile = tofile
+
     ###########################################################################
     ## queue management #######################################################
     ###########################################################################
@@ -47,6 +253,20 @@ class QueueingMixin(local):
 
     _oargs = args
 
+    def batch(self, n=None, typecode=None):
+        '''
+        pass chunks of incoming things to call instead of single things
+
+        @param n: number of things per chunk (default: None, no chunks)
+        @param typecode: make chunks arrays with this typecode (default: None,
+            lists)
+        '''
+        self._batch = n
+        self._typecode = typecode
+        return self
+
+    _obatch = batch
+
     def tap(self, call):
         '''
         add call
@@ -57,6 +277,8 @@ class QueueingMixin(local):
         self._args = ()
         # reset keyword arguments
         self._kw = {}
+        # reset chunking so it only lasts until the next call
+        self._batch = self._typecode = None
         # add the callable
         self._call = call
         return self
@@ -69,6 +291,8 @@ class QueueingMixin(local):
         self._args = ()
         # reset keyword arguments
         self._kw = {}
+        # reset chunking
+        self._batch = self._typecode = None
         # reset callable
         self._call = None
         return self
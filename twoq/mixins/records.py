@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+'''twoq record mixins'''
+
+import operator as op
+import itertools as it
+
+from twoq import support as ct
+
+__all__ = ('RecordMixin',)
+
+###############################################################################
+## record mixins ##############################################################
+###############################################################################
+
+
+class RecordMixin(object):
+
+    '''
+    collecting and ordering mixin working on one column per field while
+    incoming rows are kept as columns, keeping rows sorted or made unique as
+    columns for the next step
+    '''
+
+    __slots__ = ()
+
+    # field names and the call they were tapped as
+    _field = None
+
+    def _names(self):
+        '''field names call stands for or `None` without columns'''
+        field = self._field
+        if field is None or field[1] is not self._call:
+            return None
+        if not getattr(self.incoming, 'columnar', False):
+            return None
+        return field[0]
+
+    def field(self, *names):
+        '''
+        add call getting items of incoming things by item `*names`
+
+        @param names: field names
+        '''
+        self.tap(op.itemgetter(*names))
+        self._field = (names, self._call)
+        return self
+
+    _ofield = field
+
+    def pluck(self, *keys):
+        '''items of incoming things by item `*keys`'''
+        if not getattr(self.incoming, 'columnar', False):
+            return super(RecordMixin, self).pluck(*keys)
+        with self._sync as sync:
+            sync(sync.iterable.select(keys))
+        return self
+
+    _opluck = pluck
+
+    def group(self, _groupby=it.groupby, _getr=op.itemgetter(1)):
+        '''group incoming things using _call for key function'''
+        names = self._names()
+        if names is None:
+            return super(RecordMixin, self).group()
+        with self._sync as sync:
+            table = sync.iterable
+            # rebuild rows once instead of once per group
+            rows = list(table)
+            for key, indices in _groupby(
+                enumerate(table.keys(names)), _getr,
+            ):
+                sync.append([key, [rows[i] for i, _ in indices]])
+        return self
+
+    _ogroup = group
+
+    def sort(self, budget=None, _sorted=sorted, _range=ct.xrange):
+        '''
+        sort incoming things using call for key function
+
+        @param budget: sort holding at most this many things in memory,
+            spilling the rest to temporary files (default: None)
+        '''
+        names = self._names()
+        if names is None or budget is not None:
+            return super(RecordMixin, self).sort(budget)
+        with self._sync as sync:
+            table = sync.iterable
+            keys = table.keys(names)
+            self._outbind(
+                table.take(_sorted(_range(len(keys)), key=keys.__getitem__))
+            )
+        return self
+
+    _osort = sort
+
+    def unique(self, _set=set):
+        '''
+        list unique incoming things, preserving order and remember all incoming
+        things ever seen
+        '''
+        names = self._names()
+        if names is None:
+            return super(RecordMixin, self).unique()
+        with self._sync as sync:
+            table = sync.iterable
+            seen = _set()
+            indices = []
+            for index, key in enumerate(table.keys(names)):
+                if key not in seen:
+                    seen.add(key)
+                    indices.append(index)
+            self._outbind(table.take(indices))
+        return self
+
+    _ounique = unique
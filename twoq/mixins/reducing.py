@@ -6,7 +6,7 @@ import heapq as hq
 import operator as op
 import itertools as it
 import functools as ft
-from threading import local
+from random import choice
 from functools import partial
 from collections import Iterable
 
@@ -14,6 +14,25 @@ from twoq import support as ct
 
 __all__ = ('MathMixin', 'ReducingMixin', 'TruthMixin', 'ReduceMixin')
 isum = sum
+# things per chunk when reducing incoming things in bounded memory
+CHUNK = 1024
+# if things of a class are containers smash flattens, by class
+CONTAINERS = {}
+# start, step, merge and finish calls by aggregate name
+AGGREGATES = dict(
+    count=(lambda x: 1, lambda s, x: s + 1, op.add, None),
+    sum=(lambda x: x, op.add, op.add, None),
+    min=(lambda x: x, min, min, None),
+    max=(lambda x: x, max, max, None),
+    mean=(
+        lambda x: (x, 1),
+        lambda s, x: (s[0] + x, s[1] + 1),
+        lambda s, t: (s[0] + t[0], s[1] + t[1]),
+        lambda s: op.truediv(*s),
+    ),
+    first=(lambda x: x, lambda s, x: s, lambda s, t: s, None),
+    last=(lambda x: x, lambda s, x: x, lambda s, t: t, None),
+)
 
 ###############################################################################
 ## reducing subroutines #######################################################
@@ -37,33 +56,290 @@ def roundrobin(iterable, s=it.islice, c=it.cycle, p=partial, _i=iter, n=next):
             nexts = c(s(nexts, pending))
 
 
-def smash(iterable, _isstring=ct.port.isstring, _Iterable=Iterable):
+def smash(
+    iterable, depth=None, _isstring=ct.port.isstring, _Iterable=Iterable,
+    _containers=CONTAINERS, _iter=iter, _len=len,
+):
     '''
     flatten deeply nested iterable
 
     @param iterable: an iterable
+    @param depth: number of nesting levels to flatten (default: None, all)
     '''
-    for i in iterable:
-        if isinstance(i, _Iterable) and not _isstring(i):
-            for j in smash(i):
-                yield j
+    # one iterator per level being flattened instead of one generator
+    stack = [_iter(iterable)]
+    push, pop = stack.append, stack.pop
+    while stack:
+        for thing in stack[-1]:
+            kind = thing.__class__
+            try:
+                container = _containers[kind]
+            except KeyError:
+                container = _containers[kind] = (
+                    isinstance(thing, _Iterable) and not _isstring(thing)
+                )
+            if container and (depth is None or _len(stack) <= depth):
+                push(_iter(thing))
+                break
+            yield thing
         else:
-            yield i
+            pop()
+
+
+def chunks(iterable, size=CHUNK, _islice=it.islice, _list=list):
+    '''
+    lists of at most `size` things from iterable
+
+    @param iterable: an iterable
+    @param size: things per chunk (default: CHUNK)
+    '''
+    iterable = iter(iterable)
+    return iter(lambda: _list(_islice(iterable, size)), [])
+
+
+def average(iterable, _sum=isum, _len=len, _chunks=chunks):
+    '''
+    mean of iterable in one pass
+
+    @param iterable: an iterable
+    '''
+    # running count and total instead of holding on to things
+    total, count = 0.0, 0
+    for chunk in _chunks(iterable):
+        total += _sum(chunk)
+        count += _len(chunk)
+    return op.truediv(total, count)
+
+
+def extrema(iterable, _min=min, _max=max, _chunks=chunks):
+    '''
+    minimum and maximum of iterable in one pass
+
+    @param iterable: an iterable
+    '''
+    chunked = _chunks(iterable)
+    chunk = next(chunked, None)
+    if chunk is None:
+        raise ValueError('min() arg is an empty sequence')
+    low, high = _min(chunk), _max(chunk)
+    for chunk in chunked:
+        low, high = _min(low, _min(chunk)), _max(high, _max(chunk))
+    return low, high
+
+
+def select(things, k, _choice=choice, _len=len):
+    '''
+    kth smallest thing in a list of things using quickselect
+
+    @param things: a list
+    @param k: zero-based rank
+    '''
+    while True:
+        pivot = _choice(things)
+        lower = [i for i in things if i < pivot]
+        if k < _len(lower):
+            things = lower
+            continue
+        upper = [i for i in things if i > pivot]
+        equal = _len(things) - _len(lower) - _len(upper)
+        if k < _len(lower) + equal:
+            return pivot
+        k -= _len(lower) + equal
+        things = upper
+
+
+def median(iterable, _select=select, _list=list, _len=len):
+    '''
+    median of iterable without sorting it
+
+    @param iterable: an iterable
+    '''
+    things = _list(iterable)
+    length = _len(things)
+    middle = _select(things, length // 2)
+    if length % 2:
+        return middle
+    return op.truediv(_select(things, length // 2 - 1) + middle, 2)
+
+
+def p2median(iterable, _sorted=sorted, _islice=it.islice, _range=ct.xrange):
+    '''
+    approximate median of iterable in constant memory using the P-square
+    algorithm
+
+    @param iterable: an iterable
+    '''
+    iterable = iter(iterable)
+    heights = _sorted(_islice(iterable, 5))
+    if len(heights) < 5:
+        return median(heights)
+    # actual and desired marker positions
+    positions = [0, 1, 2, 3, 4]
+    desired = [0.0, 1.0, 2.0, 3.0, 4.0]
+    increments = (0.0, 0.25, 0.5, 0.75, 1.0)
+    for thing in iterable:
+        if thing < heights[0]:
+            heights[0] = thing
+            k = 0
+        elif thing >= heights[4]:
+            heights[4] = thing
+            k = 3
+        else:
+            k = 0
+            while thing >= heights[k + 1]:
+                k += 1
+        for i in _range(k + 1, 5):
+            positions[i] += 1
+        for i in _range(5):
+            desired[i] += increments[i]
+        # move middle markers that drifted from their desired positions
+        for i in _range(1, 4):
+            d = desired[i] - positions[i]
+            if (
+                (d >= 1 and positions[i + 1] - positions[i] > 1) or
+                (d <= -1 and positions[i - 1] - positions[i] < -1)
+            ):
+                d = 1 if d > 0 else -1
+                n, n1, n0 = positions[i], positions[i + 1], positions[i - 1]
+                q, q1, q0 = heights[i], heights[i + 1], heights[i - 1]
+                # parabolic prediction
+                height = q + op.truediv(d, n1 - n0) * (
+                    op.truediv((n - n0 + d) * (q1 - q), n1 - n) +
+                    op.truediv((n1 - n - d) * (q - q0), n - n0)
+                )
+                if not q0 < height < q1:
+                    # fall back to linear prediction
+                    j = i + d
+                    height = q + op.truediv(
+                        d * (heights[j] - q), positions[j] - n,
+                    )
+                heights[i] = height
+                positions[i] = n + d
+    return heights[2]
+
+
+def heavyhitters(iterable, counters):
+    '''
+    approximate counts of the most frequent things in iterable using at most
+    `counters` counters (Misra-Gries), keeping the last thing with a count
+    of 0 if every counter cancels out
+
+    @param iterable: an iterable
+    @param counters: number of counters
+    '''
+    counts = {}
+    thing = marker = object()
+    for thing in iterable:
+        if thing in counts:
+            counts[thing] += 1
+        elif len(counts) < counters:
+            counts[thing] = 1
+        else:
+            # decrement every counter and drop exhausted ones
+            for key in list(counts):
+                if counts[key] == 1:
+                    del counts[key]
+                else:
+                    counts[key] -= 1
+    if not counts and thing is not marker:
+        counts[thing] = 0
+    return counts
+
+
+def aggregators(specs, _isstring=ct.port.isstring, _aggregates=AGGREGATES):
+    '''
+    value, start, step, merge and finish calls for each aggregate spec
+
+    @param specs: aggregate names or (name, call getting the value to
+        aggregate from a thing) pairs
+    '''
+    calls = []
+    for spec in specs:
+        name, value = (spec, None) if _isstring(spec) else spec
+        if name not in _aggregates:
+            raise ValueError('unknown aggregate %r' % (name,))
+        calls.append((value,) + _aggregates[name])
+    return calls
+
+
+def fold(iterable, key, calls):
+    '''
+    partial aggregate states of things in iterable for each key in one pass,
+    in the order keys are first seen
+
+    @param iterable: an iterable
+    @param key: key function or `None` to key things by themselves
+    @param calls: aggregate calls
+    '''
+    starts = [call[1] for call in calls]
+    steps = list(enumerate(call[2] for call in calls))
+    values = [call[0] for call in calls]
+    states = {}
+    order = []
+    for thing in iterable:
+        k = thing if key is None else key(thing)
+        things = [thing if v is None else v(thing) for v in values]
+        state = states.get(k)
+        if state is None:
+            order.append(k)
+            states[k] = [start(x) for start, x in ct.zip(starts, things)]
+        else:
+            for i, step in steps:
+                state[i] = step(state[i], things[i])
+    return [[k, states[k]] for k in order]
+
+
+def combine(partials, calls):
+    '''
+    merge partial aggregate states for the same key
+
+    @param partials: iterable of [key, states] pairs
+    @param calls: aggregate calls
+    '''
+    merges = [call[3] for call in calls]
+    states = {}
+    order = []
+    for k, state in partials:
+        if k not in states:
+            order.append(k)
+            states[k] = list(state)
+        else:
+            merged = states[k]
+            for i, merge in enumerate(merges):
+                merged[i] = merge(merged[i], state[i])
+    return [[k, states[k]] for k in order]
+
+
+def finish(partials, calls):
+    '''
+    final aggregates from partial aggregate states, one value per key for one
+    aggregate or a list of values for more
+
+    @param partials: iterable of [key, states] pairs
+    @param calls: aggregate calls
+    '''
+    finishes = [call[4] for call in calls]
+    for k, state in partials:
+        values = [
+            s if end is None else end(s) for end, s in ct.zip(finishes, state)
+        ]
+        yield [k, values[0] if len(values) == 1 else values]
 
 ###############################################################################
 ## reducing mixins ############################################################
 ###############################################################################
 
 
-class MathMixin(local):
+class MathMixin(object):
 
     '''math mixin'''
 
-    def average(self, _sum=isum, _truediv=op.truediv, _len=len):
+    __slots__ = ()
+
+    def average(self, _average=average):
         '''average of all incoming things'''
         with self._sync as sync:
-            iterable1, iterable2 = it.tee(sync.iterable)
-            sync.append(_truediv(_sum(iterable1, 0.0), _len(list(iterable2))))
+            sync.append(_average(sync.iterable))
         return self
 
     _oaverage = average
@@ -91,13 +367,14 @@ class MathMixin(local):
 
     _omax = max
 
-    def median(self, _div=op.truediv, _len=len, _srt=sorted, _l=list, _i=int):
-        '''mean of incoming things'''
+    def median(self, approx=False, _median=median, _p2median=p2median):
+        '''
+        median of incoming things
+
+        @param approx: estimate median in constant memory (default: False)
+        '''
         with self._sync as sync:
-            i = list(_srt(sync.iterable))
-            e = _div(_len(i) - 1, 2)
-            p = _i(e)
-            sync.append(i[p] if e % 2 == 0 else _div(i[p] + i[p + 1], 2))
+            sync.append((_p2median if approx else _median)(sync.iterable))
         return self
 
     _omedian = median
@@ -113,27 +390,36 @@ class MathMixin(local):
 
     _omin = min
 
-    def minmax(self):
+    def minmax(self, _extrema=extrema):
         '''minimum and maximum values among incoming things'''
         with self._sync as sync:
-            iterable1, iterable2 = it.tee(sync.iterable)
-            sync(iter([min(iterable1), max(iterable2)]))
+            sync(_extrema(sync.iterable))
         return self
 
     _minmax = minmax
 
-    def mode(self, _cnt=ct.Counter):
-        '''mode of incoming things'''
+    def mode(self, counters=None, _cnt=ct.Counter, _hitters=heavyhitters):
+        '''
+        mode of incoming things
+
+        @param counters: estimate mode with this many counters (default: None)
+        '''
         with self._sync as sync:
-            sync.append(_cnt(sync.iterable).most_common(1)[0][0])
+            if counters is None:
+                sync.append(_cnt(sync.iterable).most_common(1)[0][0])
+            else:
+                counts = _hitters(sync.iterable, counters)
+                sync.append(max(counts, key=counts.__getitem__))
         return self
 
     _omode = mode
 
-    def uncommon(self, _cnt=ct.Counter):
+    def uncommon(self, _cnt=ct.Counter, _getr=op.itemgetter(1)):
         '''least common incoming thing'''
         with self._sync as sync:
-            sync.append(_cnt(sync.iterable).most_common()[:-2:-1][0][0])
+            # last of the least common things without sorting every count
+            counts = list(_cnt(sync.iterable).items())
+            sync.append(min(reversed(counts), key=_getr)[0])
         return self
 
     _ouncommon = uncommon
@@ -146,11 +432,11 @@ class MathMixin(local):
 
     _ofrequency = frequency
 
-    def statrange(self, _srt=sorted, _list=list):
+    def statrange(self, _extrema=extrema):
         '''statistical range of incoming things'''
         with self._sync as sync:
-            iterz = _list(_srt(sync.iterable))
-            sync.append(iterz[-1] - iterz[0])
+            low, high = _extrema(sync.iterable)
+            sync.append(high - low)
         return self
 
     _ostatrange = statrange
@@ -168,10 +454,54 @@ class MathMixin(local):
     _osum = sum
 
 
-class ReducingMixin(local):
+class ReducingMixin(object):
 
     '''reduce mixin'''
 
+    __slots__ = ()
+
+    def aggregate(self, *specs):
+        '''
+        aggregate incoming things by key using _call for key function
+
+        @param specs: aggregate names (count, sum, min, max, mean, first,
+            last) or (name, call getting the value to aggregate from a thing)
+            pairs
+        '''
+        calls = aggregators(specs)
+        with self._sync as sync:
+            sync(finish(fold(sync.iterable, self._call, calls), calls))
+        return self
+
+    _oaggregate = aggregate
+
+    def preaggregate(self, *specs):
+        '''
+        partial aggregate states of incoming things by key using _call for
+        key function, to be merged later with `combine`
+
+        @param specs: aggregate specs
+        '''
+        calls = aggregators(specs)
+        with self._sync as sync:
+            sync(fold(sync.iterable, self._call, calls))
+        return self
+
+    _opreaggregate = preaggregate
+
+    def combine(self, *specs):
+        '''
+        merge incoming partial aggregate states into final aggregates
+
+        @param specs: aggregate specs the partial states were built with
+        '''
+        calls = aggregators(specs)
+        with self._sync as sync:
+            sync(finish(combine(sync.iterable, calls), calls))
+        return self
+
+    _ocombine = combine
+
     def merge(self, _merge=hq.merge):
         '''flatten nested and ordered incoming things'''
         with self._sync as sync:
@@ -180,10 +510,14 @@ class ReducingMixin(local):
 
     _omerge = merge
 
-    def smash(self, _smash=smash):
-        '''flatten deeply nested incoming things'''
+    def smash(self, depth=None, _smash=smash):
+        '''
+        flatten deeply nested incoming things
+
+        @param depth: number of nesting levels to flatten (default: None, all)
+        '''
         with self._sync as sync:
-            sync(_smash(sync.iterable))
+            sync(_smash(sync.iterable, depth))
         return self
 
     _osmash = flatten = smash
@@ -258,10 +592,12 @@ class ReducingMixin(local):
     _ozip = zip
 
 
-class TruthMixin(local):
+class TruthMixin(object):
 
     '''truth mixin'''
 
+    __slots__ = ()
+
     def all(self, _all=all, _map=ct.map):
         '''if `all` incoming things are `True`'''
         with self._sync as sync:
@@ -302,3 +638,5 @@ class TruthMixin(local):
 class ReduceMixin(MathMixin, ReducingMixin, TruthMixin):
 
     '''reducing mixin'''
+
+    __slots__ = ()
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+'''twoq numeric queues'''
+
+from inspect import ismodule
+
+from twoq.support import port
+from twoq.mixins.mapping import MapMixin
+from twoq.mixins.reducing import ReduceMixin
+from twoq.mixins.ordering import OrderMixin
+from twoq.mixins.numeric import NumericMixin
+from twoq.mixins.filtering import FilterMixin
+
+from twoq.active.mixins import AutoQMixin, ManQMixin, SyncQMixin
+
+###############################################################################
+## numeric queues #############################################################
+###############################################################################
+
+
+class anumq(
+    AutoQMixin, NumericMixin, FilterMixin, MapMixin, ReduceMixin, OrderMixin,
+):
+
+    '''auto-balanced queue of numbers in a contiguous buffer'''
+
+numq = anumq
+
+
+class mnumq(
+    ManQMixin, NumericMixin, FilterMixin, MapMixin, ReduceMixin, OrderMixin,
+):
+
+    '''manually balanced queue of numbers in a contiguous buffer'''
+
+
+class snumq(
+    SyncQMixin, NumericMixin, FilterMixin, MapMixin, ReduceMixin, OrderMixin,
+):
+
+    '''autosynchronized queue of numbers in a contiguous buffer'''
+
+
+__all__ = sorted(name for name, obj in port.items(locals()) if not any([
+    name.startswith('_'), ismodule(obj),
+]))
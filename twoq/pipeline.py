@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+'''twoq multi-process pipelines'''
+
+from time import time
+from threading import Thread
+from traceback import format_exc
+from multiprocessing import Array, Process, Queue, Value
+
+from twoq.mixins.reducing import chunks
+from twoq.active.queuing import autoq
+
+__all__ = ('pipeline',)
+# stage counters by position in a stage's counter array
+BATCHES, INCOMING, OUTGOING, SECONDS = 0, 1, 2, 3
+# put by each producer after its last batch
+DONE = 'done'
+
+###############################################################################
+## pipeline subroutines #######################################################
+###############################################################################
+
+
+def feed(iterable, inbox, size, _chunks=chunks):
+    '''
+    put numbered batches of things from iterable into the first buffer
+
+    @param iterable: an iterable
+    @param inbox: first stage's buffer
+    @param size: things per batch
+    '''
+    number = 0
+    try:
+        for batch in _chunks(iterable, size):
+            inbox.put((number, batch, None))
+            number += 1
+    except Exception:
+        # fail at the pipeline's end instead of leaving workers waiting
+        inbox.put((number, [], 'input\n%s' % format_exc()))
+    finally:
+        inbox.put(DONE)
+
+
+def work(name, call, qclass, inbox, outbox, counters, remaining, workers):
+    '''
+    run stage chain on each batch from one buffer and put its outgoing things
+    into the next buffer
+
+    @param name: stage name
+    @param call: callable taking a queue of a batch's things and returning a
+        queue, or `None` to use the queue it was passed
+    @param qclass: queue class
+    @param inbox: this stage's buffer
+    @param outbox: next stage's buffer
+    @param counters: this stage's shared counters
+    @param remaining: number of producers for this stage's buffer still
+        putting batches
+    @param workers: number of workers in this stage
+    '''
+    for batch in iter(inbox.get, None):
+        if batch == DONE:
+            # a producer's batches are ahead of its marker in the buffer so
+            # every batch was taken once the last marker is
+            with remaining.get_lock():
+                remaining.value -= 1
+                last = not remaining.value
+            if last:
+                for _ in range(workers):
+                    inbox.put(None)
+            continue
+        number, things, error = batch
+        # pass failed batches on untouched so the pipeline's end raises
+        if error is None:
+            start = time()
+            try:
+                queue = qclass().extend(things)
+                result = call(queue)
+                results = list((queue if result is None else result).outgoing)
+            except Exception:
+                results, error = [], 'stage %s\n%s' % (name, format_exc())
+            elapsed = time() - start
+            with counters.get_lock():
+                counters[BATCHES] += 1
+                counters[INCOMING] += len(things)
+                counters[OUTGOING] += len(results)
+                counters[SECONDS] += elapsed
+            things = results
+        outbox.put((number, things, error))
+    # goes through the same pipe after this worker's batches
+    outbox.put(DONE)
+
+###############################################################################
+## pipelines ##################################################################
+###############################################################################
+
+
+class pipeline(object):
+
+    '''
+    chain of stages each running a twoq chain over batches of things in its
+    own worker processes, connected by bounded buffers
+    '''
+
+    def __init__(self, batch=256, maxsize=8, ordered=True):
+        '''
+        init
+
+        @param batch: things per batch (default: 256)
+        @param maxsize: batches each buffer holds before putting blocks
+            (default: 8)
+        @param ordered: keep incoming order (default: True)
+        '''
+        super(pipeline, self).__init__()
+        self._batch = batch
+        self._maxsize = maxsize
+        self._ordered = ordered
+        self._stages = []
+
+    def stage(self, call, workers=1, qclass=autoq, name=None):
+        '''
+        add stage
+
+        @param call: callable taking a queue of a batch's things and
+            returning a queue, or `None` to use the queue it was passed, e.g.
+            `lambda q: q.tap(parse).map()`; must be picklable where worker
+            processes are spawned instead of forked
+        @param workers: number of worker processes (default: 1)
+        @param qclass: queue class the batch is loaded into (default: autoq)
+        @param name: stage name (default: None, name of call)
+        '''
+        if name is None:
+            name = getattr(call, '__name__', 'stage%d' % len(self._stages))
+        self._stages.append((name, call, workers, qclass, Array('d', 4)))
+        return self
+
+    @property
+    def counters(self):
+        '''things and seconds spent per stage so far'''
+        stats = []
+        for name, _, workers, _, counters in self._stages:
+            with counters.get_lock():
+                batches, incoming, outgoing, seconds = counters[:]
+            stats.append(dict(
+                name=name,
+                workers=workers,
+                batches=int(batches),
+                incoming=int(incoming),
+                outgoing=int(outgoing),
+                seconds=seconds,
+                # outgoing things per second of work
+                rate=outgoing / seconds if seconds else 0.0,
+            ))
+        return stats
+
+    def results(self, iterable):
+        '''
+        run iterable through every stage, yielding things from the last stage
+
+        @param iterable: an iterable
+        '''
+        stages = self._stages
+        if not stages:
+            raise ValueError('pipeline has no stages')
+        buffers = [Queue(self._maxsize) for _ in range(len(stages) + 1)]
+        # producers per buffer: the feeder, then each stage's workers
+        producers = [1] + [stage[2] for stage in stages]
+        # hold on to shared values so their memory is not reused mid run
+        remaining = [Value('i', count) for count in producers[:-1]]
+        processes = []
+        for index, stage in enumerate(stages):
+            name, call, workers, qclass, counters = stage
+            for _ in range(workers):
+                process = Process(target=work, args=(
+                    name, call, qclass, buffers[index], buffers[index + 1],
+                    counters, remaining[index], workers,
+                ))
+                process.daemon = True
+                process.start()
+                processes.append(process)
+        feeder = Thread(target=feed, args=(iterable, buffers[0], self._batch))
+        feeder.daemon = True
+        feeder.start()
+        finished = False
+        try:
+            for things in self._collect(buffers[-1], producers[-1]):
+                for thing in things:
+                    yield thing
+            finished = True
+        finally:
+            for process in processes:
+                if finished:
+                    process.join()
+                else:
+                    process.terminate()
+
+    def _collect(self, outbox, producers):
+        '''
+        batches from the last buffer, in incoming order if ordered
+
+        @param outbox: last stage's buffer
+        @param producers: number of workers in the last stage
+        '''
+        ordered = self._ordered
+        pending = {}
+        expected = 0
+        while producers:
+            batch = outbox.get()
+            if batch == DONE:
+                producers -= 1
+                continue
+            number, things, error = batch
+            pending[number] = (things, error)
+            if not ordered:
+                expected = number
+            while expected in pending:
+                things, error = pending.pop(expected)
+                expected += 1
+                if error is not None:
+                    raise RuntimeError('pipeline failed in ' + error)
+                yield things
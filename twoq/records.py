@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+'''twoq record queues'''
+
+from inspect import ismodule
+from collections import deque
+
+from twoq.support import port
+from twoq.mixins.mapping import MapMixin
+from twoq.mixins.reducing import ReduceMixin
+from twoq.mixins.ordering import OrderMixin
+from twoq.mixins.records import RecordMixin
+from twoq.mixins.filtering import FilterMixin
+
+from twoq.active.storage import RecordTable
+from twoq.active.mixins import AutoQMixin, ManQMixin, SyncQMixin
+
+###############################################################################
+## record queues ##############################################################
+###############################################################################
+
+
+class arecordq(
+    AutoQMixin, RecordMixin, FilterMixin, MapMixin, ReduceMixin, OrderMixin,
+):
+
+    '''
+    auto-balanced queue of mapping rows kept as columns, handing back rows as
+    new dicts
+    '''
+
+    _storage = RecordTable
+    _outstorage = deque
+
+recordq = arecordq
+
+
+class mrecordq(
+    ManQMixin, RecordMixin, FilterMixin, MapMixin, ReduceMixin, OrderMixin,
+):
+
+    '''
+    manually balanced queue of mapping rows kept as columns, handing back
+    rows as new dicts
+    '''
+
+    _storage = RecordTable
+    _outstorage = deque
+
+
+class srecordq(
+    SyncQMixin, RecordMixin, FilterMixin, MapMixin, ReduceMixin, OrderMixin,
+):
+
+    '''
+    autosynchronized queue of mapping rows kept as columns, handing back
+    rows as new dicts
+    '''
+
+    _storage = RecordTable
+    _outstorage = deque
+
+
+__all__ = sorted(name for name, obj in port.items(locals()) if not any([
+    name.startswith('_'), ismodule(obj),
+]))
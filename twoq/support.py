@@ -4,9 +4,19 @@
 from stuf import six
 # pylint: disable-msg=f0401,w0611
 from stuf.six.moves import (
-    map, filterfalse, filter, zip, zip_longest, xrange)  # @UnresolvedImport @UnusedImport @IgnorePep8
+    map, filterfalse, filter, zip, zip_longest, xrange, cPickle, queue)  # @UnresolvedImport @UnusedImport @IgnorePep8
 # pylint: enable-msg=f0401
 
+try:
+    from concurrent import futures
+except ImportError:
+    futures = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 __all__ = ['port']
 items = six.items
 
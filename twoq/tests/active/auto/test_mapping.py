@@ -5,6 +5,7 @@ try:
 except ImportError:
     import unittest
 
+from twoq.support import futures
 #pylint: disable-msg=w0614,w0401
 from twoq.tests.mixins.auto.mapping import *  # @UnusedWildImport
 from twoq.tests.mixins.auto.queuing import AQMixin
@@ -65,5 +66,38 @@ class TestSyncDelayQ(unittest.TestCase, AQMixin, ADelayQMixin):
         from twoq.active.mapping import sdelayq
         self.qclass = sdelayq
 
+
+@unittest.skipIf(futures is None, 'concurrent.futures unavailable')
+class TestAutoParallelQ(unittest.TestCase, AQMixin, AParallelQMixin):
+
+    def setUp(self):
+        from twoq.active.mapping import aparallelq
+        self.qclass = aparallelq
+
+
+@unittest.skipIf(futures is None, 'concurrent.futures unavailable')
+class TestSyncParallelQ(unittest.TestCase, AQMixin, AParallelQMixin):
+
+    def setUp(self):
+        from twoq.active.mapping import sparallelq
+        self.qclass = sparallelq
+
+
+@unittest.skipIf(futures is None, 'concurrent.futures unavailable')
+class TestAutoThrottleQ(unittest.TestCase, AQMixin, AThrottleQMixin):
+
+    def setUp(self):
+        from twoq.active.mapping import athrottleq
+        self.qclass = athrottleq
+
+
+@unittest.skipIf(futures is None, 'concurrent.futures unavailable')
+class TestSyncThrottleQ(unittest.TestCase, AQMixin, AThrottleQMixin):
+
+    def setUp(self):
+        from twoq.active.mapping import sthrottleq
+        self.qclass = sthrottleq
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+'''numq tests'''
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from twoq import support
+from twoq.tests.mixins.auto.queuing import AQMixin
+from twoq.tests.mixins.auto.numeric import ANumQMixin
+from twoq.tests.mixins.auto.mapping import AMapQMixin
+from twoq.tests.mixins.auto.ordering import AOrderQMixin
+from twoq.tests.mixins.auto.reducing import AReduceQMixin
+from twoq.tests.mixins.auto.filtering import AFilterQMixin
+
+
+class TestAutoNumQ(
+    unittest.TestCase, ANumQMixin, AQMixin, AFilterQMixin, AMapQMixin,
+    AReduceQMixin, AOrderQMixin,
+):
+
+    def setUp(self):
+        from twoq.numeric import anumq
+        self.qclass = anumq
+
+    def test_storage(self):
+        from collections import deque
+        from twoq.active.storage import NumberArray
+        q = self.qclass(1, 2, 3).tap(lambda x: x * 2).map()
+        self.assertTrue(isinstance(q.outgoing, deque))
+        q.sum()
+        self.assertTrue(isinstance(q.incoming, deque))
+        q = self.qclass(1, 2, 3).reverse()
+        self.assertTrue(isinstance(q.incoming, (NumberArray, deque)))
+
+    @unittest.skipIf(support.numpy is None, 'numpy is not installed')
+    def test_vector(self):
+        q = self.qclass(3, 1, 2)
+        self.assertTrue(q._vector(q._array()) is not None)
+        self.assertEqual(q.sort().value(), [1, 2, 3])
+        self.assertEqual(q.sort().median().value(), 2)
+
+
+class TestSyncNumQ(
+    unittest.TestCase, ANumQMixin, AQMixin, AFilterQMixin, AMapQMixin,
+    AReduceQMixin, AOrderQMixin,
+):
+
+    def setUp(self):
+        from twoq.numeric import snumq
+        self.qclass = snumq
+
+
+class TestAutoNumQWithoutNumpy(unittest.TestCase, ANumQMixin):
+
+    def setUp(self):
+        from twoq.numeric import anumq
+        self.qclass = anumq
+        self._numpy, support.numpy = support.numpy, None
+
+    def tearDown(self):
+        support.numpy = self._numpy
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+'''sharedq tests'''
+
+from threading import Thread
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from twoq.support import queue
+
+from twoq.tests.mixins.auto.queuing import AQMixin
+from twoq.tests.mixins.auto.mapping import AMapQMixin
+from twoq.tests.mixins.auto.ordering import AOrderQMixin
+from twoq.tests.mixins.auto.reducing import AReduceQMixin
+from twoq.tests.mixins.auto.filtering import AFilterQMixin
+
+
+class TestSharedQ(
+    unittest.TestCase, AQMixin, AFilterQMixin, AMapQMixin, AReduceQMixin,
+    AOrderQMixin,
+):
+
+    def setUp(self):
+        from twoq.active.queuing import sharedq
+        self.qclass = sharedq
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.qclass(1, 2, 3), '__dict__'))
+
+    # both sides are one buffer so taking things takes them from incoming too
+
+    def test_append_after_map(self):
+        q = self.qclass(1, 2, 3).tap(lambda x: x * 2).map()
+        q.append(7)
+        self.assertEqual(q.value(), [2, 4, 6, 7])
+        self.assertEqual(list(q.incoming), [])
+
+    def test_value_after_map(self):
+        q = self.qclass(1, 2, 3).tap(lambda x: x * 2).map()
+        self.assertEqual(q.value(), [2, 4, 6])
+        self.assertEqual(q.extend([1, 2]).map().value(), [2, 4])
+
+    def test_results_after_map(self):
+        q = self.qclass(1, 2, 3).tap(lambda x: x * 2).map()
+        self.assertEqual(list(q.results()), [2, 4, 6])
+        self.assertEqual(list(q.incoming), [])
+
+    def test_popleft_empty(self):
+        self.assertRaises(queue.Empty, self.qclass().popleft, False)
+        self.assertRaises(queue.Empty, self.qclass().popleft, timeout=0.01)
+        self.assertRaises(queue.Empty, self.qclass().pop, timeout=0.01)
+
+    def test_append_full(self):
+        q = self.qclass().capacity(2).append(1).append(2)
+        self.assertRaises(queue.Full, q.append, 3, False)
+        self.assertRaises(queue.Full, q.appendleft, 3, timeout=0.01)
+        self.assertRaises(queue.Full, q.extend, [3], timeout=0.01)
+        self.assertEqual(q.popleft(), 1)
+        self.assertEqual(q.append(3).value(), [2, 3])
+
+    def test_handoff(self):
+        q = self.qclass().capacity(10)
+        things = []
+
+        def consume():
+            for thing in iter(lambda: q.popleft(timeout=5), None):
+                things.append(thing)
+
+        consumer = Thread(target=consume)
+        consumer.start()
+        q.extend(range(1000)).append(None)
+        consumer.join()
+        self.assertEqual(things, list(range(1000)))
+
+    def test_handoff_steps(self):
+        q = self.qclass().tap(lambda x: x * 2)
+
+        def produce():
+            for i in range(100):
+                q.append(i)
+
+        producers = [Thread(target=produce) for _ in range(4)]
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+        self.assertEqual(sorted(q.map().value()), sorted(
+            i * 2 for i in list(range(100)) * 4
+        ))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+'''slotq tests'''
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from twoq.tests.mixins.auto.queuing import AQMixin
+from twoq.tests.mixins.auto.mapping import AMapQMixin
+from twoq.tests.mixins.auto.ordering import AOrderQMixin
+from twoq.tests.mixins.auto.reducing import AReduceQMixin
+from twoq.tests.mixins.auto.filtering import AFilterQMixin
+
+
+class TestAutoSlotQ(
+    unittest.TestCase, AQMixin, AFilterQMixin, AMapQMixin, AReduceQMixin,
+    AOrderQMixin,
+):
+
+    def setUp(self):
+        from twoq.active.queuing import aslotq
+        self.qclass = aslotq
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.qclass(1, 2, 3), '__dict__'))
+
+
+class TestSyncSlotQ(
+    unittest.TestCase, AQMixin, AFilterQMixin, AMapQMixin, AReduceQMixin,
+    AOrderQMixin,
+):
+
+    def setUp(self):
+        from twoq.active.queuing import sslotq
+        self.qclass = sslotq
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.qclass(1, 2, 3), '__dict__'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@ try:
 except ImportError:
     import unittest
 
+from twoq.support import futures
 #pylint: disable-msg=w0614,w0401
 from twoq.tests.mixins.man.mapping import *  # @UnusedWildImport
 from twoq.tests.mixins.man.queuing import MQMixin
@@ -40,5 +41,21 @@ class TestManDelayQ(unittest.TestCase, MQMixin, MDelayQMixin):
         self.qclass = mdelayq
 
 
+@unittest.skipIf(futures is None, 'concurrent.futures unavailable')
+class TestManParallelQ(unittest.TestCase, MQMixin, MParallelQMixin):
+
+    def setUp(self):
+        from twoq.active.mapping import mparallelq
+        self.qclass = mparallelq
+
+
+@unittest.skipIf(futures is None, 'concurrent.futures unavailable')
+class TestManThrottleQ(unittest.TestCase, MQMixin, MThrottleQMixin):
+
+    def setUp(self):
+        from twoq.active.mapping import mthrottleq
+        self.qclass = mthrottleq
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+'''numq tests'''
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from twoq import support
+from twoq.tests.mixins.man.queuing import MQMixin
+from twoq.tests.mixins.man.numeric import MNumQMixin
+from twoq.tests.mixins.man.mapping import MMapQMixin
+from twoq.tests.mixins.man.ordering import MOrderQMixin
+from twoq.tests.mixins.man.reducing import MReduceQMixin
+from twoq.tests.mixins.man.filtering import MFilterQMixin
+
+
+class TestManNumQ(
+    unittest.TestCase, MNumQMixin, MQMixin, MFilterQMixin, MMapQMixin,
+    MReduceQMixin, MOrderQMixin,
+):
+
+    def setUp(self):
+        from twoq.numeric import mnumq
+        self.qclass = mnumq
+
+
+class TestManNumQWithoutNumpy(unittest.TestCase, MNumQMixin):
+
+    def setUp(self):
+        from twoq.numeric import mnumq
+        self.qclass = mnumq
+        self._numpy, support.numpy = support.numpy, None
+
+    def tearDown(self):
+        support.numpy = self._numpy
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+'''slotq tests'''
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from twoq.tests.mixins.man.queuing import MQMixin
+from twoq.tests.mixins.man.mapping import MMapQMixin
+from twoq.tests.mixins.man.ordering import MOrderQMixin
+from twoq.tests.mixins.man.reducing import MReduceQMixin
+from twoq.tests.mixins.man.filtering import MFilterQMixin
+
+
+class TestManSlotQ(
+    unittest.TestCase, MQMixin, MFilterQMixin, MMapQMixin, MReduceQMixin,
+    MOrderQMixin,
+):
+
+    def setUp(self):
+        from twoq.active.queuing import mslotq
+        self.qclass = mslotq
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.qclass(1, 2, 3), '__dict__'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+'''active storage tests'''
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+
+class TestBlockList(unittest.TestCase):
+
+    def setUp(self):
+        from twoq.active.storage import BlockList
+
+        class blocklist(BlockList):
+            load = 4
+
+        self.qclass = blocklist
+
+    def test_extend(self):
+        things = self.qclass(range(10))
+        things.extend(range(10, 15))
+        self.assertEqual(list(things), list(range(15)))
+        self.assertEqual(len(things), 15)
+        things.extendleft([-1, -2])
+        self.assertEqual(list(things)[:3], [-2, -1, 0])
+        self.assertEqual(len(things), 17)
+
+    def test_getitem(self):
+        things = self.qclass(range(10))
+        self.assertEqual(things[0], 0)
+        self.assertEqual(things[6], 6)
+        self.assertEqual(things[-1], 9)
+        self.assertRaises(IndexError, lambda: things[10])
+
+    def test_insert(self):
+        things = self.qclass(range(10))
+        expected = list(range(10))
+        for index in (3, 3, 3, 3, 3, 3, 0, -2, 100):
+            things.insert(index, 'x')
+            expected.insert(index, 'x')
+        self.assertEqual(list(things), expected)
+        self.assertEqual(len(things), len(expected))
+        self.assertEqual(things[4], expected[4])
+
+    def test_delitem(self):
+        things = self.qclass(range(10))
+        expected = list(range(10))
+        for index in (5, 0, -1, 3, 3, 3):
+            del things[index]
+            del expected[index]
+        self.assertEqual(list(things), expected)
+        self.assertEqual(things[2], expected[2])
+
+    def test_remove_index(self):
+        things = self.qclass([6, 5, 3, 4, 3, 1, 8, 3])
+        self.assertEqual(things.index(3), 2)
+        self.assertEqual(things.index(8), 6)
+        things.remove(3)
+        self.assertEqual(list(things), [6, 5, 4, 3, 1, 8, 3])
+        self.assertEqual(things.count(3), 2)
+        self.assertRaises(ValueError, things.remove, 10)
+        self.assertRaises(ValueError, things.index, 10)
+
+    def test_pop(self):
+        things = self.qclass(range(6))
+        self.assertEqual(things.pop(), 5)
+        self.assertEqual(things.popleft(), 0)
+        self.assertEqual(list(things), [1, 2, 3, 4])
+        things.clear()
+        self.assertRaises(IndexError, things.pop)
+        self.assertRaises(IndexError, things.popleft)
+
+    def test_append(self):
+        things = self.qclass()
+        for i in range(6):
+            things.append(i)
+            things.appendleft(-i)
+        self.assertEqual(
+            list(things), [-5, -4, -3, -2, -1, 0, 0, 1, 2, 3, 4, 5],
+        )
+        self.assertEqual(list(reversed(things))[0], 5)
+        self.assertTrue(-3 in things)
+
+
+class TestRecordTable(unittest.TestCase):
+
+    def setUp(self):
+        from twoq.active.storage import RecordTable
+        self.qclass = RecordTable
+        self.rows = [{'a': 1, 'b': 2}, {'a': 3}, {'b': 4, 'c': 5}]
+
+    def test_extend(self):
+        things = self.qclass(self.rows)
+        self.assertEqual(list(things), self.rows)
+        self.assertEqual(len(things), 3)
+        things.extend(self.qclass([{'d': 6}]))
+        self.assertEqual(list(things), self.rows + [{'d': 6}])
+        things.extend(things)
+        self.assertEqual(len(things), 8)
+        things.extendleft([{'e': 1}, {'e': 2}])
+        self.assertEqual(list(things)[:2], [{'e': 2}, {'e': 1}])
+
+    def test_mixed(self):
+        things = self.qclass(self.rows + [1, {'a': 7}])
+        self.assertFalse(things.columnar)
+        self.assertEqual(list(things), self.rows + [1, {'a': 7}])
+        things = self.qclass(iter(self.rows))
+        things.extend([{'d': 6}])
+        self.assertEqual(list(things), self.rows + [{'d': 6}])
+
+    def test_columns(self):
+        things = self.qclass(self.rows)
+        self.assertTrue(things.columnar)
+        self.assertEqual(things.select(['a']), [1, 3])
+        self.assertEqual(things.select(['a', 'b']), [(1, 2)])
+        self.assertEqual(things.select(['z']), [])
+        self.assertRaises(KeyError, things.keys, ['a'])
+        self.assertEqual(
+            list(things.take([2, 0])), [self.rows[2], self.rows[0]],
+        )
+
+    def test_things(self):
+        things = self.qclass(self.rows)
+        things.append(1)
+        self.assertFalse(things.columnar)
+        self.assertEqual(list(things), self.rows + [1])
+        self.assertEqual(things.pop(), 1)
+        things.clear()
+        self.assertTrue(things.columnar)
+
+    def test_positions(self):
+        things = self.qclass(self.rows)
+        self.assertEqual(things[-1], self.rows[-1])
+        self.assertEqual(things.index({'a': 3}), 1)
+        things.insert(1, {'f': 1})
+        self.assertEqual(things[1], {'f': 1})
+        things.remove({'f': 1})
+        del things[0]
+        self.assertEqual(list(things), self.rows[1:])
+        self.assertEqual(list(reversed(things)), self.rows[:0:-1])
+        self.assertRaises(ValueError, things.index, {'f': 1})
+        self.assertRaises(IndexError, things.__getitem__, 5)
+
+    def test_pop(self):
+        things = self.qclass(self.rows)
+        self.assertEqual(things.pop(), self.rows[2])
+        self.assertEqual(things.popleft(), self.rows[0])
+        things.clear()
+        self.assertRaises(IndexError, things.pop)
+        self.assertRaises(IndexError, things.popleft)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+'''asyncio test coroutines'''
+
+import asyncio
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def triple(x):
+    await asyncio.sleep(0)
+    return x * 3
+
+
+async def even(x):
+    await asyncio.sleep(0)
+    return x % 2 == 0
+
+
+async def multiply(x, y):
+    await asyncio.sleep(0)
+    return x * y
+
+
+async def collect(q):
+    return [i async for i in q.results()]
+
+
+class Tracker(object):
+
+    def __init__(self):
+        self.running = self.peak = 0
+
+    async def __call__(self, x):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return x
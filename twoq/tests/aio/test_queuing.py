@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+'''asyncio queue tests'''
+
+import sys
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+
+class AsyncQMixin(object):
+
+    def setUp(self):
+        from twoq.tests.aio import coroutines
+        self.co = coroutines
+
+    def test_map(self):
+        q = self.qclass(1, 2, 3).tap(self.co.triple).map()
+        self.assertEqual(self.co.run(q.value()), [3, 6, 9])
+
+    def test_map_sync_call(self):
+        q = self.qclass(1, 2, 3).tap(lambda x: x * 3).map()
+        self.assertEqual(self.co.run(q.value()), [3, 6, 9])
+
+    def test_map_batch(self):
+        q = self.qclass(1, 2, 3, 4, 5).tap(
+            lambda x: [i * 3 for i in x]
+        ).batch(2).map()
+        self.assertEqual(self.co.run(q.value()), [3, 6, 9, 12, 15])
+        q = self.qclass(1, 2, 3).tap(
+            lambda x: [x.typecode] * len(x)
+        ).batch(2, 'd').map()
+        self.assertEqual(self.co.run(q.value()), ['d', 'd', 'd'])
+
+    def test_filter_batch(self):
+        q = self.qclass(1, 2, 3, 4, 5).tap(
+            lambda x: [i % 2 == 0 for i in x]
+        ).batch(2)
+        self.assertEqual(self.co.run(q.filter().value()), [2, 4])
+        q = self.qclass(1, 2, 3, 4, 5).tap(
+            lambda x: [i % 2 == 0 for i in x]
+        ).batch(2)
+        self.assertEqual(self.co.run(q.reject().value()), [1, 3, 5])
+
+    def test_filter(self):
+        q = self.qclass(1, 2, 3, 4).tap(self.co.even).filter()
+        self.assertEqual(self.co.run(q.value()), [2, 4])
+
+    def test_reject(self):
+        q = self.qclass(1, 2, 3, 4).tap(self.co.even).reject()
+        self.assertEqual(self.co.run(q.value()), [1, 3])
+
+    def test_each(self):
+        self.assertEqual(
+            self.co.run(self.qclass(
+                ((1, 2), {}), ((2, 3), {}), ((3, 4), {})
+            ).tap(self.co.multiply).each().value()),
+            [2, 6, 12],
+        )
+
+    def test_invoke(self):
+        self.assertEqual(
+            self.co.run(self.qclass([5, 4], [3, 2]).invoke('sort').value()),
+            [[4, 5], [2, 3]],
+        )
+
+    def test_delay_map(self):
+        q = self.qclass(1, 2, 3).tap(self.co.triple).delay_map(0.01)
+        self.assertEqual(self.co.run(q.value()), [3, 6, 9])
+
+    def test_delay_each(self):
+        self.assertEqual(
+            self.co.run(self.qclass(
+                ((1, 2), {}), ((2, 3), {})
+            ).tap(self.co.multiply).delay_each(0.01).value()),
+            [2, 6],
+        )
+
+    def test_delay_invoke(self):
+        self.assertEqual(
+            self.co.run(
+                self.qclass([5, 4], [3, 2]).delay_invoke('sort', 0.01).value()
+            ),
+            [[4, 5], [2, 3]],
+        )
+
+    def test_limit(self):
+        tracker = self.co.Tracker()
+        self.assertEqual(self.co.run(
+            self.qclass(*range(10)).limit(3).tap(tracker).map().value()
+        ), list(range(10)))
+        self.assertEqual(tracker.peak, 3)
+
+    def test_results(self):
+        q = self.qclass(1, 2, 3).tap(self.co.triple).map()
+        self.assertEqual(self.co.run(self.co.collect(q)), [3, 6, 9])
+        self.assertEqual(q.outcount(), 0)
+
+
+@unittest.skipIf(sys.version_info < (3, 6), 'requires async generators')
+class TestAutoQ(AsyncQMixin, unittest.TestCase):
+
+    def setUp(self):
+        super(TestAutoQ, self).setUp()
+        from twoq.aio.queuing import autoq
+        self.qclass = autoq
+
+    def test_chain(self):
+        self.assertEqual(self.co.run(
+            self.qclass(1, 2, 3, 4).tap(
+                self.co.triple
+            ).map().tap(self.co.even).filter().value()
+        ), [6, 12])
+
+
+@unittest.skipIf(sys.version_info < (3, 6), 'requires async generators')
+class TestManQ(AsyncQMixin, unittest.TestCase):
+
+    def setUp(self):
+        super(TestManQ, self).setUp()
+        from twoq.aio.queuing import manq
+        self.qclass = manq
+
+    def test_sync(self):
+        q = self.qclass(1, 2, 3, 4).tap(self.co.triple).map()
+        self.co.run(q.run())
+        self.assertEqual(list(q.incoming), [1, 2, 3, 4])
+        self.assertEqual(self.co.run(
+            q.sync().tap(self.co.even).filter().value()
+        ), [6, 12])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,6 +22,41 @@ class TestAutoQ(
         from twoq.lazy.queuing import autoq
         self.qclass = autoq
 
+    def test_len_materializes_once(self):
+        calls = []
+        def test(x): #@IgnorePep8
+            calls.append(x)
+            return x * 2
+        q = self.qclass(1, 2, 3, 4).tap(test).map()
+        self.assertEqual(len(q), 4)
+        self.assertEqual(len(q), 4)
+        self.assertEqual(q.outcount(), 4)
+        self.assertTrue(q.balanced)
+        self.assertEqual(calls, [1, 2, 3, 4])
+        self.assertEqual(q.value(), [2, 4, 6, 8])
+        self.assertEqual(q.outcount(), 0)
+
+    def test_cached_contains_index(self):
+        q = self.qclass(1, 2, 3, 4).tap(lambda x: x * 2).map()
+        self.assertTrue(6 in q)
+        self.assertEqual(q.index(6), 2)
+        next(q.incoming)
+        self.assertFalse(2 in q)
+        self.assertEqual(q.index(6), 1)
+        self.assertEqual(len(q), 3)
+
+    def test_cache_released(self):
+        q = self.qclass(1, 2, 3, 4).tap(lambda x: x * 2).map()
+        self.assertEqual(len(q), 4)
+        self.assertTrue('incoming' in q._cache)
+        q.tap(lambda x: x).map()
+        self.assertFalse('incoming' in q._cache)
+        self.assertEqual(q.outcount(), 4)
+        q.append(1)
+        self.assertFalse('incoming' in q._cache)
+        self.assertEqual(q.value(), [2, 4, 6, 8])
+        self.assertFalse('outgoing' in q._cache)
+
 
 if __name__ == '__main__':
     unittest.main()
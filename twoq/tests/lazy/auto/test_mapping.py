@@ -5,6 +5,7 @@ try:
 except ImportError:
     import unittest
 
+from twoq.support import futures
 #pylint: disable-msg=w0614,w0401
 from twoq.tests.mixins.auto.mapping import *  # @UnusedWildImport
 from twoq.tests.mixins.auto.queuing import AQMixin
@@ -37,5 +38,22 @@ class TestAutoDelayQ(unittest.TestCase, AQMixin, ADelayQMixin):
         from twoq.lazy.mapping import adelayq
         self.qclass = adelayq
 
+
+@unittest.skipIf(futures is None, 'concurrent.futures unavailable')
+class TestAutoParallelQ(unittest.TestCase, AQMixin, AParallelQMixin):
+
+    def setUp(self):
+        from twoq.lazy.mapping import aparallelq
+        self.qclass = aparallelq
+
+
+@unittest.skipIf(futures is None, 'concurrent.futures unavailable')
+class TestAutoThrottleQ(unittest.TestCase, AQMixin, AThrottleQMixin):
+
+    def setUp(self):
+        from twoq.lazy.mapping import athrottleq
+        self.qclass = athrottleq
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+'''planq tests'''
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from twoq.tests.mixins.auto.queuing import AQMixin
+from twoq.tests.mixins.auto.mapping import AMapQMixin
+from twoq.tests.mixins.auto.ordering import AOrderQMixin
+from twoq.tests.mixins.auto.reducing import AReduceQMixin
+from twoq.tests.mixins.auto.filtering import AFilterQMixin
+
+
+class TestPlanQ(
+    unittest.TestCase, AQMixin, AFilterQMixin, AMapQMixin, AReduceQMixin,
+    AOrderQMixin,
+):
+
+    def setUp(self):
+        from twoq.lazy.queuing import planq
+        self.qclass = planq
+
+    def test_plan(self):
+        q = self.qclass(1, 2, 3, 4, 5, 6).tap(
+            lambda x: x * 3
+        ).map().tap(lambda x: x % 2 == 0).filter().take(2)
+        self.assertEqual(q.plan, ('map', 'filter', 'take'))
+        self.assertEqual(q.value(), [6, 12])
+        self.assertEqual(q.plan, ())
+
+    def test_deferred(self):
+        calls = []
+        def test(x): #@IgnorePep8
+            calls.append(x)
+            return x * 3
+        q = self.qclass(1, 2, 3, 4, 5, 6).tap(test).map().rest().take(2)
+        self.assertEqual(calls, [])
+        self.assertEqual(q.value(), [6, 9])
+        self.assertEqual(calls, [1, 2, 3])
+
+    def test_mixed(self):
+        self.assertEqual(
+            self.qclass(6, 5, 4, 3, 2, 1).tap(
+                lambda x: x * 3
+            ).map().sort().tap(lambda x: x > 6).filter().value(),
+            [9, 12, 15, 18],
+        )
+
+    def test_execute(self):
+        q = self.qclass(1, 2, 3).tap(lambda x: x * 3).map().execute()
+        self.assertEqual(q.plan, ())
+        self.assertEqual(list(q.incoming), [3, 6, 9])
+
+    def test_cache_released(self):
+        q = self.qclass(1, 2, 3).tap(lambda x: x * 3).map().execute()
+        self.assertEqual(len(q), 3)
+        self.assertTrue('incoming' in q._cache)
+        q.tap(lambda x: x).map().execute()
+        self.assertFalse('incoming' in q._cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,6 +15,13 @@ class AFilteringQMixin(object):
             ).filter().value(), [2, 4, 6]
         )
 
+    def test_filter_batch(self):
+        self.assertEquals(
+            self.qclass(1, 2, 3, 4, 5, 6).tap(
+                lambda x: [i % 2 == 0 for i in x]
+            ).batch(4).filter().value(), [2, 4, 6]
+        )
+
     def test_find(self):
         self.assertEquals(
             self.qclass(1, 2, 3, 4, 5, 6).tap(
@@ -29,6 +36,13 @@ class AFilteringQMixin(object):
             ).reject().value(), [1, 3, 5]
         )
 
+    def test_reject_batch(self):
+        self.assertEquals(
+            self.qclass(1, 2, 3, 4, 5, 6).tap(
+                lambda x: [i % 2 == 0 for i in x]
+            ).batch(4, 'i').reject().value(), [1, 3, 5]
+        )
+
     def test_partition(self):
         self.assertEquals(
             self.qclass(1, 2, 3, 4, 5, 6).tap(
@@ -73,6 +87,7 @@ class ASliceQMixin(object):
         self.assertEqual(
             self.qclass(5, 4, 3, 2, 1).initial().value(), [5, 4, 3, 2]
         )
+        self.assertEqual(self.qclass(5, 4).initial().value(), 5)
 
     def test_rest(self):
         self.assertEqual(
@@ -88,6 +103,9 @@ class ASliceQMixin(object):
         self.assertEqual(
             self.qclass(5, 4, 3, 2, 1).snatch(2).value(), [2, 1]
         )
+        self.assertEqual(
+            self.qclass(5, 4, 3, 2, 1).snatch(7).value(), [5, 4, 3, 2, 1]
+        )
 
 
 class ACollectQMixin(object):
@@ -110,6 +128,51 @@ class ACollectQMixin(object):
             [('age', 40), ('name', 'moe'), ('age', 50), ('name', 'larry'),
             ('age', 60), ('name', 'curly')],
         )
+        first, second = stooges(), stooges()
+        second.name = 'shemp'
+        second.hair = False
+        self.assertEqual(
+            self.qclass(first, second).tap(test).members().detap().value(),
+            [('age', 40), ('name', 'moe'), ('age', 40), ('hair', False),
+            ('name', 'shemp')],
+        )
+
+    def test_members_changed(self):
+        class plugin(object):
+            version = 1
+        test = lambda x: x[0] in ('version', 'enabled', 'extra')
+        self.assertEqual(
+            self.qclass(plugin).tap(test).members().detap().value(),
+            ('version', 1),
+        )
+        plugin.version = 2
+        plugin.enabled = True
+        self.assertEqual(
+            self.qclass(plugin).tap(test).members().detap().value(),
+            [('enabled', True), ('version', 2)],
+        )
+        self.assertEqual(
+            self.qclass(plugin()).tap(test).members().detap().value(),
+            [('enabled', True), ('version', 2)],
+        )
+        self.assertEqual(
+            self.qclass(plugin()).tap(test).deepmembers().detap().value(),
+            [('enabled', True), ('version', 2)] * 2,
+        )
+        # same number of attributes but different ones
+        del plugin.enabled
+        plugin.extra = 3
+        self.assertEqual(
+            self.qclass(plugin()).tap(test).members().detap().value(),
+            [('extra', 3), ('version', 2)],
+        )
+        thing = plugin()
+        thing.enabled = False
+        self.assertEqual(
+            self.qclass(thing, plugin()).tap(test).members().detap().value(),
+            [('enabled', False), ('extra', 3), ('version', 2), ('extra', 3),
+            ('version', 2)],
+        )
 
     def test_deepmembers(self):
         class stooges:
@@ -208,6 +271,10 @@ class ASetQMixin(object):
             self.qclass([1, 2, 3, 4, 5], [5, 2, 10]).difference().value(),
             [1, 3, 4],
         )
+        self.assertEqual(
+            self.qclass([4, 1, 3, 1, 2], [2], iter([3])).difference().value(),
+            [4, 1],
+        )
 
     def test_intersection(self):
         self.assertEqual(
@@ -215,12 +282,19 @@ class ASetQMixin(object):
                 [1, 2, 3], [101, 2, 1, 10], [2, 1]
             ).intersection().value(), [1, 2],
         )
+        self.assertEqual(
+            self.qclass([1, 2], iter([2, 3]), [4]).intersection().value(), [],
+        )
 
     def test_union(self):
         self.assertEqual(
             self.qclass([1, 2, 3], [101, 2, 1, 10], [2, 1]).union().value(),
             [1, 2, 3, 101, 10],
         )
+        self.assertEqual(
+            self.qclass([3, 1], iter([1, 2]), [2, 4]).union().value(),
+            [3, 1, 2, 4],
+        )
 
     def test_unique(self):
         self.assertEqual(
@@ -31,6 +31,30 @@ class AMappingQMixin(object):
         self.assertEquals(
             self.qclass(1, 2, 3).tap(lambda x: x * 3).map().value(), [3, 6, 9],
         )
+
+    def test_map_batch(self):
+        self.assertEquals(
+            self.qclass(1, 2, 3, 4, 5).tap(
+                lambda x: [i * 3 for i in x]
+            ).batch(2).map().value(),
+            [3, 6, 9, 12, 15],
+        )
+        self.assertEquals(
+            self.qclass(1, 2, 3).tap(
+                lambda x: [x.typecode] * len(x)
+            ).batch(2, 'd').map().value(),
+            ['d', 'd', 'd'],
+        )
+        self.assertEquals(
+            self.qclass(1, 2, 3, 4).tap(
+                lambda x: [i * 2 for i in x]
+            ).batch(2).map().tap(lambda x: x + 1).map().value(),
+            [3, 5, 7, 9],
+        )
+        queue = self.qclass(1, 2).tap(lambda x: x).batch(2).clear()
+        self.assertEquals(queue.extend([1, 2]).tap(
+            lambda x: x * 2
+        ).map().value(), [2, 4])
         
     def test_starmap(self):
         self.assertEquals(
@@ -55,8 +79,24 @@ class AMappingQMixin(object):
             self.qclass([5, 1, 7], [3, 2, 1]).invoke('sort').value(),
             [[1, 5, 7], [1, 2, 3]],
         )
-        
- 
+
+    def test_append_after_map(self):
+        q = self.qclass(1, 2, 3).tap(lambda x: x * 2).map()
+        q.append(7)
+        self.assertEqual(q.value(), [2, 4, 6])
+        self.assertEqual(list(q.incoming), [2, 4, 6, 7])
+
+    def test_value_after_map(self):
+        q = self.qclass(1, 2, 3).tap(lambda x: x * 2).map()
+        self.assertEqual(q.value(), [2, 4, 6])
+        self.assertEqual(q.tap(lambda x: x + 1).map().value(), [3, 5, 7])
+
+    def test_results_after_map(self):
+        q = self.qclass(1, 2, 3).tap(lambda x: x * 2).map()
+        self.assertEqual(list(q.results()), [2, 4, 6])
+        self.assertEqual(list(q.incoming), [2, 4, 6])
+
+
 class ACopyQMixin(object):
 
     def test_copy(self):
@@ -138,6 +178,210 @@ class ADelayQMixin(object):
         )
 
 
+def _triple(x):
+    return x * 3
+
+
+def _multiply(x, y):
+    return x * y
+
+
+def _each(*args, **kw):
+    return sum(args) * kw['a']
+
+
+def _triples(x):
+    return [i * 3 for i in x]
+
+
+class AParallelQMixin(object):
+
+    def test_map(self):
+        self.assertEquals(
+            self.qclass(1, 2, 3).tap(_triple).pool(2, 2).map().value(),
+            [3, 6, 9],
+        )
+
+    def test_map_unordered(self):
+        self.assertEquals(
+            sorted(self.qclass(*range(10)).tap(_triple).pool(
+                2, 1, False,
+            ).map().value()),
+            [0, 3, 6, 9, 12, 15, 18, 21, 24, 27],
+        )
+
+    def test_map_batch(self):
+        self.assertEquals(
+            self.qclass(1, 2, 3, 4, 5).tap(_triples).batch(2).pool(
+                2,
+            ).map().value(),
+            [3, 6, 9, 12, 15],
+        )
+        self.assertEquals(
+            self.qclass(1, 2, 3).tap(_triples).batch(2, 'd').pool(
+                2,
+            ).map().value(),
+            [3.0, 6.0, 9.0],
+        )
+
+    def test_starmap(self):
+        self.assertEquals(
+            self.qclass(
+                (1, 2), (2, 3), (3, 4)
+            ).tap(_multiply).pool(2).starmap().value(), [2, 6, 12],
+        )
+
+    def test_batch_unsupported(self):
+        self.assertRaises(
+            ValueError,
+            self.qclass((1, 2), (2, 3)).tap(_multiply).batch(2).pool(
+                2,
+            ).starmap,
+        )
+
+    def test_each(self):
+        self.assertEquals(
+            self.qclass(
+                ((1, 2), {'a': 2}), ((2, 3), {'a': 2}), ((3, 4), {'a': 2})
+            ).tap(_each).pool(2).each().value(),
+            [6, 10, 14],
+        )
+
+    def test_invoke(self):
+        self.assertEquals(
+            self.qclass(
+                [5, 1, 7], [3, 2, 1]
+            ).args(1).pool(2).invoke('index').value(),
+            [1, 2],
+        )
+        self.assertEquals(
+            self.qclass([5, 1, 7], [3, 2, 1]).pool(2).invoke('sort').value(),
+            [[1, 5, 7], [1, 2, 3]],
+        )
+
+
+class AThrottleQMixin(object):
+
+    def test_delay_each(self):
+        def test(*args, **kw):
+            return sum(args) * kw['a']
+        self.assertEquals(
+            self.qclass(
+                ((1, 2), {'a': 2}), ((2, 3), {'a': 2}), ((3, 4), {'a': 2})
+            )
+            .tap(test)
+            .throttle(10)
+            .delay_each(0.1)
+            .value(),
+            [6, 10, 14],
+        )
+
+    def test_delay_map(self):
+        self.assertEquals(
+            self.qclass(1, 2, 3).tap(
+                lambda x: x * 3
+            ).throttle(10).delay_map(0.1).value(),
+            [3, 6, 9],
+        )
+
+    def test_delay_invoke(self):
+        self.assertEquals(
+            self.qclass([5, 1, 7], [3, 2, 1])
+            .args(1)
+            .throttle(10)
+            .delay_invoke('index', 0.1)
+            .value(),
+            [1, 2],
+        )
+        self.assertEquals(
+            self.qclass([5, 1, 7], [3, 2, 1])
+            .throttle(10)
+            .delay_invoke('sort', 0.1).value(),
+            [[1, 5, 7], [1, 2, 3]],
+        )
+
+    def test_batch_unsupported(self):
+        queue = self.qclass(1, 2, 3).tap(_triple).batch(2).throttle(10)
+        self.assertRaises(ValueError, queue.delay_map, 0)
+        self.assertEquals(queue.batch().delay_map(0).value(), [3, 6, 9])
+
+    def test_concurrent(self):
+        from threading import Event, Lock
+        lock, ready, started, released = Lock(), Event(), [], []
+
+        def test(x):
+            with lock:
+                started.append(x)
+                if len(started) == 4:
+                    ready.set()
+            # only returns early if every call is running at once
+            released.append(ready.wait(5))
+            return x * 3
+        self.assertEquals(
+            self.qclass(1, 2, 3, 4).tap(
+                test
+            ).throttle(workers=4).delay_map(0).value(),
+            [3, 6, 9, 12],
+        )
+        self.assertTrue(all(released))
+
+    def test_rate(self):
+        from threading import Lock
+        from functools import partial
+        from twoq.mixins.mapping import TokenBucket
+        lock, now, starts = Lock(), [0.0], []
+
+        def sleep(seconds):
+            with lock:
+                now[0] += seconds
+
+        def test(x):
+            starts.append(now[0])
+            return x * 3
+
+        class qclass(self.qclass):
+            _bucket = partial(TokenBucket, clock=lambda: now[0], sleep=sleep)
+        self.assertEquals(
+            qclass(1, 2, 3, 4, 5, 6).tap(
+                test
+            ).throttle(3, 0.2).delay_map(0).value(),
+            [3, 6, 9, 12, 15, 18],
+        )
+        # three calls start at once, then one every 0.2 / 3 seconds
+        self.assertTrue(all(
+            start >= (i - 2) * 0.2 / 3 - 1e-9
+            for i, start in enumerate(sorted(starts))
+        ))
+        self.assertTrue(now[0] >= 0.2 - 1e-9)
+
+    def test_fractional_rate(self):
+        from threading import Lock
+        from functools import partial
+        from twoq.mixins.mapping import TokenBucket
+        lock, now, starts = Lock(), [0.0], []
+
+        def sleep(seconds):
+            with lock:
+                now[0] += seconds
+
+        def test(x):
+            starts.append(now[0])
+            return x * 3
+
+        class qclass(self.qclass):
+            _bucket = partial(TokenBucket, clock=lambda: now[0], sleep=sleep)
+        self.assertEquals(
+            qclass(1, 2, 3).tap(test).throttle(0.5).delay_map(0).value(),
+            [3, 6, 9],
+        )
+        # one call at once, then one every two seconds
+        self.assertTrue(all(
+            start >= i * 2 - 1e-9 for i, start in enumerate(sorted(starts))
+        ))
+        self.assertRaises(ValueError, TokenBucket, 0)
+        self.assertRaises(ValueError, TokenBucket, 1, 0)
+
+
 class AMapQMixin(ACopyQMixin, ADelayQMixin, AMappingQMixin, ARepeatQMixin):
     
     '''combination mixin'''
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+'''auto numeric test mixins'''
+
+
+class ANumQMixin(object):
+
+    def test_sum(self):
+        self.assertEqual(self.qclass(1, 2, 3).sum().value(), 6)
+        self.assertTrue(isinstance(self.qclass(1, 2, 3).sum().value(), int))
+        self.assertEqual(self.qclass(1, 2, 3).sum(1).value(), 7)
+
+    def test_fsum(self):
+        self.assertEqual(self.qclass(*[.1] * 10).fsum().value(), 1.0)
+
+    def test_average(self):
+        self.assertEqual(
+            self.qclass(10, 40, 45).average().value(), 31.666666666666668,
+        )
+
+    def test_max(self):
+        self.assertEqual(self.qclass(1, 3, 2).max().value(), 3)
+        self.assertEqual(
+            self.qclass(1, 3, 2).tap(lambda x: -x).max().value(), 1,
+        )
+
+    def test_min(self):
+        self.assertEqual(self.qclass(3, 1, 2).min().value(), 1)
+        self.assertEqual(
+            self.qclass(3, 1, 2).tap(lambda x: -x).min().value(), 3,
+        )
+
+    def test_minmax(self):
+        self.assertEqual(
+            self.qclass(10, 5, 100, 2, 1000).minmax().value(), [2, 1000],
+        )
+
+    def test_median(self):
+        self.assertEqual(self.qclass(4, 5, 7, 2, 1).median().value(), 4)
+        self.assertEqual(self.qclass(4, 5, 7, 2, 1, 8).median().value(), 4.5)
+        self.assertEqual(
+            self.qclass(4, 5, 7, 2, 1).median(approx=True).value(), 4,
+        )
+
+    def test_statrange(self):
+        self.assertEqual(self.qclass(3, 5, 7, 3, 11).statrange().value(), 8)
+
+    def test_sort(self):
+        self.assertEqual(
+            self.qclass(4, 6, 65, 3, 63, 2, 4).sort().value(),
+            [2, 3, 4, 4, 6, 63, 65],
+        )
+        self.assertEqual(
+            self.qclass(4, 6, 65, 3).sort(budget=2).value(), [3, 4, 6, 65],
+        )
+
+    def test_reverse(self):
+        self.assertEqual(
+            self.qclass(5, 4, 3, 2, 1).reverse().value(), [1, 2, 3, 4, 5],
+        )
+
+    def test_sample(self):
+        self.assertEqual(len(self.qclass(5, 4, 3, 2, 1).sample(3).value()), 3)
+
+    def test_chain(self):
+        self.assertEqual(
+            self.qclass(1, 2, 3, 4).tap(
+                lambda x: x * 3
+            ).map().reverse().sum().value(),
+            30,
+        )
+
+    def test_big(self):
+        self.assertEqual(self.qclass(2 ** 62, 2 ** 62).sum().value(), 2 ** 63)
+        self.assertEqual(
+            self.qclass(-2 ** 62, 2 ** 62).statrange().value(), 2 ** 63,
+        )
+
+    def test_typecode(self):
+        q = self.qclass(1, 2, 3).typecode('d')
+        self.assertEqual(q._array().typecode, 'd')
+        self.assertEqual(q.sum().value(), 6.0)
+        self.assertEqual(
+            self.qclass(1.5, 2).typecode('l').max().value(), 2,
+        )
+
+    def test_things(self):
+        self.assertEqual(
+            self.qclass(1, 2, 3).tap(str).map().value(), ['1', '2', '3'],
+        )
+        self.assertEqual(
+            self.qclass(1, 2, 2).frequency().value(), [(2, 2), (1, 1)],
+        )
+        self.assertEqual(
+            self.qclass(1, 2, 3, 4).tap(lambda x: x % 2).group().value(),
+            [[1, [1]], [0, [2]], [1, [3]], [0, [4]]],
+        )
+        self.assertEqual(
+            self.qclass(1, 2, 3).pairwise().value(), [(1, 2), (2, 3)],
+        )
+        self.assertEqual(
+            self.qclass('b', 'a', 'c').sort().reverse().max().value(), 'c',
+        )
+        self.assertEqual(
+            self.qclass(1, 2, 3).tap(str).map().sort().value(),
+            ['1', '2', '3'],
+        )
@@ -19,6 +19,28 @@ class AOrderingQMixin(object):
             [[1.3, [1.3]], [2.1, [2.1]], [2.4, [2.4]]],
         )
 
+    def test_groupby(self):
+        self.assertEqual(
+            self.qclass(1, 2, 1, 3, 2, 1).groupby().value(),
+            [[1, [1, 1, 1]], [2, [2, 2]], [3, [3]]],
+        )
+        self.assertEqual(
+            self.qclass(1.3, 2.1, 1.4, 2.4).tap(int).groupby().value(),
+            [[1, [1.3, 1.4]], [2, [2.1, 2.4]]],
+        )
+        self.assertEqual(
+            self.qclass('a', 'bb', 'c', 'dd', 'e').tap(len).groupby(
+                lambda x, y: x + 1, 0,
+            ).value(),
+            [[1, 3], [2, 2]],
+        )
+        self.assertEqual(
+            self.qclass(3, 11, 4, 12).tap(lambda x: x // 10).groupby(
+                lambda x, y: x + y,
+            ).value(),
+            [[0, 7], [1, 23]],
+        )
+
     def test_grouper(self):
         self.assertEquals(
             self.qclass(
@@ -27,6 +49,30 @@ class AOrderingQMixin(object):
              [('moe', 'larry'), ('curly', 30), (40, 50), (True, 'x')]
         )
 
+    def test_nlargest(self):
+        self.assertEqual(
+            self.qclass(4, 6, 65, 3, 63, 2, 4).nlargest(3).value(),
+            [65, 63, 6],
+        )
+        self.assertEqual(
+            self.qclass(4, 6, 65, 3, 63, 2, 4).tap(
+                lambda x: -x
+            ).nlargest(2).value(),
+            [2, 3],
+        )
+
+    def test_nsmallest(self):
+        self.assertEqual(
+            self.qclass(4, 6, 65, 3, 63, 2, 4).nsmallest(3).value(),
+            [2, 3, 4],
+        )
+        self.assertEqual(
+            self.qclass(4, 6, 65, 3, 63, 2, 4).tap(
+                lambda x: -x
+            ).nsmallest(2).value(),
+            [65, 63],
+        )
+
     def test_reversed(self):
         self.assertEqual(
             self.qclass(5, 4, 3, 2, 1).reverse().value(), [1, 2, 3, 4, 5],
@@ -45,6 +91,27 @@ class AOrderingQMixin(object):
             [2, 3, 4, 4, 6, 63, 65],
         )
 
+    def test_sort_budget(self):
+        from math import sin
+        self.assertEqual(
+            self.qclass(1, 2, 3, 4, 5, 6).tap(
+                lambda x: sin(x)
+            ).sort(budget=4).value(),
+            [5, 4, 6, 3, 1, 2],
+        )
+        self.assertEqual(
+            self.qclass(4, 6, 65, 3, 63, 2, 4).sort(budget=2).value(),
+            [2, 3, 4, 4, 6, 63, 65],
+        )
+        self.assertEqual(
+            self.qclass(4, 6, 65, 3).sort(budget=10).value(), [3, 4, 6, 65],
+        )
+        self.assertEqual(
+            self.qclass(*range(3000, 0, -1)).sort(budget=1000).value(),
+            list(range(1, 3001)),
+        )
+        self.assertRaises(ValueError, self.qclass(2, 1).sort, budget=0)
+
 
 class ARandomQMixin(object):
 
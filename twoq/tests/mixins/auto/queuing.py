@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 '''auto queuing test mixins'''
 
+import os
+import tempfile
+
 
 class AQMixin(object):
     ''
@@ -19,6 +22,10 @@ class AQMixin(object):
             self.qclass(1, 2, 3, 4, 5, 6).remove(5).outsync().value(),
             [1, 2, 3, 4, 6],
         )
+        self.assertEquals(
+            self.qclass(6, 5, 2, 4, 5, 1).remove(5).outsync().value(),
+            [6, 2, 4, 5, 1],
+        )
 
     def test_insert(self):
         q = self.qclass(1, 2, 3, 4, 5, 6)
@@ -73,12 +80,76 @@ class AQMixin(object):
         q = self.qclass([1, 2, 3, 4, 5, 6]).outsync()
         self.assertEqual(list(q.incoming), list(q.outgoing))
 
+    def test_context(self):
+        q = self.qclass(1, 2, 3)
+        context = q._sync
+        q.first().last()
+        self.assertTrue(q._sync is context)
+        self.assertEqual(q.value(), 1)
+
+    ###########################################################################
+    ## files ##################################################################
+    ###########################################################################
+
+    def _path(self, data=b''):
+        handle, path = tempfile.mkstemp()
+        os.write(handle, data)
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_fromlines(self):
+        q = self.qclass.fromlines(self._path(b'ab\ncde\n\nf'))
+        self.assertEqual(
+            [bytes(i) for i in q.outsync().value()],
+            [b'ab', b'cde', b'', b'f'],
+        )
+        q = self.qclass.fromlines(self._path(b'ab||cde'), newline=b'||')
+        self.assertEqual(
+            [bytes(i) for i in q.outsync().value()], [b'ab', b'cde'],
+        )
+        self.assertEqual(self.qclass.fromlines(self._path()).value(), [])
+
+    def test_fromrecords(self):
+        q = self.qclass.fromrecords(self._path(b'abcdef'), 3)
+        self.assertEqual(
+            [bytes(i) for i in q.outsync().value()], [b'abc', b'def'],
+        )
+        path = self._path(b'abcde')
+        self.assertRaises(
+            ValueError,
+            lambda: self.qclass.fromrecords(path, 3).outsync().value(),
+        )
+
+    def test_fromframes(self):
+        q = self.qclass.fromframes(self._path(b'\x02\x00ab\x03\x00cde'), '<H')
+        self.assertEqual(
+            [bytes(i) for i in q.outsync().value()], [b'ab', b'cde'],
+        )
+
+    def test_tofile(self):
+        path = self._path()
+        queue = self.qclass(b'ab', b'cde').outsync()
+        self.assertEqual(
+            queue.tofile(path, newline=b'\n').value(), [b'ab', b'cde'],
+        )
+        with open(path, 'rb') as handle:
+            self.assertEqual(handle.read(), b'ab\ncde\n')
+        self.qclass(b'ab', b'cde').outsync().tofile(path, prefix='<H')
+        self.assertEqual(
+            [bytes(i) for i in self.qclass.fromframes(
+                path, '<H',
+            ).outsync().value()],
+            [b'ab', b'cde'],
+        )
+
     ##########################################################################
     # queue information ######################################################
     ##########################################################################
 
     def test_index(self):
         self.assertEquals(self.qclass(1, 2, 3, 4, 5, 6).index(3), 2)
+        self.assertEquals(self.qclass(6, 5, 3, 4, 3, 1).index(3), 2)
 
     def test_results(self):
         self.assertEquals(
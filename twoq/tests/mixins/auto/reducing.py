@@ -12,6 +12,48 @@ class AReducingQMixin(object):
         self.assertEquals(
             self.qclass([[1, [2], [3, [[4]]]]]).smash().value(), [1, 2, 3, 4],
         )
+        self.assertEqual(
+            self.qclass([1, [2], [3, [[4]]]], 'ab').smash(2).value(),
+            [1, 2, 3, [[4]], 'ab'],
+        )
+        nested = [1]
+        for _ in range(5000):
+            nested = [nested, 2]
+        self.assertEqual(
+            self.qclass(nested).smash().value(), [1] + [2] * 5000,
+        )
+
+    def test_aggregate(self):
+        self.assertEqual(
+            self.qclass(3, 11, 4, 12, 5).tap(lambda x: x // 10).aggregate(
+                'count', 'sum', 'min', 'max', 'mean', 'first', 'last',
+            ).value(),
+            [
+                [0, [3, 12, 3, 5, 4.0, 3, 5]],
+                [1, [2, 23, 11, 12, 11.5, 11, 12]],
+            ],
+        )
+        self.assertEqual(
+            self.qclass(('a', 1), ('b', 2), ('a', 3)).tap(
+                lambda x: x[0]
+            ).aggregate(('sum', lambda x: x[1])).value(),
+            [['a', 4], ['b', 2]],
+        )
+        self.assertRaises(ValueError, self.qclass(1).aggregate, 'nothing')
+
+    def test_combine(self):
+        first = self.qclass(1, 2, 11).tap(lambda x: x // 10).preaggregate(
+            'count', 'mean', 'last',
+        ).value()
+        second = self.qclass(3, 12).tap(lambda x: x // 10).preaggregate(
+            'count', 'mean', 'last',
+        ).value()
+        self.assertEqual(
+            self.qclass(*(first + second)).combine(
+                'count', 'mean', 'last',
+            ).value(),
+            [[0, [3, 2.0, 3]], [1, [2, 11.5, 12]]],
+        )
 
     def test_merge(self):
         self.assertEquals(
@@ -93,10 +135,27 @@ class AMathQMixin(object):
         self.assertEquals(
             self.qclass(10, 5, 100, 2, 1000).minmax().value(), [2, 1000],
         )
+        self.assertRaises(ValueError, self.qclass().minmax)
 
     def test_median(self):
         self.assertEquals(self.qclass(4, 5, 7, 2, 1).median().value(), 4)
         self.assertEquals(self.qclass(4, 5, 7, 2, 1, 8).median().value(), 4.5)
+        self.assertEquals(self.qclass(3, 1, 2).median().value(), 2)
+
+    def test_median_approx(self):
+        self.assertEquals(
+            self.qclass(4, 5, 7, 2, 1).median(approx=True).value(), 4,
+        )
+        self.assertEquals(
+            self.qclass(*range(1001)).median(approx=True).value(), 500,
+        )
+
+    def test_mode_approx(self):
+        self.assertEquals(
+            self.qclass(11, 3, 5, 11, 7, 3, 11).mode(counters=2).value(), 11,
+        )
+        self.assertEqual(self.qclass(1, 2, 3).mode(counters=2).value(), 3)
+        self.assertEqual(self.qclass(1, 2).mode(counters=1).value(), 2)
 
     def test_mode(self):
         self.assertEquals(
@@ -118,6 +177,9 @@ class AMathQMixin(object):
         self.assertEquals(
             self.qclass(3, 5, 7, 3, 11).statrange().value(), 8,
         )
+        self.assertEquals(
+            self.qclass(*range(3000, 0, -1)).statrange().value(), 2999,
+        )
 
     def test_sum(self):
         self.assertEquals(self.qclass(1, 2, 3).sum().value(), 6)
@@ -35,6 +35,16 @@ class MMappingQMixin(object):
         self.assertEquals(manq.value(), [3, 6, 9])
         self.assertFalse(manq.balanced)
 
+    def test_map_batch(self):
+        manq = self.qclass(1, 2, 3).tap(
+            lambda x: [i * 3 for i in x]
+        ).batch(2).map()
+        self.assertTrue(manq.balanced)
+        manq.sync()
+        self.assertTrue(manq.balanced)
+        self.assertEquals(manq.value(), [3, 6, 9])
+        self.assertFalse(manq.balanced)
+
     def test_starmap(self):
         manq = self.qclass(
             (1, 2), (2, 3), (3, 4)
@@ -189,6 +199,66 @@ class MDelayQMixin(object):
         self.assertFalse(manq.balanced)
 
 
+def _triple(x):
+    return x * 3
+
+
+def _multiply(x, y):
+    return x * y
+
+
+class MParallelQMixin(object):
+
+    def test_map(self):
+        manq = self.qclass(1, 2, 3).tap(_triple).pool(2, 2).map()
+        self.assertTrue(manq.balanced)
+        manq.sync()
+        self.assertTrue(manq.balanced)
+        self.assertEquals(manq.value(), [3, 6, 9])
+        self.assertFalse(manq.balanced)
+
+    def test_starmap(self):
+        manq = self.qclass(
+            (1, 2), (2, 3), (3, 4)
+        ).tap(_multiply).pool(2, 1, False).starmap()
+        self.assertTrue(manq.balanced)
+        manq.sync()
+        self.assertTrue(manq.balanced)
+        self.assertEquals(sorted(manq.value()), [2, 6, 12])
+        self.assertFalse(manq.balanced)
+
+    def test_invoke(self):
+        manq = self.qclass([5, 1, 7], [3, 2, 1]).pool(2).invoke('sort')
+        self.assertTrue(manq.balanced)
+        manq.sync()
+        self.assertTrue(manq.balanced)
+        self.assertEquals(manq.value(), [[1, 5, 7], [1, 2, 3]])
+        self.assertFalse(manq.balanced)
+
+
+class MThrottleQMixin(object):
+
+    def test_delay_map(self):
+        manq = self.qclass(1, 2, 3).tap(
+            lambda x: x * 3
+        ).throttle(10).delay_map(0.1)
+        self.assertTrue(manq.balanced)
+        manq.sync()
+        self.assertTrue(manq.balanced)
+        self.assertEquals(manq.value(), [3, 6, 9])
+        self.assertFalse(manq.balanced)
+
+    def test_delay_invoke(self):
+        manq = self.qclass(
+            [5, 1, 7], [3, 2, 1]
+        ).args(1).throttle(10).delay_invoke('index', 0.1)
+        self.assertTrue(manq.balanced)
+        manq.sync()
+        self.assertTrue(manq.balanced)
+        self.assertEquals(manq.value(), [1, 2])
+        self.assertFalse(manq.balanced)
+
+
 class MMapQMixin(MCopyQMixin, MDelayQMixin, MMappingQMixin, MRepeatQMixin):
     
     '''combination mixin'''
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+'''manual numeric test mixins'''
+
+
+class MNumQMixin(object):
+
+    def test_sum(self):
+        manq = self.qclass(1, 2, 3).sum()
+        self.assertFalse(manq.balanced)
+        manq.sync()
+        self.assertTrue(manq.balanced)
+        self.assertEqual(manq.value(), 6)
+        self.assertFalse(manq.balanced)
+
+    def test_storage(self):
+        manq = self.qclass(1, 2, 3).sum()
+        manq.append(1.5).append('x')
+        self.assertEqual(list(manq.incoming), [1, 2, 3, 1.5, 'x'])
+        manq.sync()
+        self.assertEqual(manq.value(), 6)
+
+    def test_sort(self):
+        manq = self.qclass(4, 6, 65, 3, 63, 2, 4).sort()
+        manq.sync()
+        self.assertEqual(manq.value(), [2, 3, 4, 4, 6, 63, 65])
+
+    def test_chain(self):
+        manq = self.qclass(1, 2, 3, 4).tap(lambda x: x * 3).map()
+        manq.sync()
+        manq.reverse().sync()
+        self.assertEqual(manq.sum().sync().value(), 30)
+
+    def test_things(self):
+        manq = self.qclass(1, 2, 2).tap(str).map()
+        manq.sync()
+        self.assertEqual(manq.max().sync().value(), '2')
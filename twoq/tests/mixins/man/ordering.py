@@ -27,6 +27,21 @@ class MOrderingQMixin(object):
         )
         self.assertFalse(manq.balanced)
 
+    def test_groupby(self):
+        manq = self.qclass(1, 2, 1, 3, 2, 1).groupby()
+        self.assertFalse(manq.balanced)
+        manq.sync()
+        self.assertTrue(manq.balanced)
+        self.assertEqual(
+            manq.value(), [[1, [1, 1, 1]], [2, [2, 2]], [3, [3]]],
+        )
+        self.assertFalse(manq.balanced)
+        manq = self.qclass('a', 'bb', 'c').tap(len).groupby(
+            lambda x, y: x + 1, 0,
+        )
+        manq.sync()
+        self.assertEqual(manq.value(), [[1, 2], [2, 1]])
+
     def test_grouper(self):
         manq = self.qclass(
             'moe', 'larry', 'curly', 30, 40, 50, True
@@ -40,6 +55,24 @@ class MOrderingQMixin(object):
         )
         self.assertFalse(manq.balanced)
 
+    def test_nlargest(self):
+        manq = self.qclass(4, 6, 65, 3, 63, 2, 4).nlargest(3)
+        self.assertFalse(manq.balanced)
+        manq.sync()
+        self.assertTrue(manq.balanced)
+        self.assertEqual(manq.value(), [65, 63, 6])
+        self.assertFalse(manq.balanced)
+
+    def test_nsmallest(self):
+        manq = self.qclass(4, 6, 65, 3, 63, 2, 4).tap(
+            lambda x: -x
+        ).nsmallest(2)
+        self.assertFalse(manq.balanced)
+        manq.sync()
+        self.assertTrue(manq.balanced)
+        self.assertEqual(manq.value(), [65, 63])
+        self.assertFalse(manq.balanced)
+
     def test_reversed(self):
         manq = self.qclass(5, 4, 3, 2, 1).reverse()
         self.assertTrue(manq.balanced)
@@ -67,6 +100,14 @@ class MOrderingQMixin(object):
         self.assertFalse(manq.balanced)
         self.assertEqual(manq.outcount(), 0)
 
+    def test_sort_budget(self):
+        manq = self.qclass(4, 6, 65, 3, 63, 2, 4).sort(budget=2)
+        self.assertTrue(manq.balanced)
+        manq.sync()
+        self.assertTrue(manq.balanced)
+        self.assertEqual(manq.value(), [2, 3, 4, 4, 6, 63, 65])
+        self.assertFalse(manq.balanced)
+
 
 class MRandomQMixin(object):
 
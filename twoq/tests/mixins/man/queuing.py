@@ -18,6 +18,10 @@ class MQMixin(object):
             self.qclass(1, 2, 3, 4, 5, 6).remove(5).outsync().value(),
             [1, 2, 3, 4, 6],
         )
+        self.assertEquals(
+            self.qclass(6, 5, 2, 4, 5, 1).remove(5).outsync().value(),
+            [6, 2, 4, 5, 1],
+        )
 
     def test_insert(self):
         q = self.qclass(1, 2, 3, 4, 5, 6)
@@ -80,6 +84,7 @@ class MQMixin(object):
 
     def test_index(self):
         self.assertEquals(self.qclass(1, 2, 3, 4, 5, 6).index(3), 2)
+        self.assertEquals(self.qclass(6, 5, 3, 4, 3, 1).index(3), 2)
 
     def test_results(self):
         self.assertEquals(
@@ -89,3 +94,8 @@ class MQMixin(object):
 
     def test_contains(self):
         self.assertTrue(5 in self.qclass(1, 2, 3, 4, 5, 6))
+
+    def test_first_keeps_incoming(self):
+        q = self.qclass(1, 2, 3).first()
+        self.assertEqual(q.value(), 1)
+        self.assertEqual(list(q.incoming), [1, 2, 3])
@@ -16,6 +16,14 @@ class MReducingQMixin(object):
         self.assertEquals(manq.value(), [1, 2, 3, 4])
         self.assertFalse(manq.balanced)
 
+    def test_aggregate(self):
+        manq = self.qclass(1, 2, 1, 3).aggregate('count')
+        self.assertFalse(manq.balanced)
+        manq.sync()
+        self.assertTrue(manq.balanced)
+        self.assertEquals(manq.value(), [[1, 2], [2, 1], [3, 1]])
+        self.assertFalse(manq.balanced)
+
     def test_merge(self):
         manq = self.qclass([4, 5, 6], [1, 2, 3]).merge()
         self.assertFalse(manq.balanced)
@@ -185,6 +193,22 @@ class MMathQMixin(object):
         self.assertEquals(manq.value(), 4.5)
         self.assertFalse(manq.balanced)
 
+    def test_median_approx(self):
+        manq = self.qclass(4, 5, 7, 2, 1).median(approx=True)
+        self.assertFalse(manq.balanced)
+        manq.sync()
+        self.assertTrue(manq.balanced)
+        self.assertEquals(manq.value(), 4)
+        self.assertFalse(manq.balanced)
+
+    def test_mode_approx(self):
+        manq = self.qclass(11, 3, 5, 11, 7, 3, 11).mode(counters=2)
+        self.assertFalse(manq.balanced)
+        manq.sync()
+        self.assertTrue(manq.balanced)
+        self.assertEquals(manq.value(), 11)
+        self.assertFalse(manq.balanced)
+
     def test_fsum(self):
         manq = self.qclass(.1, .1, .1, .1, .1, .1, .1, .1, .1, .1).fsum()
         self.assertFalse(manq.balanced)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+'''benchmark tests'''
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_run(self):
+        from twoq.benchmarks.cases import CASES, QUEUES
+        from twoq.benchmarks.runner import run
+        results = run([10], repeat=1, alloc=False)
+        self.assertEqual(len(results), len(CASES) * len(QUEUES))
+        self.assertTrue('active.autoq:map:10' in results)
+        self.assertTrue('lazy.manq:smash:10' in results)
+
+    def test_filter(self):
+        from twoq.benchmarks.runner import run
+        results = run(
+            [10], queues=['lazy.autoq'], methods=['map', 'sort'], repeat=1,
+        )
+        self.assertEqual(
+            sorted(results), ['lazy.autoq:map:10', 'lazy.autoq:sort:10'],
+        )
+        self.assertTrue(results['lazy.autoq:map:10']['seconds'] >= 0)
+
+    def test_peak_rss(self):
+        from twoq.active.queuing import autoq
+        from twoq.benchmarks.runner import peak_rss, resource, forking
+        if resource is None or forking is None:
+            self.skipTest('resource is not importable or cannot fork')
+        big = peak_rss(
+            autoq, lambda q: q.tap(lambda x: [x] * 10 ** 6).map(), [1, 2, 3],
+        )
+        self.assertTrue(big > 1000)
+        self.assertTrue(peak_rss(autoq, lambda q: q.first(), [1]) < big)
+
+    def test_peak_rss_spawn(self):
+        import multiprocessing
+        from twoq.active.queuing import autoq
+        from twoq.benchmarks import runner
+        if runner.resource is None or runner.forking is None:
+            self.skipTest('resource is not importable or cannot fork')
+        if not hasattr(multiprocessing, 'set_start_method'):
+            self.skipTest('start methods are not selectable')
+        # lambdas cannot be pickled for spawned processes, so this only
+        # passes if peak_rss forks whatever the default start method is
+        default = multiprocessing.get_start_method(True)
+        multiprocessing.set_start_method('spawn', True)
+        try:
+            self.assertTrue(
+                runner.peak_rss(autoq, lambda q: q.first(), [1]) >= 0,
+            )
+        finally:
+            multiprocessing.set_start_method(default, True)
+
+    def test_compare(self):
+        from twoq.benchmarks.runner import compare
+        baseline = {
+            'active.autoq:map:10': dict(items_per_sec=100.0, peak_bytes=100),
+        }
+        self.assertEqual(compare(baseline, {
+            'active.autoq:map:10': dict(items_per_sec=90.0, peak_bytes=110),
+        }), [])
+        self.assertEqual(compare(baseline, {
+            'active.autoq:map:10': dict(items_per_sec=50.0, peak_bytes=200),
+        }), [
+            ('active.autoq:map:10', 'items_per_sec', 100.0, 50.0),
+            ('active.autoq:map:10', 'peak_bytes', 100, 200),
+        ])
+
+    def test_save_load(self):
+        import os
+        import tempfile
+        from twoq.benchmarks.runner import load, run, save
+        results = run([10], methods=['map'], repeat=1, alloc=False)
+        handle, path = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        try:
+            save(results, path)
+            self.assertEqual(load(path), results)
+        finally:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
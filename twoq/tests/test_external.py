@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+'''external sort tests'''
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+
+class TestExternal(unittest.TestCase):
+
+    def setUp(self):
+        from twoq.mixins.ordering import collapse, external, spill
+        self.external = external
+        self.handles = []
+        self.merges = []
+
+        def _spill(things):
+            handle = spill(things)
+            self.handles.append(handle)
+            return handle
+
+        def _collapse(handles):
+            self.merges.append(len(handles))
+            return collapse(handles, _spill=_spill)
+
+        self.spill = _spill
+        self.collapse = _collapse
+
+    def test_budget(self):
+        self.assertRaises(ValueError, self.external, [2, 1], 0)
+        self.assertRaises(ValueError, self.external, [2, 1], 1, fanin=1)
+        self.assertEqual(
+            list(self.external([4, 3, 2, 1], 4, _spill=self.spill)),
+            [1, 2, 3, 4],
+        )
+        self.assertEqual(self.handles, [])
+        self.assertEqual(list(self.external([], 4, _spill=self.spill)), [])
+        self.assertEqual(
+            list(self.external([5, 4, 3, 2, 1], 4, _spill=self.spill)),
+            [1, 2, 3, 4, 5],
+        )
+        self.assertEqual(len(self.handles), 2)
+
+    def test_fanin(self):
+        things = list(range(100, 0, -1))
+        self.assertEqual(
+            list(self.external(
+                things, 3, fanin=4, _spill=self.spill,
+                _collapse=self.collapse,
+            )),
+            sorted(things),
+        )
+        self.assertTrue(self.merges)
+        self.assertTrue(all(merges <= 4 for merges in self.merges))
+        self.assertTrue(all(handle.closed for handle in self.handles))
+
+    def test_key(self):
+        things = [(i % 7, i) for i in range(200)]
+        self.assertEqual(
+            list(self.external(
+                things, 5, lambda x: x[0], fanin=3,
+                _spill=self.spill, _collapse=self.collapse,
+            )),
+            sorted(things, key=lambda x: x[0]),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
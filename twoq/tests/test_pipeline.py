@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+'''pipeline tests'''
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+
+def parse(q):
+    return q.tap(int).map()
+
+
+def even(q):
+    return q.tap(lambda x: x % 2 == 0).filter()
+
+
+def square(q):
+    q.tap(lambda x: x * x).map()
+
+
+def broken(q):
+    return q.tap(lambda x: x / 0).map()
+
+
+def faulty(things):
+    for thing in things:
+        yield thing
+    raise ValueError('bad input')
+
+
+class TestPipeline(unittest.TestCase):
+
+    def setUp(self):
+        from twoq.pipeline import pipeline
+        self.pipeline = pipeline
+
+    def test_stages(self):
+        self.assertEqual(
+            list(self.pipeline(batch=10, maxsize=2).stage(parse).stage(
+                even, workers=3,
+            ).stage(square).results(str(i) for i in range(100))),
+            [i * i for i in range(0, 100, 2)],
+        )
+
+    def test_unordered(self):
+        self.assertEqual(sorted(self.pipeline(
+            batch=3, ordered=False,
+        ).stage(parse, workers=2).results('1234567')), [1, 2, 3, 4, 5, 6, 7])
+
+    def test_counters(self):
+        pipeline = self.pipeline(batch=10).stage(parse).stage(even)
+        list(pipeline.results(range(100)))
+        parsed, evens = pipeline.counters
+        self.assertEqual(parsed['name'], 'parse')
+        self.assertEqual(parsed['batches'], 10)
+        self.assertEqual(parsed['incoming'], 100)
+        self.assertEqual(evens['incoming'], 100)
+        self.assertEqual(evens['outgoing'], 50)
+        self.assertTrue(evens['seconds'] >= 0)
+
+    def test_failure(self):
+        self.assertRaises(
+            RuntimeError, list, self.pipeline().stage(broken).results([1]),
+        )
+
+    def test_workers(self):
+        for _ in range(10):
+            self.assertEqual(sorted(self.pipeline(batch=1).stage(
+                parse, workers=6,
+            ).stage(square, workers=6).results(range(300))), [
+                i * i for i in range(300)
+            ])
+
+    def test_input_failure(self):
+        results = self.pipeline(batch=2).stage(parse).results(faulty('123'))
+        self.assertEqual([next(results), next(results)], [1, 2])
+        self.assertRaises(RuntimeError, list, results)
+
+    def test_empty(self):
+        self.assertRaises(ValueError, list, self.pipeline().results([1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+'''record queue tests'''
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+ROWS = (
+    {'name': 'moe', 'age': 40, 'team': 'b'},
+    {'name': 'larry', 'age': 50, 'team': 'a'},
+    {'name': 'curly', 'age': 40},
+    {'name': 'shemp', 'age': 60, 'team': 'a'},
+)
+
+
+class ARecordQMixin(object):
+
+    def test_pluck(self):
+        self.assertEqual(
+            self.qclass(*ROWS).pluck('team').value(), ['b', 'a', 'a'],
+        )
+        self.assertEqual(
+            self.qclass(*ROWS).pluck('name', 'team').value(),
+            [('moe', 'b'), ('larry', 'a'), ('shemp', 'a')],
+        )
+        self.assertEqual(self.qclass(*ROWS).pluck('nothing').value(), [])
+
+    def test_sort(self):
+        self.assertEqual(
+            self.qclass(*ROWS).field('age').sort().pluck('name').value(),
+            ['moe', 'curly', 'larry', 'shemp'],
+        )
+        self.assertEqual(
+            self.qclass(*ROWS).tap(
+                lambda x: -x['age']
+            ).sort().pluck('name').value(),
+            ['shemp', 'larry', 'moe', 'curly'],
+        )
+
+    def test_group(self):
+        self.assertEqual(
+            self.qclass(*ROWS).field('age').sort().group().value(), [
+                [40, [ROWS[0], ROWS[2]]], [50, [ROWS[1]]], [60, [ROWS[3]]],
+            ],
+        )
+
+    def test_group_many(self):
+        rows = [{'k': i // 2, 'v': i} for i in range(20000)]
+        groups = self.qclass(*rows).field('k').group().value()
+        self.assertEqual(len(groups), 10000)
+        self.assertEqual(groups[-1], [9999, rows[-2:]])
+
+    def test_unique(self):
+        self.assertEqual(
+            self.qclass(*ROWS).field('age').unique().pluck('name').value(),
+            ['moe', 'larry', 'shemp'],
+        )
+        self.assertRaises(
+            KeyError, self.qclass(*ROWS).field('team').unique,
+        )
+
+    def test_map(self):
+        self.assertEqual(
+            self.qclass(*ROWS).tap(lambda x: x['age']).map().sum().value(),
+            190,
+        )
+
+
+class TestRecordQ(unittest.TestCase, ARecordQMixin):
+
+    def setUp(self):
+        from twoq.records import recordq
+        self.qclass = recordq
+
+    def test_storage(self):
+        from collections import deque
+        from twoq.active.storage import RecordTable
+        q = self.qclass(*ROWS).field('age').sort()
+        self.assertTrue(isinstance(q.incoming, RecordTable))
+        self.assertTrue(q.incoming.columnar)
+        q.tap(lambda x: x['name']).map()
+        self.assertTrue(isinstance(q.incoming, deque))
+        self.assertEqual(
+            q.tap(len).sort().value(), ['moe', 'curly', 'larry', 'shemp'],
+        )
+
+    def test_rows(self):
+        row = self.qclass(*ROWS).first().value()
+        self.assertEqual(row, ROWS[0])
+        self.assertFalse(row is ROWS[0])
+
+
+class TestSyncRecordQ(unittest.TestCase, ARecordQMixin):
+
+    def setUp(self):
+        from twoq.records import srecordq
+        self.qclass = srecordq
+
+
+if __name__ == '__main__':
+    unittest.main()